@@ -0,0 +1,117 @@
+"""Registration of kernels, functions, linear functionals and cross-covariances as JAX
+pytrees.
+
+An object is flattened into the floating-point arrays and scalars among its
+attributes, i.e. its hyperparameters, the evaluation points of functionals, and
+precomputed arrays like representer weights, which become the leaves of the pytree.
+All remaining attributes (shapes, flags, integer orders, linear operators, domains,
+...) are static auxiliary data. Hence, methods compiled with `jax.jit` can take `self`
+as an ordinary argument, and the compiled code is reused across all instances with the
+same static structure.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+import jax
+import numpy as np
+
+
+class JaxPyTreeMixin:
+    """Registers every subclass as a JAX pytree."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        jax.tree_util.register_pytree_node(
+            cls,
+            _flatten,
+            functools.partial(_unflatten, cls),
+        )
+
+
+def _flatten(obj: JaxPyTreeMixin) -> tuple[tuple, tuple]:
+    leaves, treedef = jax.tree_util.tree_flatten(obj.__dict__)
+
+    is_dynamic = tuple(_is_dynamic(leaf) for leaf in leaves)
+
+    children = tuple(leaf for leaf, dynamic in zip(leaves, is_dynamic) if dynamic)
+    static_leaves = tuple(
+        _StaticLeaf(leaf) for leaf, dynamic in zip(leaves, is_dynamic) if not dynamic
+    )
+
+    return children, (treedef, is_dynamic, static_leaves)
+
+
+def _unflatten(cls: type, aux_data: tuple, children: tuple) -> JaxPyTreeMixin:
+    treedef, is_dynamic, static_leaves = aux_data
+
+    children = iter(children)
+    static_leaves = iter(static_leaves)
+
+    leaves = [
+        next(children) if dynamic else next(static_leaves).value
+        for dynamic in is_dynamic
+    ]
+
+    # The constructor is bypassed, since it might validate or preprocess the
+    # attributes, which fails for traced values
+    obj = object.__new__(cls)
+    obj.__dict__.update(jax.tree_util.tree_unflatten(treedef, leaves))
+
+    return obj
+
+
+def _is_dynamic(leaf: Any) -> bool:
+    if isinstance(leaf, jax.Array):
+        return True
+
+    if isinstance(leaf, (float, complex, np.floating, np.complexfloating)):
+        return True
+
+    return isinstance(leaf, np.ndarray) and leaf.dtype.kind in "fc"
+
+
+class _StaticLeaf:
+    """Wraps a static leaf, such that it can be part of the (hashable) auxiliary data
+    of a pytree. NumPy arrays are compared by their contents, other unhashable values
+    by identity."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        if isinstance(self.value, np.ndarray):
+            return hash(_array_key(self.value))
+
+        try:
+            return hash(self.value)
+        except TypeError:
+            return id(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, _StaticLeaf):
+            return NotImplemented
+
+        if self.value is other.value:
+            return True
+
+        if isinstance(self.value, np.ndarray) or isinstance(other.value, np.ndarray):
+            return (
+                isinstance(self.value, np.ndarray)
+                and isinstance(other.value, np.ndarray)
+                and _array_key(self.value) == _array_key(other.value)
+            )
+
+        try:
+            return hash(self.value) == hash(other.value) and bool(
+                self.value == other.value
+            )
+        except (TypeError, ValueError):
+            return False
+
+
+def _array_key(value: np.ndarray) -> tuple:
+    return (value.tobytes(), value.shape, value.dtype.str)
@@ -1,6 +1,7 @@
 from . import bases
 from ._affine import Affine
 from ._constant import Constant, Zero
+from ._fourier_features import FourierFeatures
 from ._jax import JaxFunction, JaxLambdaFunction
 from ._jax_arithmetic import JaxScaledFunction, JaxSumFunction
 from ._stack import StackedFunction, stack
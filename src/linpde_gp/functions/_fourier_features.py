@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from jax import numpy as jnp
+import numpy as np
+from probnum.typing import ArrayLike
+
+from . import _jax
+
+
+class FourierFeatures(_jax.JaxFunction):
+    r"""Vector of real Fourier features
+
+    .. math::
+        \phi_i(x) = \operatorname{Re}(c_i \exp(i \langle \omega_i, x \rangle))
+                  = \operatorname{Re}(c_i) \cos(\langle \omega_i, x \rangle)
+                  - \operatorname{Im}(c_i) \sin(\langle \omega_i, x \rangle)
+
+    with frequencies :math:`\omega_i` and complex coefficients :math:`c_i`.
+
+    Since the exponentials are eigenfunctions of all linear differential operators with
+    constant coefficients, such operators only change the coefficients of the features.
+    """
+
+    def __init__(self, frequencies: ArrayLike, coefficients: ArrayLike) -> None:
+        self._frequencies = np.asarray(frequencies, dtype=np.double)
+        self._coefficients = np.asarray(coefficients, dtype=np.complex128)
+
+        if self._frequencies.ndim < 1:
+            raise ValueError("`frequencies` must have at least one axis.")
+
+        if self._coefficients.shape != self._frequencies.shape[:1]:
+            raise ValueError(
+                f"The shape of the `coefficients` {self._coefficients.shape} does not "
+                f"match the number of `frequencies` {self._frequencies.shape[:1]}."
+            )
+
+        super().__init__(
+            input_shape=self._frequencies.shape[1:],
+            output_shape=self._frequencies.shape[:1],
+        )
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return self._frequencies
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    @property
+    def num_features(self) -> int:
+        return self._frequencies.shape[0]
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        batch_shape = x.shape[: x.ndim - self.input_ndim]
+
+        phases = (
+            np.reshape(x, batch_shape + (-1,))
+            @ np.reshape(self._frequencies, (self.num_features, -1)).T
+        )
+
+        return self._coefficients.real * np.cos(
+            phases
+        ) - self._coefficients.imag * np.sin(phases)
+
+    def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
+        batch_shape = x.shape[: x.ndim - self.input_ndim]
+
+        phases = (
+            jnp.reshape(x, batch_shape + (-1,))
+            @ jnp.reshape(self._frequencies, (self.num_features, -1)).T
+        )
+
+        return self._coefficients.real * jnp.cos(
+            phases
+        ) - self._coefficients.imag * jnp.sin(phases)
+
+    def rescale(self, factors: ArrayLike) -> FourierFeatures:
+        """Fourier features with the same frequencies, whose coefficients are
+        multiplied by the (possibly complex) `factors`."""
+        return FourierFeatures(self._frequencies, factors * self._coefficients)
+
+    def __add__(self, other) -> _jax.JaxFunction:
+        if isinstance(other, FourierFeatures) and np.array_equal(
+            self._frequencies, other.frequencies
+        ):
+            return FourierFeatures(
+                self._frequencies, self._coefficients + other.coefficients
+            )
+
+        return super().__add__(other)
+
+    def __rmul__(self, other) -> _jax.JaxFunction:
+        if np.ndim(other) == 0:
+            return self.rescale(other)
+
+        return super().__rmul__(other)
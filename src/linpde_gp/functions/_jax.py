@@ -9,8 +9,10 @@ import numpy as np
 import probnum as pn
 from probnum.typing import ArrayLike, ShapeLike
 
+from .._pytree import JaxPyTreeMixin
 
-class JaxFunction(pn.functions.Function):
+
+class JaxFunction(JaxPyTreeMixin, pn.functions.Function):
     def jax(self, x: ArrayLike) -> jnp.ndarray:
         x = jnp.asarray(x)
 
@@ -1 +1,2 @@
 from ._fem import UnivariateLinearInterpolationBasis
+from ._sine import SineBasis
@@ -107,12 +107,18 @@ class UnivariateLinearInterpolationBasis(pn.functions.Function):
         return self._output_shape[0]
 
     def l2_projection(
-        self, normalized: bool = True
+        self,
+        normalized: bool = True,
+        quadrature_order: int | None = None,
+        sparse_drop_tol: float | None = None,
     ) -> "linpde_gp.linfunctls.projections.l2.L2Projection_UnivariateLinearInterpolationBasis":
         from linpde_gp.linfunctls.projections.l2 import (
             L2Projection_UnivariateLinearInterpolationBasis,
         )
 
         return L2Projection_UnivariateLinearInterpolationBasis(
-            self, normalized=normalized
+            self,
+            normalized=normalized,
+            quadrature_order=quadrature_order,
+            sparse_drop_tol=sparse_drop_tol,
         )
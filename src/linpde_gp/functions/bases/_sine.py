@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from jax import numpy as jnp
+import numpy as np
+from probnum.typing import ArrayLike
+
+from linpde_gp import domains
+from linpde_gp.typing import DomainLike
+
+from .. import _jax
+
+
+class SineBasis(_jax.JaxFunction):
+    r"""Eigenfunctions
+
+    .. math::
+        \phi_j(x) = c_j \prod_{d=1}^D \sin(\omega_{j,d} (x_d - a_d)),
+        \quad \omega_{j,d} = \frac{\pi j_d}{b_d - a_d},
+
+    of the Laplacian with homogeneous Dirichlet boundary conditions on the box
+    :math:`[a_1, b_1] \times \dotsb \times [a_D, b_D]` (or an interval), where
+    :math:`j` ranges over all multi-indices in
+    :math:`\{1, \dotsc, m_1\} \times \dotsb \times \{1, \dotsc, m_D\}` in row-major
+    order.
+
+    The eigenfunctions are orthogonal, but not normalized, i.e. :math:`\lVert \phi_j
+    \rVert_{L^2}^2 = c_j^2 \prod_{d=1}^D \frac{b_d - a_d}{2}`. The optional scaling
+    factors :math:`c_j` default to one. They make the basis closed under the
+    Laplacian, which acts on it as :math:`\Delta \phi_j = -\lVert \omega_j \rVert_2^2
+    \phi_j`.
+    """
+
+    def __init__(
+        self,
+        domain: DomainLike,
+        num_frequencies: int | Sequence[int],
+        coefficients: ArrayLike | None = None,
+    ) -> None:
+        self._domain = domains.asdomain(domain)
+
+        if not isinstance(self._domain, (domains.Interval, domains.Box)):
+            raise TypeError("`domain` must be an `Interval` or a `Box`.")
+
+        bounds = np.asarray(self._domain)
+
+        self._num_frequencies = tuple(
+            int(m) for m in np.broadcast_to(num_frequencies, bounds.shape[:-1] or (1,))
+        )
+
+        if any(m <= 0 for m in self._num_frequencies):
+            raise ValueError(
+                f"`num_frequencies` must be positive ({self._num_frequencies=})."
+            )
+
+        # Multi-indices of the eigenfunctions in row-major order
+        frequency_idcs = (
+            np.indices(self._num_frequencies)
+            .reshape((len(self._num_frequencies), -1))
+            .T
+            + 1
+        )
+
+        if isinstance(self._domain, domains.Interval):
+            frequency_idcs = frequency_idcs[:, 0]
+
+        self._frequency_idcs = frequency_idcs
+        self._frequencies = (np.pi / (bounds[..., 1] - bounds[..., 0])) * frequency_idcs
+
+        size = self._frequencies.shape[0]
+
+        if coefficients is None:
+            coefficients = np.ones(size)
+
+        self._coefficients = np.asarray(coefficients, dtype=np.double)
+
+        if self._coefficients.shape != (size,):
+            raise ValueError(f"`coefficients` must have shape {(size,)}.")
+
+        super().__init__(input_shape=self._domain.shape, output_shape=(size,))
+
+    @property
+    def domain(self) -> domains.Interval | domains.Box:
+        return self._domain
+
+    @property
+    def num_frequencies(self) -> tuple[int, ...]:
+        return self._num_frequencies
+
+    @property
+    def frequency_idcs(self) -> np.ndarray:
+        return self._frequency_idcs
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return self._frequencies
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    @property
+    def laplacian_eigenvalues(self) -> np.ndarray:
+        return -np.sum(
+            self._frequencies**2, axis=tuple(range(1, self._frequencies.ndim))
+        )
+
+    @property
+    def squared_l2_norms(self) -> np.ndarray:
+        bounds = np.asarray(self._domain)
+
+        return self._coefficients**2 * np.prod((bounds[..., 1] - bounds[..., 0]) / 2)
+
+    def __len__(self) -> int:
+        return self._output_shape[0]
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        lower_bounds = np.asarray(self._domain)[..., 0]
+
+        sines = np.sin(
+            self._frequencies
+            * np.expand_dims(x - lower_bounds, axis=-self.input_ndim - 1)
+        )
+
+        return self._coefficients * np.prod(
+            sines, axis=tuple(range(-self.input_ndim, 0))
+        )
+
+    def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
+        lower_bounds = np.asarray(self._domain)[..., 0]
+
+        sines = jnp.sin(
+            self._frequencies
+            * jnp.expand_dims(x - lower_bounds, axis=-self.input_ndim - 1)
+        )
+
+        return self._coefficients * jnp.prod(
+            sines, axis=tuple(range(-self.input_ndim, 0))
+        )
+
+    def rescale(self, factors: ArrayLike) -> SineBasis:
+        """Basis with the same frequencies, whose scaling factors are multiplied by
+        `factors`."""
+        return SineBasis(
+            self._domain,
+            self._num_frequencies,
+            coefficients=factors * self._coefficients,
+        )
+
+    def __add__(self, other) -> _jax.JaxFunction:
+        if (
+            isinstance(other, SineBasis)
+            and other.domain == self._domain
+            and other.num_frequencies == self._num_frequencies
+        ):
+            return SineBasis(
+                self._domain,
+                self._num_frequencies,
+                coefficients=self._coefficients + other.coefficients,
+            )
+
+        return super().__add__(other)
+
+    def __rmul__(self, other) -> _jax.JaxFunction:
+        if np.ndim(other) == 0:
+            return self.rescale(other)
+
+        return super().__rmul__(other)
@@ -77,16 +77,10 @@ def project(
 def project(
     linfuncop: linfuncops.diffops.Laplacian, basis: bases.FourierBasis
 ) -> pn.linops.Matrix:
-    l, r = basis._domain
-
-    idcs = np.arange(1, len(basis) + 1)
-
-    return -pn.linops.Matrix(
+    # The basis functions are orthogonal eigenfunctions of the Laplacian
+    return pn.linops.Matrix(
         scipy.sparse.diags(
-            (
-                (idcs * (np.pi / (4 * (r - l))))
-                * ((2 * np.pi) * idcs + np.sin((2 * np.pi) * idcs))
-            ),
+            basis.sine_basis.laplacian_eigenvalues * basis.sine_basis.squared_l2_norms,
             offsets=0,
             format="csr",
             dtype=np.double,
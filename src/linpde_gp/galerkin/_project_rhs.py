@@ -2,7 +2,7 @@ import numpy as np
 from plum import Dispatcher
 import probnum as pn
 
-from linpde_gp import functions, problems, randprocs
+from linpde_gp import functions, linfunctls, problems, randprocs
 
 from . import bases
 
@@ -51,8 +51,4 @@ def project(f: functions.Constant, basis: bases.FiniteElementBasis) -> np.ndarra
 
 @dispatch
 def project(f: functions.Constant, basis: bases.FourierBasis) -> np.ndarray:
-    l, r = basis._domain
-
-    idcs = np.arange(1, len(basis) + 1)
-
-    return (f.value * (r - l) / np.pi) * (1 - np.cos(np.pi * idcs)) / idcs
+    return f.value * linfunctls.LebesgueIntegral(basis.domain)(basis.sine_basis)
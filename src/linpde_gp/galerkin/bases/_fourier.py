@@ -1,9 +1,10 @@
+from collections.abc import Sequence
 from typing import Callable, Union
 
 import numpy as np
 import probnum as pn
 
-from linpde_gp import domains, randprocs
+from linpde_gp import domains, functions, randprocs
 from linpde_gp.typing import DomainLike
 
 from . import _basis
@@ -13,21 +14,44 @@ class FourierBasis(_basis.Basis):
     def __init__(
         self,
         domain: DomainLike,
-        num_frequencies: int,
+        num_frequencies: int | Sequence[int],
         const: bool = False,
         sin: bool = True,
         cos: bool = False,
     ):
         self._domain = domains.asdomain(domain)
-        self._num_frequencies = num_frequencies
 
         assert not const
         assert sin
         assert not cos
 
-        super().__init__(size=self._num_frequencies)
+        # On a box, the basis consists of products of sines, i.e. the eigenfunctions
+        # of the Dirichlet Laplacian
+        self._sine_basis = functions.bases.SineBasis(self._domain, num_frequencies)
+
+        super().__init__(size=len(self._sine_basis))
+
+    @property
+    def domain(self) -> domains.Interval | domains.Box:
+        return self._domain
+
+    @property
+    def sine_basis(self) -> functions.bases.SineBasis:
+        return self._sine_basis
 
     def __getitem__(self, idx: Union[int, slice, np.ndarray]) -> pn.functions.Function:
+        if isinstance(idx, slice) and idx == slice(None):
+            return self._sine_basis
+
+        if isinstance(self._domain, domains.Box):
+            idx = np.arange(len(self))[idx]
+
+            return pn.functions.LambdaFunction(
+                lambda x: self._sine_basis(x)[..., idx],
+                input_shape=self._domain.shape,
+                output_shape=idx.shape,
+            )
+
         l, r = self._domain
 
         if isinstance(idx, slice):
@@ -52,7 +76,7 @@ class FourierBasis(_basis.Basis):
         if isinstance(coords, np.ndarray):
             return pn.functions.LambdaFunction(
                 lambda x: self[:](x) @ coords,
-                input_shape=(),
+                input_shape=self._domain.shape,
                 output_shape=(),
             )
 
@@ -2,6 +2,7 @@ from ._helpers import (
     euclidean_inprod,
     euclidean_norm,
     gram_schmidt,
+    lazy_pivoted_cholesky,
     modified_gram_schmidt,
     pairwise_inprods,
     pivoted_cholesky,
@@ -155,22 +155,53 @@ def pivoted_cholesky(A: np.ndarray, k: int) -> np.ndarray:
     """
     TODO:
     - Handle different memory layouts
-    - Implement for linear operators
-    - auto-terminate based on error estimate
     """
     N, _ = A.shape
 
     assert 1 <= k <= N
 
-    L = np.zeros((N, k), dtype=A.dtype, order="F")
+    return lazy_pivoted_cholesky(
+        diagonal=np.diag(A),
+        column=lambda i: A[:, i],
+        max_rank=k,
+    )
+
+
+def lazy_pivoted_cholesky(
+    diagonal: np.ndarray,
+    column: Callable[[int], np.ndarray],
+    max_rank: Optional[int] = None,
+    atol: float = 0.0,
+    rtol: float = 0.0,
+) -> np.ndarray:
+    r"""Pivoted Cholesky decomposition :math:`A \approx L L^T` of a symmetric positive
+    semi-definite matrix, which is only accessed through its diagonal and a function
+    returning its `i`-th column.
+
+    The decomposition terminates as soon as the trace of the error :math:`A - L L^T`
+    falls below `max(atol, rtol * trace(A))` or `max_rank` columns were computed."""
+    (N,) = diagonal.shape
+
+    max_rank = N if max_rank is None else min(max_rank, N)
+
+    L = np.zeros((N, max_rank), dtype=diagonal.dtype, order="F")
 
     perm = np.arange(N)
-    perm_diag = np.diag(A).copy()
+    perm_diag = diagonal.copy()
+
+    tol = max(atol, rtol * np.sum(diagonal))
+
+    for m in range(max_rank):
+        # The trace of the error is the trace of the remaining Schur complement
+        if np.sum(perm_diag[m:]) <= tol:
+            return L[:, :m]
 
-    for m in range(k):
         # Pivotization
         i = np.argmax(perm_diag[m:]) + m
 
+        if perm_diag[i] <= 0.0:
+            return L[:, :m]
+
         perm[m], perm[i] = perm[i], perm[m]
         perm_diag[m], perm_diag[i] = perm_diag[i], perm_diag[m]
 
@@ -179,7 +210,7 @@ def pivoted_cholesky(A: np.ndarray, k: int) -> np.ndarray:
 
         buf[0] = np.sqrt(perm_diag[m])  # Pivot
 
-        buf[1:] = A[perm[(m + 1) :], perm[m]]
+        buf[1:] = column(perm[m])[perm[(m + 1) :]]
         buf[1:] -= L[perm[(m + 1) :], :m] @ L[perm[m], :m]
         buf[1:] /= buf[0]
 
@@ -1,5 +1,13 @@
-from . import belief_updates, beliefs, observation_ops, policies, stopping_criteria
+from . import (
+    belief_updates,
+    beliefs,
+    observation_ops,
+    policies,
+    preconditioners,
+    stopping_criteria,
+)
 from ._bayescg import BayesCG, bayescg
 from ._cg import ConjugateGradients
+from ._lowrank_cg import LowRankCG
 from ._probabilistic_linear_solver import ProbabilisticLinearSolver
 from ._problinsolve import problinsolve
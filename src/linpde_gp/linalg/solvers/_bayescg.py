@@ -1,4 +1,4 @@
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Optional, Union
 
 import numpy as np
 import probnum as pn
@@ -9,6 +9,7 @@ from . import (
     beliefs,
     observation_ops,
     policies,
+    preconditioners,
     stopping_criteria,
 )
 from .. import _helpers as _linalg_helpers
@@ -20,11 +21,24 @@ class BayesCG(_probabilistic_linear_solver.ProbabilisticLinearSolver):
         prior: beliefs.BayesCGBelief,
         stopping_criteria: Iterable[stopping_criteria.StoppingCriterion],
         reorthogonalization_fn: Optional[Callable[..., None]] = None,
+        preconditioner: Optional[
+            Union[pn.linops.LinearOperator, preconditioners.Preconditioner]
+        ] = None,
     ) -> None:
         super().__init__(
             prior,
-            policy=policies.CGPolicy(reorthogonalization_fn=reorthogonalization_fn),
-            observation_op=observation_ops.ResidualNormSquared(),
+            policy=policies.CGPolicy(
+                reorthogonalization_fn=reorthogonalization_fn,
+                preconditioner=preconditioner,
+            ),
+            # For preconditioned search directions s_i = P^{-1} r_i + beta s_{i-1}, the
+            # projected residual is s_i^T r_i = r_i^T P^{-1} r_i instead of
+            # ||r_i||_2^2
+            observation_op=(
+                observation_ops.ResidualNormSquared()
+                if preconditioner is None
+                else observation_ops.ResidualMatVec()
+            ),
             belief_update=belief_updates.BayesCGBeliefUpdate(),
             stopping_criteria=tuple(stopping_criteria),
         )
@@ -38,6 +52,9 @@ def bayescg(
     atol=1e-5,
     rtol=1e-5,
     reorthogonalize: bool = False,
+    preconditioner: Optional[
+        Union[pn.linops.LinearOperator, preconditioners.Preconditioner]
+    ] = None,
     callback: Optional[Callable[..., None]] = None,
 ) -> pn.randvars.Normal:
     # Construct the problem to be solved
@@ -77,7 +94,10 @@ def bayescg(
 
     # Construct the solver
     solver = BayesCG(
-        prior, stopping_criteria_, reorthogonalization_fn=reorthogonalization_fn
+        prior,
+        stopping_criteria_,
+        reorthogonalization_fn=reorthogonalization_fn,
+        preconditioner=preconditioner,
     )
 
     # Run the algorithm
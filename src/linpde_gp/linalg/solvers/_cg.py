@@ -1,9 +1,21 @@
+from typing import Optional, Union
+
 import probnum as pn
 import scipy.sparse
 import scipy.sparse.linalg
 
+from . import preconditioners
+
 
 class ConjugateGradients:
+    def __init__(
+        self,
+        preconditioner: Optional[
+            Union[pn.linops.LinearOperator, preconditioners.Preconditioner]
+        ] = None,
+    ) -> None:
+        self._preconditioner = preconditioner
+
     def solve(self, linear_system: pn.problems.LinearSystem, **cg_kwargs):
         if isinstance(linear_system.A, pn.linops.LinearOperator):
             A = scipy.sparse.linalg.LinearOperator(
@@ -14,6 +26,18 @@ class ConjugateGradients:
         else:
             A = linear_system.A
 
+        if self._preconditioner is not None and "M" not in cg_kwargs:
+            precond_inv = self._preconditioner
+
+            if not isinstance(precond_inv, pn.linops.LinearOperator):
+                precond_inv = precond_inv(linear_system)
+
+            cg_kwargs["M"] = scipy.sparse.linalg.LinearOperator(
+                shape=precond_inv.shape,
+                dtype=precond_inv.dtype,
+                matvec=lambda vec: precond_inv @ vec,
+            )
+
         (x, _) = scipy.sparse.linalg.cg(
             A,
             linear_system.b,
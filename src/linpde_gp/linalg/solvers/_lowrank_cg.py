@@ -0,0 +1,41 @@
+from typing import Callable, Iterable, Optional, Union
+
+import probnum as pn
+
+from . import (
+    _probabilistic_linear_solver,
+    belief_updates,
+    beliefs,
+    observation_ops,
+    policies,
+    preconditioners,
+    stopping_criteria,
+)
+
+
+class LowRankCG(_probabilistic_linear_solver.ProbabilisticLinearSolver):
+    """Conjugate gradients, which additionally maintains a low-rank approximation
+    of the inverse of the system matrix spanned by the (:math:`A`-conjugate)
+    search directions.
+
+    This is equivalent to BayesCG under the prior :math:`\\Sigma_0 = A^{-1}`, but
+    only needs matrix-vector products with :math:`A`."""
+
+    def __init__(
+        self,
+        stopping_criteria: Iterable[stopping_criteria.StoppingCriterion],
+        reorthogonalization_fn: Optional[Callable[..., None]] = None,
+        preconditioner: Optional[
+            Union[pn.linops.LinearOperator, preconditioners.Preconditioner]
+        ] = None,
+    ) -> None:
+        super().__init__(
+            prior=beliefs.LowRankInverseBelief.from_linear_system,
+            policy=policies.CGPolicy(
+                reorthogonalization_fn=reorthogonalization_fn,
+                preconditioner=preconditioner,
+            ),
+            observation_op=observation_ops.ResidualMatVec(),
+            belief_update=belief_updates.ProjectedResidualBeliefUpdate(),
+            stopping_criteria=tuple(stopping_criteria),
+        )
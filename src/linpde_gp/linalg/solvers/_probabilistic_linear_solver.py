@@ -1,4 +1,4 @@
-from typing import Iterable, Iterator, Optional, Tuple
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import numpy as np
 import probnum as pn
@@ -9,7 +9,10 @@ from . import belief_updates, beliefs, observation_ops, policies, stopping_crite
 class ProbabilisticLinearSolver:
     def __init__(
         self,
-        prior: beliefs.LinearSystemBelief,
+        prior: Union[
+            beliefs.LinearSystemBelief,
+            Callable[[pn.problems.LinearSystem], beliefs.LinearSystemBelief],
+        ],
         policy: policies.Policy,
         observation_op: observation_ops.ObservationOp,
         belief_update: belief_updates.LinearSolverBeliefUpdate,
@@ -32,7 +35,12 @@ class ProbabilisticLinearSolver:
     def solve_iter(
         self, problem: pn.problems.LinearSystem
     ) -> Iterator[Tuple[pn.randvars.Normal, "ProbabilisticLinearSolver.State", bool]]:
-        solver_state = ProbabilisticLinearSolver.State(problem, self._prior)
+        prior = self._prior
+
+        if not isinstance(prior, beliefs.LinearSystemBelief):
+            prior = prior(problem)
+
+        solver_state = ProbabilisticLinearSolver.State(problem, prior)
 
         while True:
             stop = any(
@@ -69,3 +69,36 @@ class BayesCGBeliefUpdate(LinearSolverBeliefUpdate):
             cov_scale=belief.cov_scale + alpha,
             num_steps=belief.num_steps + 1,
         )
+
+
+class ProjectedResidualBeliefUpdate(LinearSolverBeliefUpdate):
+    """Extends the low-rank approximation :math:`C_{i-1} = U U^T` of the inverse by
+    the component :math:`d_i = (I - C_{i-1} A) s_i` of the action, which is
+    :math:`A`-conjugate to all previous actions. Only needs a single matrix-vector
+    product with :math:`A` per iteration."""
+
+    def __call__(
+        self,
+        problem: pn.problems.LinearSystem,
+        belief: beliefs.LowRankInverseBelief,
+        action: np.ndarray,
+        observation: np.floating,
+        solver_state: "linpde_gp.solvers.ProbabilisticLinearSolver.State",
+    ) -> beliefs.LowRankInverseBelief:
+        U = belief.inverse_approx_factor
+
+        matvec = problem.A @ action
+        stepdir = action - U @ (U.T @ matvec)
+
+        E_sq = np.inner(matvec, stepdir)
+
+        if E_sq <= 0.0:
+            # The action lies (numerically) in the span of the previous actions
+            return belief
+
+        stepdir /= np.sqrt(E_sq)
+
+        return beliefs.LowRankInverseBelief(
+            mean=belief.mean + stepdir * np.inner(stepdir, solver_state.residual),
+            inverse_approx_factor=np.hstack((U, stepdir[:, None])),
+        )
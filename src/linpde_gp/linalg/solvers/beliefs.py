@@ -5,6 +5,8 @@ from typing import Optional, Union
 import numpy as np
 import probnum as pn
 
+from ... import linops
+
 
 class LinearSystemBelief(abc.ABC):
     @property
@@ -95,3 +97,50 @@ class BayesCGBelief(LinearSystemBelief):
             mean=mean,
             cov_unscaled=pn.linops.aslinop(problem.A).inv(),
         )
+
+
+class LowRankInverseBelief(LinearSystemBelief):
+    """Belief over the solution of a symmetric positive definite linear system
+    :math:`A x = b`, which is given by :math:`x = C b`, where the low-rank matrix
+    :math:`C := U U^T` approximates :math:`A^{-1}`."""
+
+    def __init__(
+        self,
+        mean: np.ndarray,
+        inverse_approx_factor: np.ndarray,
+    ) -> None:
+        self.mean = mean
+        self.inverse_approx_factor = inverse_approx_factor
+
+    @property
+    def rank(self) -> int:
+        return self.inverse_approx_factor.shape[1]
+
+    @functools.cached_property
+    def inverse_approx(self) -> pn.linops.LinearOperator:
+        return linops.LowRankMatrix(self.inverse_approx_factor)
+
+    @functools.cached_property
+    def x(self) -> pn.randvars.Constant:
+        return pn.randvars.Constant(support=self.mean)
+
+    @classmethod
+    def from_linear_system(
+        cls,
+        problem: pn.problems.LinearSystem,
+        mean: Optional[Union[np.ndarray, pn.randvars.Constant]] = None,
+    ) -> "LowRankInverseBelief":
+        dtype = np.result_type(problem.A.dtype, problem.b.dtype)
+
+        if mean is None:
+            mean = np.zeros_like(problem.b, dtype=dtype)
+        else:
+            if isinstance(mean, pn.randvars.Constant):
+                mean = mean.support
+
+            mean = mean.astype(dtype, copy=True)
+
+        return cls(
+            mean=mean,
+            inverse_approx_factor=np.zeros((problem.A.shape[0], 0), dtype=dtype),
+        )
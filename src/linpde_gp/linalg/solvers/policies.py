@@ -1,11 +1,13 @@
 import abc
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Optional, Union
 
 import numpy as np
 import probnum as pn
 
 import linpde_gp
 
+from . import preconditioners
+
 
 class Policy(abc.ABC):
     @abc.abstractmethod
@@ -26,8 +28,31 @@ class CGPolicy(Policy):
                 [np.ndarray, Iterable[np.ndarray], pn.linops.LinearOperator], np.ndarray
             ]
         ] = None,
+        preconditioner: Optional[
+            Union[pn.linops.LinearOperator, preconditioners.Preconditioner]
+        ] = None,
     ) -> None:
         self._reorthogonalization_fn = reorthogonalization_fn
+        self._preconditioner = preconditioner
+
+        self._precond_inv_cache = (None, None)
+
+    def precond_inv(
+        self, problem: pn.problems.LinearSystem
+    ) -> Optional[pn.linops.LinearOperator]:
+        if self._preconditioner is None or isinstance(
+            self._preconditioner, pn.linops.LinearOperator
+        ):
+            return self._preconditioner
+
+        cached_problem, precond_inv = self._precond_inv_cache
+
+        if cached_problem is not problem:
+            precond_inv = self._preconditioner(problem)
+
+            self._precond_inv_cache = (problem, precond_inv)
+
+        return precond_inv
 
     def __call__(
         self,
@@ -35,14 +60,25 @@ class CGPolicy(Policy):
         belief: pn.randvars.Normal,
         solver_state: "linpde_gp.solvers.ProbabilisticLinearSolver.State",
     ) -> np.ndarray:
-        action = solver_state.residual.copy()
+        precond_inv = self.precond_inv(problem)
+
+        if precond_inv is None:
+            action = solver_state.residual.copy()
+        else:
+            action = precond_inv @ solver_state.residual
 
         if solver_state.iteration > 0:
             # Orthogonalization
-            beta = (
-                solver_state.residual_norm_squared
-                / solver_state.prev_residual_norm_squared
-            )
+            if precond_inv is None:
+                beta = (
+                    solver_state.residual_norm_squared
+                    / solver_state.prev_residual_norm_squared
+                )
+            else:
+                beta = np.inner(solver_state.residual, action) / np.inner(
+                    solver_state.prev_residual,
+                    precond_inv @ solver_state.prev_residual,
+                )
 
             action += beta * solver_state.prev_action
 
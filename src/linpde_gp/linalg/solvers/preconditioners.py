@@ -0,0 +1,95 @@
+import abc
+from typing import Optional, Union
+
+import numpy as np
+import probnum as pn
+
+from ... import linops
+from .. import _helpers as _linalg_helpers
+
+
+class Preconditioner(abc.ABC):
+    """Constructs a linear operator :math:`P^{-1}`, which approximates the inverse of
+    the system matrix of a given linear system."""
+
+    @abc.abstractmethod
+    def __call__(self, problem: pn.problems.LinearSystem) -> pn.linops.LinearOperator:
+        pass
+
+
+class PivotedCholeskyPreconditioner(Preconditioner):
+    r"""Preconditioner :math:`P = L L^T + \sigma^2 I`, where :math:`L` is a (lazily
+    evaluated) pivoted Cholesky factor of :math:`A - \sigma^2 I`. The inverse of
+    :math:`P` is applied by means of the Woodbury matrix identity.
+
+    The system matrix is only accessed through its diagonal and its columns. If it
+    provides `diagonal()` and `column(i)` methods, these are used instead of dense
+    indexing or matrix-vector products with unit vectors.
+
+    If `shift` is `None`, :math:`\sigma^2` is set to the mean of the diagonal of the
+    approximation error :math:`A - L L^T`."""
+
+    def __init__(
+        self,
+        max_rank: int,
+        shift: Optional[float] = None,
+        atol: float = 0.0,
+        rtol: float = 1e-2,
+    ) -> None:
+        self._max_rank = int(max_rank)
+        self._shift = shift
+        self._atol = float(atol)
+        self._rtol = float(rtol)
+
+    def __call__(self, problem: pn.problems.LinearSystem) -> pn.linops.LinearOperator:
+        A = problem.A
+        N = A.shape[0]
+
+        shift = 0.0 if self._shift is None else self._shift
+
+        diagonal = _diagonal(A) - shift
+
+        def column(i: int) -> np.ndarray:
+            col = np.array(_column(A, i), dtype=np.double, copy=True)
+            col[i] -= shift
+
+            return col
+
+        L = _linalg_helpers.lazy_pivoted_cholesky(
+            diagonal,
+            column,
+            max_rank=self._max_rank,
+            atol=self._atol,
+            rtol=self._rtol,
+        )
+
+        if self._shift is None:
+            shift = max(
+                np.sum(diagonal - np.sum(L**2, axis=-1)) / N,
+                np.finfo(L.dtype).eps * np.max(diagonal),
+            )
+
+        return linops.LowRankUpdate(pn.linops.Scaling(shift, shape=(N, N)), L).inv()
+
+
+def _diagonal(A: Union[np.ndarray, pn.linops.LinearOperator]) -> np.ndarray:
+    if isinstance(A, np.ndarray):
+        return np.diag(A).astype(np.double, copy=True)
+
+    if hasattr(A, "diagonal"):
+        return np.asarray(A.diagonal(), dtype=np.double)
+
+    return np.diag(A.todense()).astype(np.double, copy=True)
+
+
+def _column(A: Union[np.ndarray, pn.linops.LinearOperator], i: int) -> np.ndarray:
+    if isinstance(A, np.ndarray):
+        return A[:, i]
+
+    if hasattr(A, "column"):
+        return A.column(i)
+
+    e_i = np.zeros(A.shape[1], dtype=A.dtype)
+    e_i[i] = 1.0
+
+    return A @ e_i
@@ -32,6 +32,9 @@ class ScaledLinearFunctionOperator(LinearFunctionOperator):
     def scalar(self) -> ScalarType:
         return self._scalar
 
+    def _parameters(self) -> tuple:
+        return (self._linfuncop, float(self._scalar))
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return self._scalar * self._linfuncop(f, **kwargs)
@@ -84,6 +87,9 @@ class SumLinearFunctionOperator(LinearFunctionOperator):
             output_shapes=(output_domain_shape, output_codomain_shape),
         )
 
+    def _parameters(self) -> tuple:
+        return self._summands
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return functools.reduce(
@@ -109,6 +115,9 @@ class CompositeLinearFunctionOperator(LinearFunctionOperator):
             output_shapes=self._linfuncops[0].output_shapes,
         )
 
+    def _parameters(self) -> tuple:
+        return self._linfuncops
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return functools.reduce(
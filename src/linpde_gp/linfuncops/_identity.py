@@ -18,6 +18,9 @@ class Identity(_linfuncop.LinearFunctionOperator):
             output_shapes=(domain_shape, codomain_shape),
         )
 
+    def _parameters(self) -> tuple:
+        return ()
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         super().__call__(f, **kwargs)
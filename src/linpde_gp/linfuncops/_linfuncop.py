@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
 import functools
 from typing import TYPE_CHECKING, Type
 
@@ -69,6 +70,37 @@ class LinearFunctionOperator:
     def output_codomain_ndim(self) -> ShapeType:
         return len(self._output_codomain_shape)
 
+    def _parameters(self) -> Hashable | None:
+        """Parameters defining the operator in addition to its type and shapes.
+
+        Operators with equal parameters compare equal and have the same hash, such that
+        e.g. results cached per operator are shared between equal instances. If `None`,
+        operators are compared by identity."""
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if (
+            type(self) is not type(other)  # pylint: disable=unidiomatic-typecheck
+            or self.input_shapes != other.input_shapes
+            or self.output_shapes != other.output_shapes
+        ):
+            return False
+
+        parameters = self._parameters()
+
+        return parameters is not None and parameters == other._parameters()
+
+    def __hash__(self) -> int:
+        parameters = self._parameters()
+
+        if parameters is None:
+            return object.__hash__(self)
+
+        return hash((type(self), self.input_shapes, self.output_shapes, parameters))
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         raise NotImplementedError()
@@ -31,6 +31,9 @@ class ScaledLinearDifferentialOperator(LinearDifferentialOperator):
     def scalar(self) -> ScalarType:
         return self._scalar
 
+    def _parameters(self) -> tuple:
+        return (self._lindiffop, float(self._scalar))
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return self._scalar * self._lindiffop(f, **kwargs)
@@ -19,6 +19,9 @@ class DirectionalDerivative(LinearDifferentialOperator):
     def direction(self) -> np.ndarray:
         return self._direction
 
+    def _parameters(self) -> tuple:
+        return (self._direction.tobytes(), self._direction.dtype.str)
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return super().__call__(f, **kwargs)
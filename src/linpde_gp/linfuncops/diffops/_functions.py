@@ -1,3 +1,5 @@
+import numpy as np
+
 from linpde_gp import functions
 
 from ._directional_derivative import DirectionalDerivative
@@ -15,3 +17,48 @@ def _(self, f: functions.Constant, /) -> functions.Zero:
         input_shape=self.output_domain_shape,
         output_shape=self.output_codomain_shape,
     )
+
+
+@Laplacian.__call__.register  # pylint: disable=no-member
+def _(self, f: functions.FourierFeatures, /) -> functions.FourierFeatures:
+    assert f.input_shape == self.input_domain_shape
+
+    # Δ exp(i <ω, x>) = -‖ω‖² exp(i <ω, x>)
+    return f.rescale(
+        -np.sum(f.frequencies**2, axis=tuple(range(1, f.frequencies.ndim)))
+    )
+
+
+@SpatialLaplacian.__call__.register  # pylint: disable=no-member
+def _(self, f: functions.FourierFeatures, /) -> functions.FourierFeatures:
+    assert f.input_shape == self.input_domain_shape
+
+    return f.rescale(-np.sum(f.frequencies[:, 1:] ** 2, axis=-1))
+
+
+@DirectionalDerivative.__call__.register  # pylint: disable=no-member
+def _(self, f: functions.FourierFeatures, /) -> functions.FourierFeatures:
+    assert f.input_shape == self.input_domain_shape
+
+    # D_v exp(i <ω, x>) = i <ω, v> exp(i <ω, x>)
+    return f.rescale(
+        1j
+        * np.sum(
+            f.frequencies * self.direction,
+            axis=tuple(range(1, f.frequencies.ndim)),
+        )
+    )
+
+
+@Laplacian.__call__.register  # pylint: disable=no-member
+def _(self, f: functions.bases.SineBasis, /) -> functions.bases.SineBasis:
+    assert f.input_shape == self.input_domain_shape
+
+    return f.rescale(f.laplacian_eigenvalues)
+
+
+@SpatialLaplacian.__call__.register  # pylint: disable=no-member
+def _(self, f: functions.bases.SineBasis, /) -> functions.bases.SineBasis:
+    assert f.input_shape == self.input_domain_shape
+
+    return f.rescale(-np.sum(f.frequencies[:, 1:] ** 2, axis=-1))
@@ -21,6 +21,9 @@ class Laplacian(LinearDifferentialOperator):
     def __init__(self, domain_shape: ShapeLike) -> None:
         super().__init__(input_shapes=(domain_shape, ()))
 
+    def _parameters(self) -> tuple:
+        return ()
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return super().__call__(f, **kwargs)
@@ -64,6 +67,9 @@ class SpatialLaplacian(LinearDifferentialOperator):
 
         super().__init__(input_shapes=((self._D,), ()))
 
+    def _parameters(self) -> tuple:
+        return ()
+
     @functools.singledispatchmethod
     def __call__(self, f, /, **kwargs):
         return super().__call__(f, **kwargs)
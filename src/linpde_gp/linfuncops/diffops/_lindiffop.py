@@ -86,5 +86,8 @@ class LambdaLinearDifferentialOperator(LinearDifferentialOperator):
 
         self._jax_diffop_fn = jax_diffop_fn
 
+    def _parameters(self) -> tuple:
+        return (self._jax_diffop_fn,)
+
     def _jax_fallback(self, f: Callable, /, **kwargs) -> Callable:
         return self._jax_diffop_fn(f, **kwargs)
@@ -4,6 +4,8 @@ import numpy as np
 import probnum as pn
 from probnum.typing import ArrayLike, ShapeLike, ShapeType
 
+from linpde_gp import functions
+
 from . import _linfunctl
 
 
@@ -43,3 +45,16 @@ class DiracFunctional(_linfunctl.LinearFunctional):
     @__call__.register
     def _(self, f: pn.functions.Function, /) -> np.ndarray:
         return f(self._X)
+
+    @__call__.register
+    def _(self, f: functions.bases.SineBasis, /) -> np.ndarray:
+        bounds = np.asarray(f.domain)
+
+        # The eigenfunctions vanish on the boundary, which the evaluation only
+        # reproduces up to rounding errors
+        on_boundary = (self._X == bounds[..., 0]) | (self._X == bounds[..., 1])
+
+        if f.input_ndim > 0:
+            on_boundary = np.any(on_boundary, axis=-1)
+
+        return np.where(on_boundary[..., None], 0.0, f(self._X))
@@ -60,3 +60,39 @@ class LebesgueIntegral(_linfunctl.LinearFunctional):
     @__call__.register
     def _(self, f: functions.Constant, /) -> np.ndarray:
         return f.value * self._domain.volume
+
+    @__call__.register
+    def _(self, f: functions.FourierFeatures, /) -> np.ndarray:
+        bounds = np.asarray(self._domain)
+        a, b = bounds[..., 0], bounds[..., 1]
+
+        # ∫_a^b exp(i ω x) dx = exp(i ω (a + b) / 2) (b - a) sinc(ω (b - a) / 2)
+        integrals = (
+            np.exp(0.5j * f.frequencies * (a + b))
+            * (b - a)
+            * np.sinc(f.frequencies * (b - a) / (2 * np.pi))
+        )
+
+        return np.real(
+            f.coefficients
+            * np.prod(
+                np.reshape(integrals, (f.num_features, -1)),
+                axis=-1,
+            )
+        )
+
+    @__call__.register
+    def _(self, f: functions.bases.SineBasis, /) -> np.ndarray:
+        bounds = np.asarray(self._domain)
+        lower_bounds = np.asarray(f.domain)[..., 0]
+
+        # ∫_p^q sin(ω (x - a)) dx = (cos(ω (p - a)) - cos(ω (q - a))) / ω
+        integrals = (
+            np.cos(f.frequencies * (bounds[..., 0] - lower_bounds))
+            - np.cos(f.frequencies * (bounds[..., 1] - lower_bounds))
+        ) / f.frequencies
+
+        return f.coefficients * np.prod(
+            np.reshape(integrals, (len(f), -1)),
+            axis=-1,
+        )
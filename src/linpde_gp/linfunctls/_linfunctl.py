@@ -10,8 +10,10 @@ from probnum.typing import ShapeLike, ShapeType
 
 from linpde_gp import functions, linfuncops
 
+from .._pytree import JaxPyTreeMixin
 
-class LinearFunctional:
+
+class LinearFunctional(JaxPyTreeMixin):
     def __init__(
         self,
         input_shapes: tuple[ShapeLike, ShapeLike],
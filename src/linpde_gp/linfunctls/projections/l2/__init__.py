@@ -1 +1,2 @@
 from ._fem import L2Projection_UnivariateLinearInterpolationBasis
+from ._quadrature import HatFunctionQuadrature
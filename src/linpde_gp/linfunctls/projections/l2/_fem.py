@@ -2,13 +2,13 @@ import functools
 
 import numpy as np
 import probnum as pn
-import scipy.integrate
 import scipy.linalg
 import scipy.sparse
 
 from linpde_gp import functions
 
 from ... import _linfunctl
+from ._quadrature import HatFunctionQuadrature
 
 
 class L2Projection_UnivariateLinearInterpolationBasis(_linfunctl.LinearFunctional):
@@ -17,9 +17,19 @@ class L2Projection_UnivariateLinearInterpolationBasis(_linfunctl.LinearFunctiona
         basis: functions.bases.UnivariateLinearInterpolationBasis,
         *,
         normalized: bool = True,
+        quadrature_order: int | None = None,
+        sparse_drop_tol: float | None = None,
     ) -> None:
         self._basis = basis
         self._normalized = bool(normalized)
+        self._quadrature_order = quadrature_order
+
+        if sparse_drop_tol is not None and not sparse_drop_tol >= 0.0:
+            raise ValueError(
+                f"`sparse_drop_tol` must be nonnegative ({sparse_drop_tol=})."
+            )
+
+        self._sparse_drop_tol = sparse_drop_tol
 
         super().__init__(
             input_shapes=((), ()),
@@ -30,6 +40,24 @@ class L2Projection_UnivariateLinearInterpolationBasis(_linfunctl.LinearFunctiona
     def basis(self) -> functions.bases.UnivariateLinearInterpolationBasis:
         return self._basis
 
+    @property
+    def normalized(self) -> bool:
+        return self._normalized
+
+    @property
+    def sparse_drop_tol(self) -> float | None:
+        """If not `None`, covariance matrices of the projections (e.g. Gram matrices)
+        are returned as sparse linear operators, where all entries whose magnitude is at
+        most `sparse_drop_tol` times the largest magnitude are dropped. Since the basis
+        functions are compactly supported, these matrices are effectively banded for
+        compactly supported or rapidly decaying kernels."""
+        return self._sparse_drop_tol
+
+    @functools.cached_property
+    def quadrature(self) -> HatFunctionQuadrature:
+        """Quadrature rule for projections without a closed form."""
+        return HatFunctionQuadrature(self._basis, order=self._quadrature_order)
+
     @functools.cached_property
     def normalizer(self) -> pn.linops.LinearOperator:
         if not self._normalized:
@@ -59,15 +87,7 @@ class L2Projection_UnivariateLinearInterpolationBasis(_linfunctl.LinearFunctiona
 
     @__call__.register(pn.functions.Function)
     def _(self, f: pn.functions.Function, /) -> np.ndarray:
-        res = np.array(
-            [
-                scipy.integrate.quad(
-                    lambda x: self._basis.eval_elem(idx, x) * f(x),
-                    *self._basis.support_bounds(idx),
-                )[0]
-                for idx in range(len(self._basis))
-            ]
-        )
+        res = self.quadrature.integrate(f(self.quadrature.nodes))
 
         return self.normalizer(res, axis=-1)
 
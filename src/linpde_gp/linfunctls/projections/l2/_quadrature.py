@@ -0,0 +1,191 @@
+r"""Piecewise Gauss-Legendre quadrature for integrals against hat functions.
+
+The support of every hat function of a
+:class:`~linpde_gp.functions.bases.UnivariateLinearInterpolationBasis` is the union of
+two cells of the grid, on each of which the hat function is linear. Hence, all
+integrals :math:`\int \phi_i(t) f(t) \, dt` are obtained from a single evaluation of
+:math:`f` at the Gauss-Legendre nodes of all cells, followed by a weighted sum over the
+nodes. This is vectorized over the basis functions and the (batched) arguments of
+:math:`f`, both in NumPy and in JAX.
+
+Kernels :math:`k(x, t)` are typically not smooth at :math:`t = x`, which would spoil
+the convergence of the quadrature rule on the cell containing :math:`x`. This cell is
+hence split at :math:`x` and integrated with one rule per part.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import ModuleType
+
+import numpy as np
+
+from linpde_gp import functions
+
+# Number of Gauss-Legendre nodes per cell
+DEFAULT_ORDER = 8
+
+# Maximum number of kernel evaluations per block of the double integrals
+_BLOCK_SIZE = 2**20
+
+
+class HatFunctionQuadrature:
+    def __init__(
+        self,
+        basis: functions.bases.UnivariateLinearInterpolationBasis,
+        order: int | None = None,
+    ) -> None:
+        self._basis = basis
+        self._order = DEFAULT_ORDER if order is None else int(order)
+
+        if self._order < 1:
+            raise ValueError(f"`order` must be positive ({order=}).")
+
+        self._gl_nodes, self._gl_weights = np.polynomial.legendre.leggauss(self._order)
+
+        self._cells_lower = basis.grid[:-1]
+        self._cells_upper = basis.grid[1:]
+
+        # Without the zero boundary, the outermost cells only cover the sentinel grid
+        # points, on which all basis functions vanish
+        self._cells_mask = np.ones_like(self._cells_lower)
+
+        if not basis.zero_boundary:
+            self._cells_mask[[0, -1]] = 0.0
+
+        self._nodes, weights = self._rule(self._cells_lower, self._cells_upper)
+
+        # Weights of the nodes for the hat functions rising on (`ascending`) and falling
+        # off (`descending`) the cells
+        self._weights_ascending, self._weights_descending = self._hat_weights(
+            self._nodes, weights, self._cells_lower, self._cells_upper
+        )
+
+    @property
+    def basis(self) -> functions.bases.UnivariateLinearInterpolationBasis:
+        return self._basis
+
+    @property
+    def order(self) -> int:
+        return self._order
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """Quadrature nodes of shape `(num_cells, order)`."""
+        return self._nodes
+
+    def integrate(self, values, /, *, xp: ModuleType = np):
+        """Integrals of a function against all basis functions, given its `values` of
+        shape `(..., num_cells, order)` at the :attr:`nodes`."""
+        return self._gather(
+            xp.sum(values * self._weights_ascending, axis=-1),
+            xp.sum(values * self._weights_descending, axis=-1),
+        )
+
+    def integrate_kernel(
+        self,
+        k: Callable,
+        x,
+        /,
+        *,
+        xp: ModuleType = np,
+    ):
+        r"""Integrals :math:`\int \phi_i(t) k(x, t) \, dt` for all basis functions,
+        where `k` is a broadcasting callable, e.g. a kernel or its JAX version.
+
+        The result has shape `x.shape + (len(basis),)`."""
+        x = xp.asarray(x)
+
+        k_x_nodes = k(x[..., None, None], self._nodes)
+
+        res_ascending = xp.sum(k_x_nodes * self._weights_ascending, axis=-1)
+        res_descending = xp.sum(k_x_nodes * self._weights_descending, axis=-1)
+
+        # Replace the integrals over the cell containing `x` by the sum of the integrals
+        # over the two parts of the cell left and right of `x`
+        num_cells = self._cells_lower.size
+
+        cell_idcs = xp.clip(
+            xp.searchsorted(self._basis.grid, x, side="right") - 1, 0, num_cells - 1
+        )
+
+        cells_lower = xp.asarray(self._cells_lower)[cell_idcs]
+        cells_upper = xp.asarray(self._cells_upper)[cell_idcs]
+        x_clipped = xp.clip(x, cells_lower, cells_upper)
+
+        delta_ascending = -xp.take_along_axis(
+            res_ascending, cell_idcs[..., None], axis=-1
+        )[..., 0]
+        delta_descending = -xp.take_along_axis(
+            res_descending, cell_idcs[..., None], axis=-1
+        )[..., 0]
+
+        for parts_lower, parts_upper in (
+            (cells_lower, x_clipped),
+            (x_clipped, cells_upper),
+        ):
+            nodes, weights = self._rule(parts_lower, parts_upper)
+            weights_ascending, weights_descending = self._hat_weights(
+                nodes, weights, cells_lower, cells_upper
+            )
+
+            k_x_nodes = k(x[..., None], nodes)
+
+            delta_ascending += xp.sum(k_x_nodes * weights_ascending, axis=-1)
+            delta_descending += xp.sum(k_x_nodes * weights_descending, axis=-1)
+
+        is_split_cell = cell_idcs[..., None] == xp.arange(num_cells)
+
+        return self._gather(
+            res_ascending + xp.where(is_split_cell, delta_ascending[..., None], 0.0),
+            res_descending + xp.where(is_split_cell, delta_descending[..., None], 0.0),
+        )
+
+    def integrate_kernel_pairwise(
+        self,
+        k: Callable,
+        other: HatFunctionQuadrature,
+        /,
+        *,
+        xp: ModuleType = np,
+    ):
+        r"""Double integrals :math:`\iint \phi_i(t_0) k(t_0, t_1) \psi_j(t_1) \,
+        dt_1 \, dt_0` for all basis functions :math:`\phi_i` of this rule and
+        :math:`\psi_j` of `other`.
+
+        The inner integrals are computed by :meth:`integrate_kernel` at the nodes of
+        this rule, in blocks of cells to bound the memory usage."""
+        num_cells = self._cells_lower.size
+        block_size = max(1, _BLOCK_SIZE // (self._order * other.nodes.size))
+
+        inner_integrals = xp.concatenate(
+            [
+                other.integrate_kernel(
+                    k, self._nodes[start : start + block_size], xp=xp
+                )
+                for start in range(0, num_cells, block_size)
+            ],
+            axis=0,
+        )
+
+        return self.integrate(xp.moveaxis(inner_integrals, -1, 0), xp=xp).T
+
+    def _rule(self, lower, upper):
+        midpoints = (lower + upper)[..., None] / 2
+        half_widths = (upper - lower)[..., None] / 2
+
+        return midpoints + half_widths * self._gl_nodes, half_widths * self._gl_weights
+
+    @staticmethod
+    def _hat_weights(nodes, weights, cells_lower, cells_upper):
+        widths = (cells_upper - cells_lower)[..., None]
+        ascending = (nodes - cells_lower[..., None]) / widths
+
+        return weights * ascending, weights * (1.0 - ascending)
+
+    def _gather(self, res_ascending, res_descending):
+        # The `i`-th basis function rises on cell `i` and falls off on cell `i + 1`
+        res_ascending = res_ascending * self._cells_mask
+        res_descending = res_descending * self._cells_mask
+
+        return res_ascending[..., :-1] + res_descending[..., 1:]
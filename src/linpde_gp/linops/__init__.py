@@ -1,3 +1,8 @@
 from probnum.linops import *
 
+from ._banded import SymmetricBanded
+from ._block import BlockInverse, BlockMatrix
+from ._kronecker import KroneckerProduct
 from ._low_rank import LowRankMatrix, LowRankUpdate, outer
+from ._sparse import SymmetricSparse
+from ._toeplitz import SymmetricToeplitz, SymmetricToeplitzInverse
@@ -0,0 +1,132 @@
+import functools
+
+import numpy as np
+import probnum as pn
+import scipy.linalg
+import scipy.sparse
+
+
+class SymmetricBanded(pn.linops.LinearOperator):
+    r"""Symmetric positive definite matrix with a banded sparsity pattern, stored as a
+    :mod:`scipy.sparse` matrix.
+
+    Matrix-vector products cost :math:`O(N b)` for a bandwidth :math:`b`. Since the
+    Cholesky factor :math:`A = R^T R` of a banded matrix has the same bandwidth, it is
+    computed in :math:`O(N b^2)` time and :math:`O(N b)` memory by the banded LAPACK
+    routines, and linear systems are solved in :math:`O(N b)`."""
+
+    def __init__(self, A: scipy.sparse.spmatrix):
+        self._A = scipy.sparse.csr_matrix(A)
+
+        assert self._A.ndim == 2 and self._A.shape[0] == self._A.shape[1]
+
+        A_coo = self._A.tocoo()
+        self._bandwidth = (
+            int(np.max(np.abs(A_coo.row - A_coo.col))) if A_coo.nnz > 0 else 0
+        )
+
+        super().__init__(
+            shape=self._A.shape,
+            dtype=np.promote_types(self._A.dtype, np.double),
+            matmul=lambda x: _sparse_matmul(self._A, x),
+            rmatmul=lambda x: np.swapaxes(
+                _sparse_matmul(self._A, np.swapaxes(x, -1, -2)), -1, -2
+            ),
+            todense=self._A.toarray,
+            transpose=lambda: self,
+            inverse=lambda: self.inverse_factor @ self.inverse_factor.T,
+            trace=lambda: self._A.diagonal().sum(),
+        )
+
+        self.is_symmetric = True
+
+    @property
+    def A(self) -> scipy.sparse.csr_matrix:
+        return self._A
+
+    @property
+    def bandwidth(self) -> int:
+        """Maximal distance of a nonzero entry from the diagonal."""
+        return self._bandwidth
+
+    def diagonal(self) -> np.ndarray:
+        return self._A.diagonal()
+
+    @functools.cached_property
+    def cholesky_banded(self) -> np.ndarray:
+        r"""Upper Cholesky factor :math:`R` with :math:`A = R^T R` in the banded
+        storage format of :func:`scipy.linalg.cholesky_banded`, i.e. of shape
+        `(bandwidth + 1, N)`."""
+        b = self._bandwidth
+        N = self.shape[0]
+
+        A_banded = np.zeros((b + 1, N), dtype=self.dtype)
+
+        for k in range(b + 1):
+            A_banded[b - k, k:] = self._A.diagonal(k)
+
+        return scipy.linalg.cholesky_banded(A_banded, lower=False)
+
+    @functools.cached_property
+    def inverse_factor(self) -> pn.linops.LinearOperator:
+        r""":math:`U := R^{-1}` with :math:`A^{-1} = U U^T`, where :math:`R` is the
+        upper Cholesky factor of the matrix. Products with :math:`U` and :math:`U^T`
+        are banded triangular solves."""
+        b = self._bandwidth
+        N = self.shape[0]
+
+        R_banded = self.cholesky_banded
+
+        # Banded storage of the lower triangular matrix `R^T`
+        R_T_banded = np.zeros_like(R_banded)
+
+        for k in range(b + 1):
+            R_T_banded[k, : N - k] = R_banded[b - k, k:]
+
+        U = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=lambda x: _solve_banded((0, b), R_banded, x),
+            rmatmul=lambda x: np.swapaxes(U_T @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U_T,
+        )
+        U_T = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=lambda x: _solve_banded((b, 0), R_T_banded, x),
+            rmatmul=lambda x: np.swapaxes(U @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U,
+        )
+
+        return U
+
+
+def sparsify(A: np.ndarray, drop_tol: float) -> scipy.sparse.csr_matrix:
+    """Sparse copy of `A` without the entries whose magnitude is at most `drop_tol`
+    times the largest magnitude of all entries."""
+    abs_A = np.abs(A)
+
+    return scipy.sparse.csr_matrix(
+        np.where(abs_A > drop_tol * np.max(abs_A, initial=0.0), A, 0.0)
+    )
+
+
+def _sparse_matmul(A: scipy.sparse.spmatrix, x: np.ndarray) -> np.ndarray:
+    # Sparse matrices only act on two-dimensional arrays
+    x_2d = np.moveaxis(x, -2, 0).reshape((x.shape[-2], -1), order="C")
+
+    res = np.asarray(A @ x_2d).reshape((A.shape[0],) + x.shape[:-2] + x.shape[-1:])
+
+    return np.moveaxis(res, 0, -2)
+
+
+def _solve_banded(
+    l_and_u: tuple[int, int], ab: np.ndarray, x: np.ndarray
+) -> np.ndarray:
+    x_2d = np.moveaxis(x, -2, 0).reshape((x.shape[-2], -1), order="C")
+
+    res = scipy.linalg.solve_banded(l_and_u, ab, x_2d).reshape(
+        (x.shape[-2],) + x.shape[:-2] + x.shape[-1:]
+    )
+
+    return np.moveaxis(res, 0, -2)
@@ -0,0 +1,126 @@
+from collections.abc import Sequence
+import functools
+import operator
+
+import numpy as np
+import probnum as pn
+import scipy.linalg
+
+
+class KroneckerProduct(pn.linops.LinearOperator):
+    r""":math:`M := K_1 \otimes \dotsb \otimes K_D + \sigma^2 I` for symmetric
+    positive (semi-)definite factors :math:`K_i`.
+
+    Matrix-vector products are computed as a sequence of mode products with the
+    factors. The inverse (and an inverse square root) are computed from the
+    eigendecompositions of the factors, i.e. in :math:`O(\sum_i n_i^3)`."""
+
+    def __init__(self, factors: Sequence[np.ndarray], shift: float = 0.0):
+        self._factors = tuple(np.asarray(factor) for factor in factors)
+        self._shift = shift
+
+        assert all(
+            factor.ndim == 2 and factor.shape[0] == factor.shape[1]
+            for factor in self._factors
+        )
+
+        self._factor_sizes = tuple(factor.shape[0] for factor in self._factors)
+
+        N = functools.reduce(operator.mul, self._factor_sizes, 1)
+
+        super().__init__(
+            shape=(N, N),
+            dtype=np.result_type(*self._factors, self._shift),
+            matmul=lambda x: _mode_products(self._factors, x) + self._shift * x,
+            rmatmul=lambda x: np.swapaxes(self @ np.swapaxes(x, -1, -2), -1, -2),
+            todense=lambda: functools.reduce(np.kron, self._factors)
+            + self._shift * np.eye(N),
+            transpose=lambda: self,
+            inverse=lambda: self.inverse_factor @ self.inverse_factor.T,
+            trace=lambda: (
+                functools.reduce(
+                    operator.mul, (np.trace(factor) for factor in self._factors)
+                )
+                + N * self._shift
+            ),
+        )
+
+    @property
+    def factors(self) -> tuple[np.ndarray, ...]:
+        return self._factors
+
+    @property
+    def shift(self) -> float:
+        return self._shift
+
+    @functools.cached_property
+    def factor_eighs(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        return tuple(scipy.linalg.eigh(factor) for factor in self._factors)
+
+    @functools.cached_property
+    def eigvals(self) -> np.ndarray:
+        return (
+            functools.reduce(
+                np.multiply.outer, (eigvals for eigvals, _ in self.factor_eighs)
+            ).reshape(-1)
+            + self._shift
+        )
+
+    @functools.cached_property
+    def inverse_factor(self) -> pn.linops.LinearOperator:
+        r""":math:`U := Q \Lambda^{-1/2}` with :math:`M^{-1} = U U^T`, where
+        :math:`M = Q \Lambda Q^T` is the eigendecomposition of the operator."""
+        eigvecs = tuple(eigvecs for _, eigvecs in self.factor_eighs)
+        eigvecs_T = tuple(Q.T for Q in eigvecs)
+        inv_sqrt_eigvals = 1.0 / np.sqrt(self.eigvals)
+
+        U = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=lambda x: _mode_products(eigvecs, inv_sqrt_eigvals[:, None] * x),
+            rmatmul=lambda x: np.swapaxes(U_T @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U_T,
+        )
+        U_T = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=lambda x: inv_sqrt_eigvals[:, None] * _mode_products(eigvecs_T, x),
+            rmatmul=lambda x: np.swapaxes(U @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U,
+        )
+
+        return U
+
+    def diagonal(self) -> np.ndarray:
+        return (
+            functools.reduce(
+                np.multiply.outer, (np.diag(factor) for factor in self._factors)
+            ).reshape(-1)
+            + self._shift
+        )
+
+    def column(self, i: int) -> np.ndarray:
+        idcs = np.unravel_index(i, self._factor_sizes)
+
+        col = functools.reduce(
+            np.multiply.outer,
+            (factor[:, idx] for factor, idx in zip(self._factors, idcs)),
+        ).reshape(-1)
+        col[i] += self._shift
+
+        return col
+
+
+def _mode_products(factors: Sequence[np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Computes `(A_1 ⊗ ... ⊗ A_D) @ x` for `x` of shape `(..., N, K)`."""
+    batch_shape = x.shape[:-2]
+    num_cols = x.shape[-1]
+
+    x = x.reshape(batch_shape + tuple(factor.shape[1] for factor in factors) + (-1,))
+
+    for i, factor in enumerate(factors):
+        axis = len(batch_shape) + i
+
+        x = np.moveaxis(np.tensordot(factor, x, axes=(1, axis)), 0, axis)
+
+    return x.reshape(batch_shape + (-1, num_cols))
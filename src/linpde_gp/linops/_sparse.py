@@ -0,0 +1,133 @@
+import functools
+
+import numpy as np
+import probnum as pn
+import scipy.sparse
+import scipy.sparse.linalg
+
+from ._banded import _sparse_matmul
+
+
+class SymmetricSparse(pn.linops.LinearOperator):
+    r"""Symmetric positive definite matrix with a general sparsity pattern, stored as a
+    :mod:`scipy.sparse` matrix.
+
+    Linear systems are solved by a sparse :math:`L D L^T` factorization :math:`P A P^T
+    = L D L^T`, where the permutation :math:`P` is a fill-reducing minimum degree
+    ordering. Since SciPy does not provide a sparse Cholesky decomposition, the
+    factorization is computed by SuperLU in symmetric mode without pivoting. For
+    kernel matrices of compactly supported kernels, the factor :math:`L` typically
+    stays sparse, even though the matrix is not banded."""
+
+    def __init__(self, A: scipy.sparse.spmatrix):
+        self._A = scipy.sparse.csr_matrix(A)
+
+        assert self._A.ndim == 2 and self._A.shape[0] == self._A.shape[1]
+
+        super().__init__(
+            shape=self._A.shape,
+            dtype=np.promote_types(self._A.dtype, np.double),
+            matmul=lambda x: _sparse_matmul(self._A, x),
+            rmatmul=lambda x: np.swapaxes(
+                _sparse_matmul(self._A, np.swapaxes(x, -1, -2)), -1, -2
+            ),
+            todense=self._A.toarray,
+            transpose=lambda: self,
+            inverse=lambda: self.inverse_factor @ self.inverse_factor.T,
+            trace=lambda: self._A.diagonal().sum(),
+        )
+
+        self.is_symmetric = True
+
+    @property
+    def A(self) -> scipy.sparse.csr_matrix:
+        return self._A
+
+    def diagonal(self) -> np.ndarray:
+        return self._A.diagonal()
+
+    @functools.cached_property
+    def ldl(
+        self,
+    ) -> tuple[np.ndarray, scipy.sparse.csr_matrix, np.ndarray]:
+        r"""Permutation :math:`p`, unit lower triangular factor :math:`L`, and diagonal
+        :math:`D` with :math:`A[p][:, p] = L \operatorname{diag}(D) L^T`.
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            If the matrix is not (numerically) positive definite.
+        """
+        lu = scipy.sparse.linalg.splu(
+            self._A.tocsc(),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+
+        # Without pivoting, the row and column permutations agree and `U = D L^T`
+        if not np.array_equal(lu.perm_r, lu.perm_c):
+            raise np.linalg.LinAlgError(
+                "The sparse matrix could not be factorized symmetrically."
+            )
+
+        D = lu.U.diagonal()
+
+        if not np.all(D > 0.0):
+            raise np.linalg.LinAlgError("The sparse matrix is not positive definite.")
+
+        perm = np.empty_like(lu.perm_r)
+        perm[lu.perm_r] = np.arange(perm.size)
+
+        return perm, lu.L.tocsr(), D
+
+    @functools.cached_property
+    def inverse_factor(self) -> pn.linops.LinearOperator:
+        r""":math:`U := P^T L^{-T} D^{-1/2}` with :math:`A^{-1} = U U^T`. Products with
+        :math:`U` and :math:`U^T` are sparse triangular solves."""
+        perm, L, D = self.ldl
+
+        L_T = L.T.tocsr()
+        D_sqrt = np.sqrt(D)
+
+        inv_perm = np.empty_like(perm)
+        inv_perm[perm] = np.arange(perm.size)
+
+        def _U_matmul(x: np.ndarray) -> np.ndarray:
+            res = _solve_triangular(L_T, x / D_sqrt[:, None], lower=False)
+
+            return res[..., inv_perm, :]
+
+        def _U_T_matmul(x: np.ndarray) -> np.ndarray:
+            res = _solve_triangular(L, x[..., perm, :], lower=True)
+
+            return res / D_sqrt[:, None]
+
+        U = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=_U_matmul,
+            rmatmul=lambda x: np.swapaxes(U_T @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U_T,
+        )
+        U_T = pn.linops.LinearOperator(
+            shape=self.shape,
+            dtype=self.dtype,
+            matmul=_U_T_matmul,
+            rmatmul=lambda x: np.swapaxes(U @ np.swapaxes(x, -1, -2), -1, -2),
+            transpose=lambda: U,
+        )
+
+        return U
+
+
+def _solve_triangular(
+    T: scipy.sparse.csr_matrix, x: np.ndarray, lower: bool
+) -> np.ndarray:
+    x_2d = np.moveaxis(x, -2, 0).reshape((x.shape[-2], -1), order="C")
+
+    res = scipy.sparse.linalg.spsolve_triangular(
+        T, x_2d, lower=lower, unit_diagonal=True
+    ).reshape((x.shape[-2],) + x.shape[:-2] + x.shape[-1:])
+
+    return np.moveaxis(res, 0, -2)
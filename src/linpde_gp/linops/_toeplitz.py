@@ -0,0 +1,85 @@
+import functools
+
+import numpy as np
+import probnum as pn
+import scipy.linalg
+
+
+class SymmetricToeplitz(pn.linops.LinearOperator):
+    r"""Symmetric Toeplitz matrix :math:`T_{ij} = c_{\lvert i - j \rvert}`.
+
+    Matrix-vector products cost :math:`O(N \log N)` by embedding :math:`T` into a
+    circulant matrix of size :math:`2N`, which is diagonalized by the FFT. Linear
+    systems are solved by the Levinson recursion in :math:`O(N^2)` (see `inv`), such
+    that neither the matrix nor a factorization of its inverse is ever stored
+    densely."""
+
+    def __init__(self, first_column: np.ndarray):
+        self._c = np.asarray(first_column)
+
+        assert self._c.ndim == 1
+
+        N = self._c.shape[0]
+
+        super().__init__(
+            shape=(N, N),
+            dtype=self._c.dtype,
+            matmul=self._matmul,
+            rmatmul=lambda x: np.swapaxes(self._matmul(np.swapaxes(x, -1, -2)), -1, -2),
+            todense=lambda: scipy.linalg.toeplitz(self._c),
+            transpose=lambda: self,
+            inverse=lambda: SymmetricToeplitzInverse(self),
+            trace=lambda: N * self._c[0],
+        )
+
+    @property
+    def first_column(self) -> np.ndarray:
+        return self._c
+
+    def diagonal(self) -> np.ndarray:
+        return np.full(self.shape[0], self._c[0])
+
+    def column(self, i: int) -> np.ndarray:
+        return self._c[np.abs(np.arange(self.shape[0]) - i)]
+
+    @functools.cached_property
+    def _circulant_eigvals(self) -> np.ndarray:
+        # First column of the circulant embedding `[[T, S], [S, T]]`
+        return np.fft.rfft(
+            np.concatenate((self._c, np.zeros_like(self._c[:1]), self._c[:0:-1]))
+        )
+
+    def _matmul(self, x: np.ndarray) -> np.ndarray:
+        N = self.shape[1]
+
+        x_hat = np.fft.rfft(x, n=2 * N, axis=-2)
+
+        res = np.fft.irfft(self._circulant_eigvals[:, None] * x_hat, n=2 * N, axis=-2)
+
+        return res[..., :N, :]
+
+
+class SymmetricToeplitzInverse(pn.linops.LinearOperator):
+    def __init__(self, toeplitz: SymmetricToeplitz):
+        self._toeplitz = toeplitz
+
+        super().__init__(
+            shape=self._toeplitz.shape,
+            dtype=np.promote_types(self._toeplitz.dtype, np.double),
+            matmul=self._matmul,
+            todense=lambda: np.linalg.inv(self._toeplitz.todense()),
+            transpose=lambda: self,
+            inverse=lambda: self._toeplitz,
+        )
+
+    def _matmul(self, x: np.ndarray) -> np.ndarray:
+        batch_shape = x.shape[:-2]
+
+        x = x.reshape((-1,) + x.shape[-2:])
+
+        return np.stack(
+            [
+                scipy.linalg.solve_toeplitz(self._toeplitz.first_column, x_batch)
+                for x_batch in x
+            ]
+        ).reshape(batch_shape + x.shape[-2:])
@@ -2,20 +2,35 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Sequence
 import functools
+import operator
 
 import jax
 import jax.numpy as jnp
 import numpy as np
 from numpy.typing import ArrayLike
 import probnum as pn
+from probnum.typing import ShapeLike, ShapeType
 import scipy.linalg
+import scipy.sparse
 
-from linpde_gp import linfunctls
-from linpde_gp.functions import JaxFunction
+from linpde_gp import linfunctls, linops
+from linpde_gp.functions import FourierFeatures, JaxFunction
+from linpde_gp.linalg.solvers import ProbabilisticLinearSolver
+from linpde_gp.linalg.solvers.beliefs import LowRankInverseBelief
 from linpde_gp.linfuncops import LinearFunctionOperator
 from linpde_gp.linfunctls import LinearFunctional
 from linpde_gp.randprocs.crosscov import ProcessVectorCrossCovariance
-from linpde_gp.randprocs.kernels import JaxKernel
+from linpde_gp.randprocs.crosscov.linfunctls import self_covariance
+from linpde_gp.randprocs.kernels import (
+    JaxKernel,
+    JaxScaledKernel,
+    SKIKernel,
+    distance_cache,
+    random_fourier_features,
+)
+from linpde_gp.randprocs.kernels._compact_support import CompactlySupportedKernelMixin
+from linpde_gp.randprocs.kernels._separable import tensor_grid_gram_factors
+from linpde_gp.randprocs.kernels._stationary import JaxStationaryMixin
 from linpde_gp.typing import RandomVariableLike
 
 
@@ -29,6 +44,9 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
         *,
         L: None | LinearFunctional | LinearFunctionOperator = None,
         b: None | RandomVariableLike = None,
+        memory_budget: int | None = None,
+        solver: ProbabilisticLinearSolver | None = None,
+        max_blocks: int | None = None,
     ):
         Y, L, b, kLa, Lm, gram = cls._preprocess_observations(
             prior=prior,
@@ -36,8 +54,71 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             X=X,
             L=L,
             b=b,
+            matrix_free=solver is not None,
+            memory_budget=memory_budget,
         )
 
+        if solver is not None:
+            representer_weights, gram_inv_factor = _solve_iteratively(
+                solver, gram, (Y - Lm).reshape((-1,), order="C")
+            )
+
+            return cls(
+                prior=prior,
+                Ys=(Y,),
+                Ls=(L,),
+                bs=(b,),
+                kLas=ConditionalGaussianProcess._PriorPredictiveCrossCovariance(
+                    (kLa,)
+                ),
+                gram_blocks=((gram,),),
+                representer_weights=representer_weights,
+                gram_inv_factor=gram_inv_factor,
+                solver=solver,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+
+        if isinstance(gram, _FACTORIZED_GRAM_TYPES):
+            # The inverse of the Gram matrix is available in closed form from the
+            # eigendecompositions of the Kronecker factors or, for sparse Gram
+            # matrices, from a banded Cholesky or sparse LDL^T factorization
+            return cls(
+                prior=prior,
+                Ys=(Y,),
+                Ls=(L,),
+                bs=(b,),
+                kLas=ConditionalGaussianProcess._PriorPredictiveCrossCovariance(
+                    (kLa,)
+                ),
+                gram_blocks=((gram,),),
+                representer_weights=gram.inv() @ (Y - Lm).reshape((-1,), order="C"),
+                gram_inv_factor=gram.inverse_factor,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+
+        if isinstance(gram, _SOLVED_GRAM_TYPES):
+            # Toeplitz Gram matrices are never densified. Instead, the representer
+            # weights and the posterior covariances are computed by the Levinson
+            # recursion.
+            gram_inv = gram.inv()
+
+            return cls(
+                prior=prior,
+                Ys=(Y,),
+                Ls=(L,),
+                bs=(b,),
+                kLas=ConditionalGaussianProcess._PriorPredictiveCrossCovariance(
+                    (kLa,)
+                ),
+                gram_blocks=((gram,),),
+                representer_weights=gram_inv @ (Y - Lm).reshape((-1,), order="C"),
+                gram_inv=gram_inv,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+
         # Compute representer weights
         gram_cho = scipy.linalg.cho_factor(gram)
 
@@ -55,6 +136,211 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             gram_blocks=((gram,),),
             gram_cho=gram_cho,
             representer_weights=representer_weights,
+            memory_budget=memory_budget,
+            max_blocks=max_blocks,
+        )
+
+    @classmethod
+    def from_stacked_observations(
+        cls,
+        prior: pn.randprocs.GaussianProcess,
+        Ys: ArrayLike,
+        X: ArrayLike | None = None,
+        *,
+        L: None | LinearFunctional | LinearFunctionOperator = None,
+        b: None | RandomVariableLike = None,
+        memory_budget: int | None = None,
+        max_blocks: int | None = None,
+    ) -> tuple[ConditionalGaussianProcess, ...]:
+        """Conditions the prior on each of the `K` data vectors `Ys[k]` (with shared
+        `X`, `L`, and `b`). The Gram matrix and its Cholesky factor are only computed
+        once and shared by all `K` posteriors, whose representer weights are obtained
+        by a single `cho_solve` with `K` right-hand sides."""
+        Ys = np.asarray(Ys)
+
+        if Ys.ndim < 1:
+            raise ValueError(f"`Ys` must have a leading stacking axis ({Ys.shape=}).")
+
+        _, L, b, kLa, Lm, gram = cls._preprocess_observations(
+            prior=prior,
+            Y=Ys[0],
+            X=X,
+            L=L,
+            b=b,
+        )
+
+        if Ys.shape[1:] != L.output_shape:
+            raise ValueError(f"{Ys.shape[1:]=} must be equal to {L.output_shape}.")
+
+        centered_Ys = (Ys - Lm).reshape((Ys.shape[0], -1), order="C").T
+
+        # Compute representer weights
+        gram_cho = None
+        gram_inv_factor = None
+        gram_inv = None
+
+        if isinstance(gram, _FACTORIZED_GRAM_TYPES):
+            gram_inv_factor = gram.inverse_factor
+
+            representer_weights = (gram.inv() @ centered_Ys).T
+        elif isinstance(gram, _SOLVED_GRAM_TYPES):
+            gram_inv = gram.inv()
+
+            representer_weights = (gram_inv @ centered_Ys).T
+        else:
+            gram_cho = scipy.linalg.cho_factor(gram)
+
+            representer_weights = cho_solve(gram_cho, centered_Ys).T
+
+        kLas = ConditionalGaussianProcess._PriorPredictiveCrossCovariance((kLa,))
+
+        return tuple(
+            cls(
+                prior=prior,
+                Ys=(Y,),
+                Ls=(L,),
+                bs=(b,),
+                kLas=kLas,
+                gram_blocks=((gram,),),
+                gram_cho=gram_cho,
+                representer_weights=representer_weights_k,
+                gram_inv_factor=gram_inv_factor,
+                gram_inv=gram_inv,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+            for Y, representer_weights_k in zip(Ys, representer_weights)
+        )
+
+    @classmethod
+    def from_joint_observations(
+        cls,
+        prior: pn.randprocs.GaussianProcess,
+        Ys: Sequence[ArrayLike],
+        Xs: Sequence[ArrayLike | None] | None = None,
+        *,
+        Ls: Sequence[None | LinearFunctional | LinearFunctionOperator] | None = None,
+        bs: Sequence[None | RandomVariableLike] | None = None,
+        memory_budget: int | None = None,
+        solver: ProbabilisticLinearSolver | None = None,
+        max_blocks: int | None = None,
+    ) -> ConditionalGaussianProcess:
+        """Conditions the prior on several blocks of observations `Ys[i]` of `Ls[i]`
+        (at `Xs[i]`, with noise `bs[i]`) at once, e.g. on the PDE in the interior and
+        on the boundary conditions.
+
+        In contrast to repeated calls to `condition_on_observations`, the lower
+        triangle of the joint Gram matrix, i.e. all blocks :math:`L_i k L_j^*`, is
+        assembled in a single pass and the joint Gram matrix is only factorized once,
+        instead of updating the factorization block by block."""
+        num_blocks = len(Ys)
+
+        if num_blocks == 0:
+            raise ValueError("At least one block of observations must be given.")
+
+        Xs = (None,) * num_blocks if Xs is None else tuple(Xs)
+        Ls = (None,) * num_blocks if Ls is None else tuple(Ls)
+        bs = (None,) * num_blocks if bs is None else tuple(bs)
+
+        if not len(Xs) == len(Ls) == len(bs) == num_blocks:
+            raise ValueError(
+                f"`Xs`, `Ls`, and `bs` must contain one entry per block of "
+                f"observations ({num_blocks}), but got {len(Xs)}, {len(Ls)}, and "
+                f"{len(bs)}."
+            )
+
+        if max_blocks is not None and num_blocks > max_blocks:
+            raise ValueError(f"Got {num_blocks} blocks, but {max_blocks=}.")
+
+        Ys, Ls, bs, kLas, pred_means, _ = zip(
+            *(
+                cls._preprocess_observations(
+                    prior=prior,
+                    Y=Y,
+                    X=X,
+                    L=L,
+                    b=b,
+                    compute_gram=False,
+                )
+                for Y, X, L, b in zip(Ys, Xs, Ls, bs)
+            )
+        )
+
+        sparse_gram_blocks = _sparse_gram_blocks(
+            prior, Ls, tuple(b.cov if b is not None else None for b in bs)
+        )
+
+        if sparse_gram_blocks is None:
+            gram_blocks = _joint_gram_blocks(Ls, kLas, bs)
+        else:
+            gram_blocks = tuple(
+                tuple(pn.linops.Matrix(block) for block in row[: i + 1])
+                for i, row in enumerate(sparse_gram_blocks)
+            )
+
+        kLas = ConditionalGaussianProcess._PriorPredictiveCrossCovariance(kLas)
+
+        if solver is not None:
+            representer_weights, gram_inv_factor = _solve_iteratively(
+                solver,
+                _block_gram_linop(gram_blocks),
+                np.concatenate(
+                    [
+                        (Y - pred_mean).reshape((-1,), order="C")
+                        for Y, pred_mean in zip(Ys, pred_means)
+                    ]
+                ),
+            )
+
+            return cls(
+                prior=prior,
+                Ys=Ys,
+                Ls=Ls,
+                bs=bs,
+                kLas=kLas,
+                gram_blocks=gram_blocks,
+                representer_weights=representer_weights,
+                gram_inv_factor=gram_inv_factor,
+                solver=solver,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+
+        if sparse_gram_blocks is not None:
+            gram = linops.SymmetricSparse(
+                scipy.sparse.bmat(sparse_gram_blocks, format="csr")
+            )
+
+            return cls(
+                prior=prior,
+                Ys=Ys,
+                Ls=Ls,
+                bs=bs,
+                kLas=kLas,
+                gram_blocks=gram_blocks,
+                representer_weights=gram.inv()
+                @ np.concatenate(
+                    [
+                        (Y - pred_mean).reshape((-1,), order="C")
+                        for Y, pred_mean in zip(Ys, pred_means)
+                    ]
+                ),
+                gram_inv_factor=gram.inverse_factor,
+                memory_budget=memory_budget,
+                max_blocks=max_blocks,
+            )
+
+        # The Cholesky factor of the joint Gram matrix and the representer weights are
+        # computed on construction
+        return cls(
+            prior=prior,
+            Ys=Ys,
+            Ls=Ls,
+            bs=bs,
+            kLas=kLas,
+            gram_blocks=gram_blocks,
+            memory_budget=memory_budget,
+            max_blocks=max_blocks,
         )
 
     def __init__(
@@ -68,6 +354,11 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
         gram_blocks: Sequence[Sequence[np.ndarray]],
         gram_cho: tuple[np.ndarray, bool] | None = None,
         representer_weights: np.ndarray | None = None,
+        gram_inv_factor: np.ndarray | pn.linops.LinearOperator | None = None,
+        gram_inv: pn.linops.LinearOperator | None = None,
+        solver: ProbabilisticLinearSolver | None = None,
+        memory_budget: int | None = None,
+        max_blocks: int | None = None,
     ):
         self._prior = prior
 
@@ -82,25 +373,94 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
 
         self._representer_weights = representer_weights
 
+        # If the representer weights were computed by an iterative solver, the
+        # inverse of the Gram matrix is approximated by `U @ U.T`. For structured
+        # (e.g. Kronecker) Gram matrices, `U @ U.T` is the exact inverse.
+        self._gram_inv_factor = gram_inv_factor
+
+        # For structured (e.g. Toeplitz) Gram matrices, which are solved without being
+        # factorized, the inverse is only available as a linear operator
+        self._gram_inv = gram_inv
+
+        self._solver = solver
+
+        if self._solver is not None and (
+            self._representer_weights is None or self._gram_inv_factor is None
+        ):
+            raise ValueError(
+                "`representer_weights` and `gram_inv_factor` must be given if "
+                "`solver` is not `None`."
+            )
+
+        self._memory_budget = None if memory_budget is None else int(memory_budget)
+
+        if max_blocks is not None and max_blocks < 1:
+            raise ValueError(f"`max_blocks` must be positive ({max_blocks=}).")
+
+        self._max_blocks = max_blocks
+
         super().__init__(
             mean=ConditionalGaussianProcess.Mean(
                 prior_mean=self._prior.mean,
                 kLas=self._kLas,
                 representer_weights=self.representer_weights,
+                memory_budget=self._memory_budget,
             ),
             cov=ConditionalGaussianProcess.Kernel(
                 prior_kernel=self._prior.cov,
                 kLas=self._kLas,
-                gram_cho=self.gram_cho,
+                gram_cho=(
+                    self.gram_cho
+                    if self._gram_inv_factor is None and self._gram_inv is None
+                    else None
+                ),
+                gram_inv_factor=self._gram_inv_factor,
+                gram_inv=self._gram_inv,
+                memory_budget=self._memory_budget,
             ),
         )
 
+    @property
+    def memory_budget(self) -> int | None:
+        """Approximate upper bound (in bytes) on the size of the intermediate
+        cross-covariance arrays built while evaluating the posterior mean and
+        covariance function. If `None`, all test inputs are processed at once."""
+        return self._memory_budget
+
+    @property
+    def max_blocks(self) -> int | None:
+        """Maximum number of observation blocks. If conditioning on a new block would
+        exceed it, the oldest blocks are removed first (sliding window)."""
+        return self._max_blocks
+
+    @property
+    def solver(self) -> ProbabilisticLinearSolver | None:
+        return self._solver
+
+    @property
+    def gram_inv_factor(self) -> np.ndarray | pn.linops.LinearOperator | None:
+        """Factor `U` such that `U @ U.T` approximates the inverse of the Gram matrix.
+        Only available if the GP was conditioned with a `solver` (low-rank) or if the
+        Gram matrix is Kronecker-structured or sparse (exact)."""
+        return self._gram_inv_factor
+
+    @property
+    def gram_inv(self) -> pn.linops.LinearOperator | None:
+        """Inverse of the Gram matrix as a linear operator, if the Gram matrix is
+        structured such that its linear systems are solved without a factorization,
+        e.g. if it is Toeplitz."""
+        return self._gram_inv
+
     @functools.cached_property
     def gram(self) -> np.ndarray:
         return np.block(
             [
                 [
-                    self._gram_blocks[i][j] if i >= j else self._gram_blocks[j][i].T
+                    _dense(
+                        self._gram_blocks[i][j]
+                        if i >= j
+                        else self._gram_blocks[j][i].T
+                    )
                     for j in range(len(self._Ys))
                 ]
                 for i in range(len(self._Ys))
@@ -114,30 +474,38 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
 
         return self._gram_cho
 
+    @functools.cached_property
+    def gram_linop(self) -> pn.linops.LinearOperator:
+        return _block_gram_linop(self._gram_blocks)
+
     @property
     def representer_weights(self) -> np.ndarray:
         if self._representer_weights is None:
             self._representer_weights = scipy.linalg.cho_solve(
                 self.gram_cho,
-                np.concatenate(
-                    [
-                        np.reshape(
-                            (
-                                (Y - L(self._prior.mean))
-                                if b is None
-                                else (Y - L(self._prior.mean) - b.mean)
-                            ),
-                            (-1,),
-                            order="C",
-                        )
-                        for Y, L, b in zip(self._Ys, self._Ls, self._bs)
-                    ],
-                    axis=-1,
-                ),
+                self._centered_observations,
             )
 
         return self._representer_weights
 
+    @property
+    def _centered_observations(self) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.reshape(self._centered_observations_block(i), (-1,), order="C")
+                for i in range(len(self._Ys))
+            ],
+            axis=-1,
+        )
+
+    def _centered_observations_block(self, i: int) -> np.ndarray:
+        Y, L, b = self._Ys[i], self._Ls[i], self._bs[i]
+
+        if b is None:
+            return Y - L(self._prior.mean)
+
+        return Y - L(self._prior.mean) - b.mean
+
     class _PriorPredictiveCrossCovariance(ProcessVectorCrossCovariance):
         def __init__(
             self,
@@ -187,7 +555,8 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             return jnp.concatenate(
                 [
                     jnp.reshape(
-                        kLa(x),  # shape: batch_shape + u_output_shape + Lu_output_shape
+                        # shape: batch_shape + u_output_shape + Lu_output_shape
+                        kLa.jax(x),
                         batch_shape + self.randproc_output_shape + (-1,),
                         "C",
                     )
@@ -206,10 +575,12 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             prior_mean: JaxFunction,
             kLas: ConditionalGaussianProcess._PriorPredictiveCrossCovariance,
             representer_weights: np.ndarray,
+            memory_budget: int | None = None,
         ):
             self._prior_mean = prior_mean
             self._kLas = kLas
             self._representer_weights = representer_weights
+            self._memory_budget = memory_budget
 
             super().__init__(
                 input_shape=self._prior_mean.input_shape,
@@ -217,12 +588,34 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             )
 
         def _evaluate(self, x: np.ndarray) -> np.ndarray:
-            m_x = self._prior_mean(x)
-            kLas_x = self._kLas(x)
+            batch_shape = x.shape[: x.ndim - self.input_ndim]
 
-            return m_x + kLas_x @ self._representer_weights
+            x = x.reshape((-1,) + self.input_shape, order="C")
+
+            m_x = np.empty_like(
+                self._representer_weights,
+                shape=x.shape[:1] + self.output_shape,
+            )
+
+            for chunk in _chunk_slices(
+                x.shape[0],
+                self._memory_budget,
+                bytes_per_point=(
+                    self._kLas.randvar_size
+                    * functools.reduce(operator.mul, self.output_shape, 1)
+                    * self._representer_weights.itemsize
+                ),
+            ):
+                x_chunk = x[chunk]
+
+                m_x[chunk] = (
+                    self._prior_mean(x_chunk)
+                    + self._kLas(x_chunk) @ self._representer_weights
+                )
+
+            return m_x.reshape(batch_shape + self.output_shape, order="C")
 
-        @functools.partial(jax.jit, static_argnums=0)
+        @jax.jit
         def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
             m_x = self._prior_mean.jax(x)
             kLas_x = self._kLas.jax(x)
@@ -234,11 +627,29 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             self,
             prior_kernel: JaxKernel,
             kLas: ConditionalGaussianProcess._PriorPredictiveCrossCovariance,
-            gram_cho: np.ndarray,
+            gram_cho: tuple[np.ndarray, bool] | None,
+            gram_inv_factor: np.ndarray | pn.linops.LinearOperator | None = None,
+            gram_inv: pn.linops.LinearOperator | None = None,
+            memory_budget: int | None = None,
         ):
             self._prior_kernel = prior_kernel
             self._kLas = kLas
             self._gram_cho = gram_cho
+            self._gram_inv_factor = gram_inv_factor
+            self._gram_inv = gram_inv
+            self._memory_budget = memory_budget
+
+            assert (
+                sum(
+                    gram_repr is not None
+                    for gram_repr in (
+                        self._gram_cho,
+                        self._gram_inv_factor,
+                        self._gram_inv,
+                    )
+                )
+                == 1
+            )
 
             super().__init__(
                 input_shape=self._prior_kernel.input_shape,
@@ -246,29 +657,417 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             )
 
         def _evaluate(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
-            k_xx = self._prior_kernel(x0, x1)
-            kLas_x0 = self._kLas(x0)
-            kLas_x1 = self._kLas(x1) if x1 is not None else kLas_x0
-
-            return (
-                k_xx
-                - (
-                    kLas_x0[..., None, :]
-                    @ cho_solve(
-                        self._gram_cho,
-                        kLas_x1.transpose(),
-                    ).transpose()[..., :, None]
-                )[..., 0, 0]
+            batch_shape = x0.shape[: x0.ndim - self.input_ndim]
+
+            if x1 is not None:
+                batch_shape = np.broadcast_shapes(
+                    batch_shape, x1.shape[: x1.ndim - self.input_ndim]
+                )
+
+                x1 = np.broadcast_to(x1, batch_shape + self.input_shape).reshape(
+                    (-1,) + self.input_shape, order="C"
+                )
+
+            x0 = np.broadcast_to(x0, batch_shape + self.input_shape).reshape(
+                (-1,) + self.input_shape, order="C"
             )
 
-        @functools.partial(jax.jit, static_argnums=0)
+            if self._gram_inv is not None:
+                gram_dtype = self._gram_inv.dtype
+            elif self._gram_inv_factor is not None:
+                gram_dtype = self._gram_inv_factor.dtype
+            else:
+                gram_dtype = self._gram_cho[0].dtype
+
+            k_xx = np.empty(
+                x0.shape[:1] + self.output_shape,
+                dtype=gram_dtype,
+            )
+
+            for chunk in _chunk_slices(
+                x0.shape[0],
+                self._memory_budget,
+                # `kLas(x0)` and `gram^{-1} kLas(x0)^T` (plus `kLas(x1)`)
+                bytes_per_point=(
+                    (2 if x1 is None else 3)
+                    * self._kLas.randvar_size
+                    * functools.reduce(operator.mul, self.output_shape, 1)
+                    * gram_dtype.itemsize
+                ),
+            ):
+                x0_chunk = x0[chunk]
+
+                kLas_x0 = self._kLas(x0_chunk)
+
+                if self._gram_inv is not None:
+                    # The structured Gram matrix is not factorized, so we solve with
+                    # it directly
+                    x1_chunk = None if x1 is None else x1[chunk]
+                    kLas_x1 = kLas_x0 if x1 is None else self._kLas(x1_chunk)
+
+                    k_xx[chunk] = self._prior_kernel(x0_chunk, x1_chunk) - np.sum(
+                        kLas_x0 * self._gram_inv_solve(kLas_x1),
+                        axis=-1,
+                    )
+
+                    continue
+
+                if x1 is None:
+                    # Only the marginal variances are needed, so we can get away
+                    # with a single triangular solve
+                    # `||L^{-1} kLas(x)^T||^2 = kLas(x) gram^{-1} kLas(x)^T`
+                    k_xx[chunk] = self._prior_kernel(x0_chunk, None) - np.sum(
+                        self._gram_inv_sqrt(kLas_x0) ** 2,
+                        axis=-1,
+                    )
+
+                    continue
+
+                x1_chunk = x1[chunk]
+
+                kLas_x1 = self._kLas(x1_chunk)
+
+                if self._gram_inv_factor is not None:
+                    k_xx[chunk] = self._prior_kernel(x0_chunk, x1_chunk) - np.sum(
+                        self._gram_inv_sqrt(kLas_x0) * self._gram_inv_sqrt(kLas_x1),
+                        axis=-1,
+                    )
+
+                    continue
+
+                k_xx[chunk] = (
+                    self._prior_kernel(x0_chunk, x1_chunk)
+                    - (
+                        kLas_x0[..., None, :]
+                        @ cho_solve(
+                            self._gram_cho,
+                            kLas_x1.transpose(),
+                        ).transpose()[..., :, None]
+                    )[..., 0, 0]
+                )
+
+            return k_xx.reshape(batch_shape + self.output_shape, order="C")
+
+        def _gram_inv_sqrt(self, kLas_x: np.ndarray) -> np.ndarray:
+            if self._gram_inv_factor is not None:
+                return kLas_x @ self._gram_inv_factor
+
+            return _cho_sqrt_solve(self._gram_cho, kLas_x)
+
+        def _gram_inv_solve(self, kLas_x: np.ndarray) -> np.ndarray:
+            """`kLas(x) gram^{-1}`, where `kLas_x` may have leading batch axes."""
+            gram_inv_kLas_x = self._gram_inv @ kLas_x.reshape(
+                (-1, kLas_x.shape[-1]), order="C"
+            ).T
+
+            return gram_inv_kLas_x.T.reshape(kLas_x.shape, order="C")
+
+        @jax.jit
         def _evaluate_jax(self, x0: jnp.ndarray, x1: jnp.ndarray | None) -> jnp.ndarray:
             k_xx = self._prior_kernel.jax(x0, x1)
             kLas_x0 = self._kLas.jax(x0)
+
+            if self._gram_inv_factor is not None:
+                U = _dense(self._gram_inv_factor)
+
+                U_kLas_x0 = kLas_x0 @ U
+                U_kLas_x1 = U_kLas_x0 if x1 is None else self._kLas.jax(x1) @ U
+
+                return k_xx - jnp.sum(U_kLas_x0 * U_kLas_x1, axis=-1)
+
+            if self._gram_inv is not None:
+                # There is no structured (e.g. Toeplitz) solver in JAX, so the Gram
+                # matrix is densified and factorized
+                gram_cho = jax.scipy.linalg.cho_factor(_dense(self._gram_inv.inv()))
+
+                kLas_x1 = kLas_x0 if x1 is None else self._kLas.jax(x1)
+
+                gram_inv_kLas_x1 = jax.scipy.linalg.cho_solve(
+                    gram_cho, kLas_x1.reshape((-1, kLas_x1.shape[-1])).T
+                )
+
+                return k_xx - jnp.sum(
+                    kLas_x0 * gram_inv_kLas_x1.T.reshape(kLas_x1.shape), axis=-1
+                )
+
+            if x1 is None:
+                gram_sqrt, lower = self._gram_cho
+
+                gram_sqrt_inv_kLas_x0 = jax.scipy.linalg.solve_triangular(
+                    gram_sqrt,
+                    kLas_x0.reshape((-1, kLas_x0.shape[-1])).T,
+                    lower=lower,
+                    trans="N" if lower else "T",
+                )
+
+                return k_xx - jnp.sum(gram_sqrt_inv_kLas_x0**2, axis=0).reshape(
+                    k_xx.shape
+                )
+
             kLas_x1 = self._kLas.jax(x1) if x1 is not None else kLas_x0
 
             return k_xx - kLas_x0 @ jax.scipy.linalg.cho_solve(self._gram_cho, kLas_x1)
 
+    def sample_pathwise(
+        self,
+        rng: np.random.Generator,
+        x: ArrayLike,
+        size: ShapeLike = (),
+        *,
+        prior_paths: Sequence[pn.functions.Function] | None = None,
+        num_features: int = 256,
+    ) -> np.ndarray:
+        """Draws joint samples from the posterior at the inputs `x` by correcting
+        joint samples of the prior and of the observations (Matheron's rule)
+
+        `f_post(x) = f(x) + kLas(x) gram^{-1} (Y - L[f] - b)`
+
+        using the cached representer system, i.e. the Gram matrix is only solved
+        with, in whichever representation it is stored (e.g. Cholesky factor or
+        Toeplitz). Given prior samples, a single posterior sample costs `O(M N)` for
+        `M` inputs and `N` observations (plus the solve).
+
+        If `prior_paths` are given, one posterior sample is drawn for each path.
+        Otherwise, every prior sample path is approximated by its own set of
+        `num_features` random Fourier features (see `_sample_prior_jointly`), which
+        requires a prior covariance function supported by
+        `kernels.random_fourier_features`."""
+        x = np.asarray(x)
+        batch_shape = x.shape[: x.ndim - self.input_ndim]
+
+        x = x.reshape((-1,) + self.input_shape, order="C")
+
+        if prior_paths is None:
+            size = pn.utils.as_shape(size)
+
+            f_x, Lf = self._sample_prior_jointly(rng, x, size, num_features)
+        else:
+            prior_paths = tuple(prior_paths)
+            size = (len(prior_paths),)
+
+            f_x = np.stack([prior_path(x) for prior_path in prior_paths])
+            Lf = np.stack(
+                [
+                    np.concatenate(
+                        [
+                            np.broadcast_to(L(prior_path), L.output_shape).reshape(
+                                (-1,), order="C"
+                            )
+                            for L in self._Ls
+                        ]
+                    )
+                    for prior_path in prior_paths
+                ]
+            )
+            Lf = Lf + self._sample_noise(rng, size)
+
+        # Pathwise update
+        residuals = (self._observations[None, :] - Lf.reshape((-1, Lf.shape[-1]))).T
+
+        if self._gram_inv is not None:
+            gram_inv_residuals = self._gram_inv @ residuals
+        elif self._gram_inv_factor is not None:
+            gram_inv_residuals = self._gram_inv_factor @ (
+                self._gram_inv_factor.T @ residuals
+            )
+        else:
+            gram_inv_residuals = cho_solve(self.gram_cho, residuals)
+
+        kLas_x = self._kLas(x).reshape((-1, self._kLas.randvar_size), order="C")
+
+        f_post_x = f_x.reshape((-1, kLas_x.shape[0])) + (kLas_x @ gram_inv_residuals).T
+
+        return f_post_x.reshape(size + batch_shape + self.output_shape, order="C")
+
+    def _sample_prior_jointly(
+        self,
+        rng: np.random.Generator,
+        x: np.ndarray,
+        size: ShapeType,
+        num_features: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Draws joint samples of the prior at `x` and of the (noisy) observations.
+
+        Every sample is drawn from its own random Fourier feature approximation
+        `m + w^T phi` with `w ~ N(0, I)` of the prior, to which the linear functionals
+        of the observations are applied in closed form. Since the features of
+        different samples are independent, the sample mean and covariance are
+        unbiased for any `num_features`. For `F` features, a sample costs
+        `O((M + N) F)`, and no covariance matrix needs to be factorized."""
+        num_samples = functools.reduce(operator.mul, size, 1)
+
+        m_x = np.reshape(self._prior.mean(x), (-1,), order="C")
+        Lm = np.concatenate(
+            [
+                np.broadcast_to(L(self._prior.mean), L.output_shape).reshape(
+                    (-1,), order="C"
+                )
+                for L in self._Ls
+            ]
+        )
+
+        M = m_x.shape[0]
+
+        f_x = np.empty((num_samples, M), dtype=np.double)
+        Lf = np.empty((num_samples, Lm.shape[0]), dtype=np.double)
+
+        for chunk in _chunk_slices(
+            num_samples,
+            (
+                self._memory_budget
+                if self._memory_budget is not None
+                else _PRIOR_SAMPLES_MEMORY_BUDGET
+            ),
+            # Features of the sample at `x` and of the observations
+            bytes_per_point=(M + Lm.shape[0])
+            * num_features
+            * np.dtype(np.double).itemsize,
+        ):
+            chunk_size = chunk.stop - chunk.start
+
+            # The features of all samples in the chunk are evaluated at once
+            features = [
+                random_fourier_features(self._prior.cov, num_features, rng)
+                for _ in range(chunk_size)
+            ]
+            features = FourierFeatures(
+                frequencies=np.concatenate([phi.frequencies for phi in features]),
+                coefficients=np.concatenate([phi.coefficients for phi in features]),
+            )
+
+            # shape: (M + N, chunk_size, num_features)
+            Phi = np.concatenate(
+                [np.reshape(features(x), (M, chunk_size, num_features), order="C")]
+                + [
+                    np.reshape(
+                        L(features),
+                        (L.output_size, chunk_size, num_features),
+                        order="C",
+                    )
+                    for L in self._Ls
+                ]
+            )
+
+            samples = np.einsum(
+                "ksf,sf->sk",
+                Phi,
+                rng.standard_normal(size=(chunk_size, num_features)),
+            )
+
+            f_x[chunk] = m_x + samples[:, :M]
+            Lf[chunk] = Lm + samples[:, M:]
+
+        Lf = Lf + self._sample_noise(rng, size).reshape((num_samples, -1), order="C")
+
+        return f_x.reshape(size + (M,)), Lf.reshape(size + Lm.shape)
+
+    def _sample_noise(self, rng: np.random.Generator, size: ShapeType) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.reshape(
+                    (
+                        np.zeros(size + L.output_shape)
+                        if b is None
+                        else (
+                            np.broadcast_to(b.support, size + b.shape)
+                            if isinstance(b, pn.randvars.Constant)
+                            else b.sample(rng=rng, size=size)
+                        )
+                    ),
+                    size + (-1,),
+                    order="C",
+                )
+                for L, b in zip(self._Ls, self._bs)
+            ],
+            axis=-1,
+        )
+
+    @property
+    def _observations(self) -> np.ndarray:
+        return np.concatenate(
+            [np.reshape(Y, (-1,), order="C") for Y in self._Ys],
+            axis=-1,
+        )
+
+    def remove_observations(
+        self, block_index: int
+    ) -> ConditionalGaussianProcess | pn.randprocs.GaussianProcess:
+        """Conditions the prior on all observation blocks except for the one with index
+        `block_index`. The Cholesky factor of the reduced Gram matrix is obtained by a
+        downdate of the stored factor."""
+        num_blocks = len(self._Ys)
+
+        if not -num_blocks <= block_index < num_blocks:
+            raise IndexError(
+                f"`block_index` {block_index} is out of range for {num_blocks} "
+                "observation blocks."
+            )
+
+        block_index %= num_blocks
+
+        if num_blocks == 1:
+            return self._prior
+
+        keep = tuple(i for i in range(num_blocks) if i != block_index)
+
+        Ys = tuple(self._Ys[i] for i in keep)
+        Ls = tuple(self._Ls[i] for i in keep)
+        bs = tuple(self._bs[i] for i in keep)
+        kLas = ConditionalGaussianProcess._PriorPredictiveCrossCovariance(
+            tuple(kLa for i, kLa in enumerate(self._kLas) if i != block_index)
+        )
+        gram_blocks = tuple(
+            tuple(block for j, block in enumerate(row) if j != block_index)
+            for i, row in enumerate(self._gram_blocks)
+            if i != block_index
+        )
+
+        if self._solver is not None:
+            representer_weights, gram_inv_factor = _solve_iteratively(
+                self._solver,
+                _block_gram_linop(gram_blocks),
+                np.concatenate(
+                    [
+                        self._centered_observations_block(i).reshape(
+                            (-1,), order="C"
+                        )
+                        for i in keep
+                    ]
+                ),
+            )
+
+            return ConditionalGaussianProcess(
+                prior=self._prior,
+                Ys=Ys,
+                Ls=Ls,
+                bs=bs,
+                kLas=kLas,
+                gram_blocks=gram_blocks,
+                representer_weights=representer_weights,
+                gram_inv_factor=gram_inv_factor,
+                solver=self._solver,
+                memory_budget=self._memory_budget,
+                max_blocks=self._max_blocks,
+            )
+
+        block_start = sum(L.output_size for L in self._Ls[:block_index])
+
+        return ConditionalGaussianProcess(
+            prior=self._prior,
+            Ys=Ys,
+            Ls=Ls,
+            bs=bs,
+            kLas=kLas,
+            gram_blocks=gram_blocks,
+            gram_cho=_cholesky_downdate(
+                self.gram_cho,
+                block_start,
+                block_start + self._Ls[block_index].output_size,
+            ),
+            memory_budget=self._memory_budget,
+            max_blocks=self._max_blocks,
+        )
+
     def condition_on_observations(
         self,
         Y: ArrayLike,
@@ -277,27 +1076,87 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
         L: LinearFunctional | LinearFunctionOperator | None = None,
         b: RandomVariableLike | None = None,
     ):
-        Y, L, b, kLa, pred_mean, gram = self._preprocess_observations(
-            prior=self._prior,
-            Y=Y,
-            X=X,
-            L=L,
-            b=b,
-        )
+        if self._max_blocks is not None and len(self._Ys) >= self._max_blocks:
+            if len(self._Ys) == 1:
+                # Removing the only block yields the prior, which would drop the
+                # settings of the window
+                return ConditionalGaussianProcess.from_observations(
+                    self._prior,
+                    Y,
+                    X,
+                    L=L,
+                    b=b,
+                    memory_budget=self._memory_budget,
+                    solver=self._solver,
+                    max_blocks=self._max_blocks,
+                )
 
-        # Compute lower-left block in the new kernel gram matrix
-        gram_L_La_prev_blocks = tuple(
-            L(kLa_prev).reshape((L.output_size, kLa_prev.randvar_size))
-            for kLa_prev in self._kLas
-        )
+            # Sliding window: drop the oldest block(s) to make room for the new one
+            return self.remove_observations(0).condition_on_observations(
+                Y, X, L=L, b=b
+            )
+
+        # The Gram matrix of the new observation and its cross-covariances with the
+        # previous observations share the cached differences and exponentials
+        with distance_cache:
+            Y, L, b, kLa, pred_mean, gram = self._preprocess_observations(
+                prior=self._prior,
+                Y=Y,
+                X=X,
+                L=L,
+                b=b,
+                matrix_free=self._solver is not None,
+                memory_budget=self._memory_budget,
+            )
+
+            # Compute lower-left block in the new kernel gram matrix
+            gram_L_La_prev_blocks = tuple(
+                _dense(L(kLa_prev)).reshape((L.output_size, kLa_prev.randvar_size))
+                for kLa_prev in self._kLas
+            )
         gram_L_row_blocks = gram_L_La_prev_blocks + (gram,)
 
+        if self._solver is not None:
+            # Rerun the solver on the full system, since the low-rank approximation of
+            # the inverse can not be updated blockwise
+            gram_blocks = self._gram_blocks + (gram_L_row_blocks,)
+
+            representer_weights, gram_inv_factor = _solve_iteratively(
+                self._solver,
+                linops.BlockMatrix(
+                    A=self.gram_linop,
+                    B=np.concatenate(gram_L_La_prev_blocks, axis=-1).T,
+                    C=np.concatenate(gram_L_La_prev_blocks, axis=-1),
+                    D=gram,
+                ),
+                np.concatenate(
+                    (
+                        self._centered_observations,
+                        (Y - pred_mean).reshape((-1,), order="C"),
+                    )
+                ),
+            )
+
+            return ConditionalGaussianProcess(
+                prior=self._prior,
+                Ys=self._Ys + (Y,),
+                Ls=self._Ls + (L,),
+                bs=self._bs + (b,),
+                kLas=self._kLas.append(kLa),
+                gram_blocks=gram_blocks,
+                representer_weights=representer_weights,
+                gram_inv_factor=gram_inv_factor,
+                solver=self._solver,
+                memory_budget=self._memory_budget,
+                max_blocks=self._max_blocks,
+            )
+
         # Update the Cholesky decomposition of the previous kernel Gram matrix and the
         # representer weights
         gram_cho, representer_weights = _block_cholesky(
             A_cho=self.gram_cho,
             B=np.concatenate(gram_L_La_prev_blocks, axis=-1).T,
-            D=gram,
+            D=_dense(gram),
             sol_update=(
                 self.representer_weights,
                 (Y - pred_mean).reshape((-1,), order="C"),
@@ -313,6 +1172,8 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
             gram_blocks=self._gram_blocks + (gram_L_row_blocks,),
             gram_cho=gram_cho,
             representer_weights=representer_weights,
+            memory_budget=self._memory_budget,
+            max_blocks=self._max_blocks,
         )
 
     @classmethod
@@ -324,13 +1185,16 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
         X: ArrayLike | None,
         L: LinearFunctional | LinearFunctionOperator | None,
         b: RandomVariableLike | None,
+        matrix_free: bool = False,
+        memory_budget: int | None = None,
+        compute_gram: bool = True,
     ) -> tuple[
         np.ndarray,
         LinearFunctional,
         pn.randvars.Normal | pn.randvars.Constant | None,
         ProcessVectorCrossCovariance,
         np.ndarray,
-        np.ndarray,
+        np.ndarray | pn.linops.LinearOperator | None,
     ]:
         # TODO: Allow `RandomProcessLike` for `b` ("b = b(X)")
 
@@ -381,19 +1245,96 @@ class ConditionalGaussianProcess(pn.randprocs.GaussianProcess):
         if Y.shape != L.output_shape:
             raise ValueError(f"{Y.shape=} must be equal to {L.output_shape}.")
 
-        # Compute the joint measure (f, L[f])
-        Lf = L(prior)
         kLa = L(prior.cov, argnum=1)
 
+        if not compute_gram:
+            pred_mean = L(prior.mean)
+
+            if b is not None:
+                pred_mean = pred_mean + b.mean
+
+            return Y, L, b, kLa, pred_mean, None
+
         # Compute predictive mean and kernel Gram matrix
+        with distance_cache:
+            pred_mean, gram = _predictive_mean_and_gram(
+                prior,
+                L,
+                b,
+                kLa,
+                matrix_free=matrix_free,
+                memory_budget=memory_budget,
+            )
+
+        return Y, L, b, kLa, pred_mean, gram
+
+
+def _predictive_mean_and_gram(
+    prior: pn.randprocs.GaussianProcess,
+    L: LinearFunctional,
+    b: pn.randvars.Normal | pn.randvars.Constant | None,
+    kLa: ProcessVectorCrossCovariance,
+    *,
+    matrix_free: bool,
+    memory_budget: int | None,
+) -> tuple[np.ndarray, np.ndarray | pn.linops.LinearOperator]:
+    """Predictive mean and Gram matrix of the observation `L[f] + b`, where the Gram
+    matrix is returned in the most structured representation available."""
+    gram = _kronecker_gram(
+        prior,
+        L,
+        noise_cov=b.cov if b is not None else None,
+    )
+
+    if gram is None:
+        gram = _sparse_gram(
+            prior,
+            L,
+            noise_cov=b.cov if b is not None else None,
+        )
+
+    if gram is None:
+        gram = _toeplitz_gram(
+            prior,
+            L,
+            noise_cov=b.cov if b is not None else None,
+            # For small Gram matrices, a dense Cholesky factorization is faster than
+            # the Levinson recursion
+            min_size=2 if matrix_free else _TOEPLITZ_GRAM_MIN_SIZE,
+        )
+
+    if gram is None and matrix_free:
+        gram = _matrix_free_gram(
+            prior,
+            L,
+            kLa,
+            noise_cov=b.cov if b is not None else None,
+            memory_budget=memory_budget,
+        )
+
+    if gram is not None:
+        pred_mean = L(prior.mean)
+
+        if b is not None:
+            pred_mean = pred_mean + b.mean
+    else:
+        # Compute the joint measure (f, L[f])
+        Lf = L(prior)
+
         pred_mean = Lf.mean
-        gram = np.atleast_2d(Lf.cov)
+        gram = Lf.cov
+
+        if not isinstance(gram, linops.SymmetricBanded):
+            gram = np.atleast_2d(gram)
 
         if b is not None:
             pred_mean = pred_mean + b.mean
-            gram = gram + b.cov
+            gram = _add_noise_cov(gram, b.cov)
 
-        return Y, L, b, kLa, pred_mean, gram
+        if matrix_free:
+            gram = pn.linops.aslinop(gram)
+
+    return pred_mean, gram
 
 
 pn.randprocs.GaussianProcess.condition_on_observations = (
@@ -421,7 +1362,7 @@ def _(
     self, crosscov: ConditionalGaussianProcess._PriorPredictiveCrossCovariance, /
 ) -> ConditionalGaussianProcess._PriorPredictiveCrossCovariance:
     return np.concatenate(
-        [self(kLa) for kLa in crosscov],
+        [_dense(self(kLa)) for kLa in crosscov],
         axis=-1,
     )
 
@@ -443,8 +1384,13 @@ def _(
         bs=conditional_gp._bs,
         kLas=self(conditional_gp._kLas),
         gram_blocks=conditional_gp._gram_blocks,
-        gram_cho=conditional_gp.gram_cho,
+        gram_cho=conditional_gp._gram_cho,
         representer_weights=conditional_gp.representer_weights,
+        gram_inv_factor=conditional_gp.gram_inv_factor,
+        gram_inv=conditional_gp.gram_inv,
+        solver=conditional_gp.solver,
+        memory_budget=conditional_gp.memory_budget,
+        max_blocks=conditional_gp.max_blocks,
     )
 
 
@@ -460,13 +1406,601 @@ def _(
     crosscov = self(conditional_gp._kLas)
 
     mean = linfunctl_prior.mean + crosscov @ conditional_gp.representer_weights
-    cov = linfunctl_prior.cov - crosscov @ scipy.linalg.cho_solve(
-        conditional_gp.gram_cho, crosscov.T
-    )
+
+    if conditional_gp.gram_inv is not None:
+        cov = _dense(linfunctl_prior.cov) - crosscov @ (
+            conditional_gp.gram_inv @ crosscov.T
+        )
+    elif conditional_gp.gram_inv_factor is not None:
+        U_crosscov = crosscov @ conditional_gp.gram_inv_factor
+
+        cov = _dense(linfunctl_prior.cov) - U_crosscov @ U_crosscov.T
+    else:
+        cov = _dense(linfunctl_prior.cov) - crosscov @ scipy.linalg.cho_solve(
+            conditional_gp.gram_cho, crosscov.T
+        )
 
     return pn.randvars.Normal(mean, cov)
 
 
+def _solve_iteratively(
+    solver: ProbabilisticLinearSolver,
+    gram: pn.linops.LinearOperator | np.ndarray,
+    rhs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # The posterior covariance needs a low-rank approximation `U @ U.T` of the inverse
+    # Gram matrix, which is only maintained by solvers with a
+    # `LowRankInverseBelief`, e.g. `LowRankCG`
+    if not isinstance(solver, ProbabilisticLinearSolver):
+        raise TypeError(
+            f"`solver` must be a `ProbabilisticLinearSolver` ({type(solver)=}). Use "
+            "`linpde_gp.linalg.solvers.LowRankCG` for iterative conditioning."
+        )
+
+    for belief, _, _ in solver.solve_iter(pn.problems.LinearSystem(gram, rhs)):
+        # Check the prior belief before running any iterations
+        if not isinstance(belief, LowRankInverseBelief):
+            raise TypeError(
+                f"The solver's belief ({type(belief)=}) does not provide a low-rank "
+                "approximation of the inverse of the Gram matrix. Use "
+                "`linpde_gp.linalg.solvers.LowRankCG` for iterative conditioning."
+            )
+
+    return belief.x.mean, belief.inverse_approx_factor
+
+
+def _joint_gram_blocks(
+    Ls: Sequence[LinearFunctional],
+    kLas: Sequence[ProcessVectorCrossCovariance],
+    bs: Sequence[pn.randvars.Normal | pn.randvars.Constant | None],
+) -> tuple[tuple[np.ndarray, ...], ...]:
+    """Lower triangle of the Gram matrix of the joint observations `Ls[i](f) + bs[i]`.
+
+    The blocks :math:`L_i k L_j^*` are obtained by applying `Ls[i]` to the prior
+    predictive cross-covariances `kLas[j]`. For point evaluations, every block
+    evaluates a derivative kernel on its own pair of input sets, so the
+    `kernels.distance_cache` only shares the differences and exponentials within a
+    block, e.g. between the factors of a derivative kernel, and between blocks of
+    functionals with the same input arrays."""
+    gram_blocks = []
+
+    with distance_cache:
+        for i, (L, b) in enumerate(zip(Ls, bs)):
+            row = [
+                np.reshape(
+                    # The diagonal blocks are symmetric
+                    _dense(self_covariance(L, kLa) if j == i else L(kLa)),
+                    (L.output_size, kLa.randvar_size),
+                    order="C",
+                )
+                for j, kLa in enumerate(kLas[: i + 1])
+            ]
+
+            if b is not None:
+                row[-1] = row[-1] + b.cov
+
+            gram_blocks.append(tuple(row))
+
+    return tuple(gram_blocks)
+
+
+# Gram matrices, whose inverse factor `U` with `U @ U.T = gram.inv()` is computed
+# directly from their structure
+_FACTORIZED_GRAM_TYPES = (
+    linops.KroneckerProduct,
+    linops.SymmetricBanded,
+    linops.SymmetricSparse,
+)
+
+# Gram matrices, whose linear systems are solved directly from their structure without
+# factorizing them, e.g. Toeplitz systems by the Levinson recursion
+_SOLVED_GRAM_TYPES = (linops.SymmetricToeplitz,)
+
+
+def _sparse_gram(
+    prior: pn.randprocs.GaussianProcess,
+    L: LinearFunctional,
+    noise_cov: np.ndarray | pn.linops.LinearOperator | None,
+) -> linops.SymmetricSparse | None:
+    """Sparse Gram matrix of point evaluations of a GP with a compactly supported
+    covariance function (see `_sparse_gram_blocks`). Returns `None` if this structure
+    is not present."""
+    blocks = _sparse_gram_blocks(prior, (L,), (noise_cov,))
+
+    if blocks is None:
+        return None
+
+    return linops.SymmetricSparse(blocks[0][0])
+
+
+def _sparse_gram_blocks(
+    prior: pn.randprocs.GaussianProcess,
+    Ls: Sequence[LinearFunctional],
+    noise_covs: Sequence[np.ndarray | pn.linops.LinearOperator | None],
+) -> list[list[scipy.sparse.csr_matrix]] | None:
+    """If all observations are point evaluations (of linear function operators applied
+    to the GP) with i.i.d. noise and all kernels :math:`L_i k L_j^*` are compactly
+    supported (e.g. for a `Wendland` prior), the blocks of the joint Gram matrix are
+    sparse. They are assembled from the pairs of inputs within the support radius,
+    which are found by a KD-tree. Returns `None` if this structure is not present."""
+    k, scale = prior.cov, 1.0
+
+    if isinstance(k, JaxScaledKernel):
+        k, scale = k.kernel, k.scalar
+
+    if not isinstance(k, CompactlySupportedKernelMixin):
+        return None
+
+    point_linfuncops, Xs, noise_vars = [], [], []
+
+    for L, noise_cov in zip(Ls, noise_covs):
+        if isinstance(L, linfunctls.DiracFunctional):
+            linfuncop, X = None, L.X
+        elif (
+            isinstance(L, linfunctls.CompositeLinearFunctional)
+            and L.linop is None
+            and isinstance(L.linfunctl, linfunctls.DiracFunctional)
+        ):
+            linfuncop, X = L.linfuncop, L.linfunctl.X
+        else:
+            return None
+
+        noise_var = _iid_noise_variance(noise_cov, L.output_size)
+
+        if noise_var is None:
+            return None
+
+        point_linfuncops.append(linfuncop)
+        Xs.append(X.reshape((-1,) + prior.input_shape, order="C"))
+        noise_vars.append(noise_var)
+
+    blocks = [[None] * len(Ls) for _ in Ls]
+
+    for i, (linfuncop_i, X_i) in enumerate(zip(point_linfuncops, Xs)):
+        for j, (linfuncop_j, X_j) in enumerate(zip(point_linfuncops[: i + 1], Xs)):
+            LkL = k
+
+            if linfuncop_j is not None:
+                LkL = linfuncop_j(LkL, argnum=1)
+
+            if linfuncop_i is not None:
+                LkL = linfuncop_i(LkL, argnum=0)
+
+            if not isinstance(LkL, CompactlySupportedKernelMixin):
+                return None
+
+            if j == i:
+                blocks[i][i] = scale * LkL.sparse_matrix(X_i) + noise_vars[
+                    i
+                ] * scipy.sparse.identity(X_i.shape[0], format="csr")
+            else:
+                blocks[i][j] = scale * LkL.sparse_matrix(X_i, X_j)
+                blocks[j][i] = blocks[i][j].T.tocsr()
+
+    return blocks
+
+
+# Default memory budget (in bytes) for the row blocks of matrix-free Gram matrices
+_MATRIX_FREE_GRAM_MEMORY_BUDGET = 2**27
+
+
+def _matrix_free_gram(
+    prior: pn.randprocs.GaussianProcess,
+    L: LinearFunctional,
+    kLa: ProcessVectorCrossCovariance,
+    noise_cov: np.ndarray | pn.linops.LinearOperator | None,
+    memory_budget: int | None,
+) -> _MatrixFreeGram | _SKIGram | None:
+    """Returns `None` if `L` does not consist of point evaluations (of a linear
+    function operator applied to the GP)."""
+    if isinstance(L, linfunctls.DiracFunctional):
+        LkLa = kLa
+        LkL = prior.cov
+        X = L.X
+    elif (
+        isinstance(L, linfunctls.CompositeLinearFunctional)
+        and L.linop is None
+        and isinstance(L.linfunctl, linfunctls.DiracFunctional)
+    ):
+        LkLa = kLa if L.linfuncop is None else L.linfuncop(kLa)
+        LkL = prior.cov if L.linfuncop is None else L.linfuncop(prior).cov
+        X = L.linfunctl.X
+    else:
+        return None
+
+    X = X.reshape((-1,) + L.input_domain_shape, order="C")
+
+    if isinstance(LkL, SKIKernel):
+        noise_var = _iid_noise_variance(noise_cov, X.shape[0])
+
+        if noise_var is not None:
+            return _SKIGram(LkL, X, noise_var)
+
+    return _MatrixFreeGram(
+        LkLa=LkLa,
+        LkL=LkL,
+        X=X,
+        noise_cov=noise_cov,
+        memory_budget=memory_budget,
+    )
+
+
+# Minimum number of observations for which the Gram matrix is represented as a
+# (never densified) Toeplitz matrix if conditioning without an iterative solver
+_TOEPLITZ_GRAM_MIN_SIZE = 1024
+
+
+def _toeplitz_gram(
+    prior: pn.randprocs.GaussianProcess,
+    L: LinearFunctional,
+    noise_cov: np.ndarray | pn.linops.LinearOperator | None,
+    min_size: int = 2,
+) -> linops.SymmetricToeplitz | None:
+    """If the (scalar) observations are point evaluations (of a linear function
+    operator applied to the GP) on a uniform 1D grid and the kernel `L k L^*` is
+    stationary (e.g. a scaled `Matern` prior), the Gram matrix is symmetric Toeplitz,
+    so it is fully determined by its first column. Returns `None` if this structure
+    is not present or if there are less than `min_size` observations."""
+    if isinstance(L, linfunctls.DiracFunctional):
+        LkL = prior.cov
+        X = L.X
+    elif (
+        isinstance(L, linfunctls.CompositeLinearFunctional)
+        and L.linop is None
+        and isinstance(L.linfunctl, linfunctls.DiracFunctional)
+    ):
+        LkL = prior.cov if L.linfuncop is None else L.linfuncop(prior).cov
+        X = L.linfunctl.X
+    else:
+        return None
+
+    k = LkL.kernel if isinstance(LkL, JaxScaledKernel) else LkL
+
+    if not isinstance(k, JaxStationaryMixin) or LkL.output_shape != ():
+        return None
+
+    if LkL.input_shape not in ((), (1,)):
+        return None
+
+    X = X.reshape((-1,) + LkL.input_shape, order="C")
+    N = X.shape[0]
+
+    if N < max(min_size, 2):
+        return None
+
+    dX = np.diff(X.reshape((N,)))
+
+    if not np.allclose(dX, dX[0], rtol=1e-10, atol=0.0) or dX[0] == 0.0:
+        return None
+
+    noise_var = _iid_noise_variance(noise_cov, N)
+
+    if noise_var is None:
+        return None
+
+    c = np.array(LkL(X[:1], X), dtype=np.double).reshape((N,))
+    c[0] += noise_var
+
+    return linops.SymmetricToeplitz(c)
+
+
+def _kronecker_gram(
+    prior: pn.randprocs.GaussianProcess,
+    L: LinearFunctional,
+    noise_cov: np.ndarray | pn.linops.LinearOperator | None,
+) -> linops.KroneckerProduct | None:
+    """If the prior covariance is a separable kernel (e.g. `ProductMatern`) and the
+    observations are point evaluations on a tensor grid `X` of shape
+    `(n_1, ..., n_D, D)` (as returned by `Box.uniform_grid`), the Gram matrix is the
+    Kronecker product of the `D` one-dimensional Gram matrices on the grid axes.
+    Returns `None` if this structure is not present."""
+    if not isinstance(L, linfunctls.DiracFunctional) or prior.input_ndim != 1:
+        return None
+
+    D = prior.input_shape[0]
+    X = L.X
+
+    if X.ndim != D + 1 or D < 2:
+        return None
+
+    # Coordinates of the grid points along each axis
+    axis_coords = tuple(
+        X[(0,) * i + (slice(None),) + (0,) * (D - i - 1) + (i,)] for i in range(D)
+    )
+
+    if not np.array_equal(
+        X, np.stack(np.meshgrid(*axis_coords, indexing="ij"), axis=-1)
+    ):
+        return None
+
+    noise_var = _iid_noise_variance(noise_cov, X.size // D)
+
+    if noise_var is None:
+        return None
+
+    factors = tensor_grid_gram_factors(prior.cov, axis_coords)
+
+    if factors is None:
+        return None
+
+    return linops.KroneckerProduct(factors, shift=noise_var)
+
+
+def _iid_noise_variance(
+    noise_cov: np.ndarray | pn.linops.LinearOperator | None, N: int
+) -> float | None:
+    """Returns the variance of i.i.d. noise with covariance `noise_cov` (`0.0` if
+    there is no noise), or `None` if the noise is not i.i.d."""
+    if noise_cov is None:
+        return 0.0
+
+    if isinstance(noise_cov, pn.linops.Scaling) and noise_cov.is_isotropic:
+        return noise_cov.scalar
+
+    if isinstance(noise_cov, np.ndarray):
+        noise_cov = np.atleast_2d(noise_cov).reshape((N, N))
+        noise_var = noise_cov[0, 0]
+
+        if np.any(np.diag(noise_cov) != noise_var) or np.count_nonzero(
+            noise_cov
+        ) > np.count_nonzero(np.diag(noise_cov)):
+            return None
+
+        return noise_var
+
+    return None
+
+
+class _MatrixFreeGram(pn.linops.LinearOperator):
+    """Kernel Gram matrix (plus noise covariance) of point evaluations, whose
+    matrix-vector products evaluate the kernel in row blocks instead of storing the
+    full matrix.
+
+    The diagonal and single columns are exposed as cheap oracles, e.g. for pivoted
+    Cholesky preconditioners."""
+
+    def __init__(
+        self,
+        LkLa: ProcessVectorCrossCovariance,
+        LkL: pn.randprocs.kernels.Kernel,
+        X: np.ndarray,
+        noise_cov: np.ndarray | pn.linops.LinearOperator | None = None,
+        memory_budget: int | None = None,
+    ):
+        self._LkLa = LkLa
+        self._LkL = LkL
+        self._X = X
+
+        N = self._LkLa.randvar_size
+
+        self._rows_per_point = N // self._X.shape[0]
+
+        # I.i.d. noise is stored as a scalar variance. Other noise covariances are
+        # applied as given, i.e. without densifying linear operators.
+        self._noise_var = _iid_noise_variance(noise_cov, N)
+        self._noise_cov = None
+
+        if self._noise_var is None:
+            self._noise_var = 0.0
+            self._noise_cov = (
+                np.atleast_2d(noise_cov).reshape((N, N))
+                if isinstance(noise_cov, np.ndarray)
+                else noise_cov
+            )
+
+        self._memory_budget = (
+            memory_budget
+            if memory_budget is not None
+            else _MATRIX_FREE_GRAM_MEMORY_BUDGET
+        )
+
+        super().__init__(
+            shape=(N, N),
+            dtype=np.double,
+            matmul=self._matmul,
+            todense=self._todense,
+            transpose=lambda: self,
+        )
+
+    def _rows(self, X: np.ndarray) -> np.ndarray:
+        return self._LkLa(X).reshape((-1, self.shape[1]), order="C")
+
+    def _matmul(self, v: np.ndarray) -> np.ndarray:
+        res = np.empty_like(v, shape=(self.shape[0],) + v.shape[1:], dtype=np.double)
+
+        for chunk in _chunk_slices(
+            self._X.shape[0],
+            self._memory_budget,
+            bytes_per_point=self._rows_per_point * self.shape[1] * v.itemsize,
+        ):
+            res[
+                chunk.start * self._rows_per_point : chunk.stop * self._rows_per_point
+            ] = (self._rows(self._X[chunk]) @ v)
+
+        if self._noise_var != 0.0:
+            res += self._noise_var * v
+
+        if self._noise_cov is not None:
+            res += self._noise_cov @ v
+
+        return res
+
+    def _todense(self) -> np.ndarray:
+        gram = np.array(self._rows(self._X), dtype=np.double)
+
+        if self._noise_var != 0.0:
+            gram[np.diag_indices_from(gram)] += self._noise_var
+
+        if self._noise_cov is not None:
+            gram = gram + _dense(self._noise_cov)
+
+        return gram
+
+    def diagonal(self) -> np.ndarray:
+        if self._rows_per_point == 1:
+            diag = np.asarray(self._LkL(self._X, None), dtype=np.double).reshape(-1)
+        else:
+            diag = np.concatenate(
+                [
+                    np.diagonal(
+                        self._rows(self._X[i : i + 1])[
+                            :,
+                            i * self._rows_per_point : (i + 1) * self._rows_per_point,
+                        ]
+                    )
+                    for i in range(self._X.shape[0])
+                ]
+            )
+
+        diag = diag + self._noise_var
+
+        if isinstance(self._noise_cov, pn.linops.Scaling):
+            diag = diag + self._noise_cov.factors
+        elif self._noise_cov is not None:
+            diag = diag + np.diag(_dense(self._noise_cov))
+
+        return diag
+
+    def column(self, i: int) -> np.ndarray:
+        # The Gram matrix is symmetric, so we can evaluate the `i`-th row instead
+        point_idx, row_idx = divmod(i, self._rows_per_point)
+
+        col = np.array(
+            self._rows(self._X[point_idx : point_idx + 1])[row_idx], dtype=np.double
+        )
+        col[i] += self._noise_var
+
+        if self._noise_cov is not None:
+            e_i = np.zeros(self.shape[1], dtype=np.double)
+            e_i[i] = 1.0
+
+            col += self._noise_cov @ e_i
+
+        return col
+
+
+class _SKIGram(pn.linops.LinearOperator):
+    """Gram matrix `W K_grid W^T + noise_var * I` of point evaluations of a
+    `SKIKernel`, where `W` is the sparse interpolation matrix. Matrix-vector products
+    cost `O(N)` plus a structured matrix-vector product with `K_grid`."""
+
+    def __init__(self, kernel: SKIKernel, X: np.ndarray, noise_var: float = 0.0):
+        self._kernel = kernel
+        self._X = X
+        self._noise_var = noise_var
+
+        self._W = kernel.interpolation_matrix(X)
+        self._grid_gram = kernel.grid_gram
+
+        N = self._W.shape[0]
+
+        super().__init__(
+            shape=(N, N),
+            dtype=np.double,
+            matmul=lambda v: (
+                self._W @ (self._grid_gram @ (self._W.T @ v)) + self._noise_var * v
+            ),
+            todense=lambda: (
+                self._W @ (self._grid_gram @ self._W.T.toarray())
+                + self._noise_var * np.eye(N)
+            ),
+            transpose=lambda: self,
+        )
+
+    def diagonal(self) -> np.ndarray:
+        return self._kernel(self._X, None) + self._noise_var
+
+    def column(self, i: int) -> np.ndarray:
+        col = self._W @ (self._grid_gram @ self._W[i].toarray()[0])
+        col[i] += self._noise_var
+
+        return col
+
+
+def _add_noise_cov(
+    gram: np.ndarray | linops.SymmetricBanded,
+    noise_cov: np.ndarray | pn.linops.LinearOperator,
+) -> np.ndarray | linops.SymmetricBanded:
+    """Adds the noise covariance to the Gram matrix. I.i.d. noise preserves the sparsity
+    of banded Gram matrices."""
+    if isinstance(gram, linops.SymmetricBanded):
+        N = gram.shape[0]
+        noise_var = _iid_noise_variance(noise_cov, N)
+
+        if noise_var is not None:
+            return linops.SymmetricBanded(
+                gram.A + noise_var * scipy.sparse.identity(N, format="csr")
+            )
+
+        gram = gram.todense()
+
+    return gram + noise_cov
+
+
+def _dense(A: np.ndarray | pn.linops.LinearOperator) -> np.ndarray:
+    if isinstance(A, pn.linops.LinearOperator):
+        return A.todense()
+
+    return A
+
+
+def _block_gram_linop(
+    gram_blocks: Sequence[Sequence[np.ndarray | pn.linops.LinearOperator]],
+) -> pn.linops.LinearOperator:
+    gram = pn.linops.aslinop(gram_blocks[0][0])
+
+    for row in gram_blocks[1:]:
+        gram_L_La_prev = np.concatenate([_dense(block) for block in row[:-1]], axis=-1)
+
+        gram = linops.BlockMatrix(
+            A=gram,
+            B=gram_L_La_prev.T,
+            C=gram_L_La_prev,
+            D=pn.linops.aslinop(row[-1]),
+        )
+
+    return gram
+
+
+# Default memory budget (in bytes) for the random features of the prior samples drawn
+# at once by `ConditionalGaussianProcess.sample_pathwise`
+_PRIOR_SAMPLES_MEMORY_BUDGET = 2**26
+
+
+def _chunk_slices(
+    num_points: int,
+    memory_budget: int | None,
+    bytes_per_point: int,
+) -> Iterator[slice]:
+    """Split the indices of a flattened batch of `num_points` test inputs into
+    contiguous chunks, such that the intermediate arrays needed for a single chunk
+    occupy at most `memory_budget` bytes (but contain at least one point)."""
+    if memory_budget is None:
+        chunk_size = max(num_points, 1)
+    else:
+        chunk_size = max(memory_budget // max(bytes_per_point, 1), 1)
+
+    for start in range(0, num_points, chunk_size):
+        yield slice(start, min(start + chunk_size, num_points))
+
+
+def _cho_sqrt_solve(L, b: np.ndarray) -> np.ndarray:
+    """Applies the inverse of the (lower-triangular) Cholesky factor stored in `L`
+    to the last axis of `b`."""
+    (L, lower) = L
+
+    b_flat = b.reshape((-1, b.shape[-1]), order="C")
+
+    res = scipy.linalg.solve_triangular(
+        L,
+        b_flat.T,
+        lower=lower,
+        trans="N" if lower else "T",
+    )
+
+    return res.T.reshape(b.shape, order="C")
+
+
 def cho_solve(L, b):
     """Fixes a bug in scipy.linalg.cho_solve"""
     (L, lower) = L
@@ -496,6 +2030,59 @@ def _schur_update(A_cho, B, C, D, A_inv_u, v):
     return jnp.concatenate((x, y))
 
 
+def _cholesky_downdate(
+    A_cho: tuple[np.ndarray, bool],
+    start: int,
+    stop: int,
+) -> tuple[np.ndarray, bool]:
+    """Cholesky factor of `A` with the rows and columns `start:stop` removed, given
+    the Cholesky factor of `A`.
+
+    With `A = R^T R` and `R` partitioned into blocks `R_ij` according to `start` and
+    `stop`, the factor of the reduced matrix is `[[R_11, R_13], [0, R_33']]`, where
+    `R_33'^T R_33' = R_23^T R_23 + R_33^T R_33` is a rank-`(stop - start)` update of
+    `R_33`. It is computed by a QR decomposition of `[[R_33], [R_23]]`, which exploits
+    that `R_33` is triangular (LAPACK's `tpqrt`), so it costs `O((stop - start) N^2)`
+    instead of `O(N^3)`."""
+    A_sqrt, lower = A_cho
+
+    # Upper Cholesky factor `R`, i.e. `A = R^T R`
+    R = np.tril(A_sqrt).T if lower else np.triu(A_sqrt)
+
+    N = R.shape[0]
+
+    R_down = np.empty_like(R, shape=(N - (stop - start), N - (stop - start)))
+
+    R_down[:start, :start] = R[:start, :start]
+    R_down[:start, start:] = R[:start, stop:]
+    R_down[start:, :start] = 0.0
+
+    if stop < N:
+        R_33, _, _, info = scipy.linalg.lapack.dtpqrt(
+            0,
+            min(64, N - stop),
+            np.asfortranarray(R[stop:, stop:], dtype=np.double),
+            np.asfortranarray(R[start:stop, stop:], dtype=np.double),
+            overwrite_a=True,
+            overwrite_b=True,
+        )
+
+        if info != 0:
+            raise np.linalg.LinAlgError(
+                f"The QR decomposition of the Cholesky update failed ({info=})."
+            )
+
+        # Make the diagonal positive
+        R_33 *= np.where(np.diag(R_33) < 0.0, -1.0, 1.0)[:, None]
+
+        R_down[start:, start:] = np.triu(R_33)
+
+    if lower:
+        return R_down.T, True
+
+    return R_down, False
+
+
 def _block_cholesky(
     A_cho: tuple[np.ndarray, bool],
     B: np.ndarray,
@@ -4,26 +4,74 @@ import probnum as pn
 from linpde_gp.linfuncops import LinearFunctionOperator
 from linpde_gp.linfunctls import LinearFunctional
 
+from ..crosscov.linfunctls import self_covariance
+from ._parametric import ParametricGaussianProcess
+
 
 @LinearFunctional.__call__.register  # pylint: disable=no-member
-def _(self, gp: pn.randprocs.GaussianProcess, /) -> pn.randvars.Normal:
+def _apply_linfunctl(self, gp: pn.randprocs.GaussianProcess, /) -> pn.randvars.Normal:
     mean = self(gp.mean)
     crosscov = self(gp.cov, argnum=1)
-    cov = self(crosscov)
+    cov = self_covariance(self, crosscov)
 
     assert isinstance(mean, (np.ndarray, np.number))
-    assert isinstance(cov, (np.ndarray, np.number))
+    assert isinstance(cov, (np.ndarray, np.number, pn.linops.LinearOperator))
 
-    if mean.ndim > 0:
+    if mean.ndim > 0 and not isinstance(cov, pn.linops.LinearOperator):
         cov = cov.reshape((mean.size, mean.size), order="C")
 
     return pn.randvars.Normal(mean, cov)
 
 
 @LinearFunctionOperator.__call__.register  # pylint: disable=no-member
-def _(self, gp: pn.randprocs.GaussianProcess, /) -> pn.randprocs.GaussianProcess:
+def _apply_linfuncop(
+    self, gp: pn.randprocs.GaussianProcess, /
+) -> pn.randprocs.GaussianProcess:
     mean = self(gp.mean)
     crosscov = self(gp.cov, argnum=1)
     cov = self(crosscov, argnum=0)
 
     return pn.randprocs.GaussianProcess(mean, cov)
+
+
+# The linear transforms of a parametric Gaussian process only act on its features
+
+
+@LinearFunctional.__call__.register  # pylint: disable=no-member
+def _(self, gp: ParametricGaussianProcess, /) -> pn.randvars.Normal:
+    try:
+        Phi = self(gp.feature_fn)
+    except NotImplementedError:
+        return _apply_linfunctl(self, gp)
+
+    Phi = np.reshape(Phi, (self.output_size, -1), order="C")
+
+    if isinstance(gp.mean, ParametricGaussianProcess.Mean):
+        mean = np.reshape(Phi @ gp.weights.mean, self.output_shape, order="C")
+    else:
+        mean = self(gp.mean)
+
+    cov = Phi @ (gp.weights.cov @ Phi.T)
+
+    if self.output_shape == ():
+        cov = cov[0, 0]
+
+    return pn.randvars.Normal(mean, cov)
+
+
+@LinearFunctionOperator.__call__.register  # pylint: disable=no-member
+def _(self, gp: ParametricGaussianProcess, /) -> pn.randprocs.GaussianProcess:
+    try:
+        feature_fn = self(gp.feature_fn)
+    except NotImplementedError:
+        return _apply_linfuncop(self, gp)
+
+    return ParametricGaussianProcess(
+        weights=gp.weights,
+        feature_fn=feature_fn,
+        mean=(
+            None
+            if isinstance(gp.mean, ParametricGaussianProcess.Mean)
+            else self(gp.mean)
+        ),
+    )
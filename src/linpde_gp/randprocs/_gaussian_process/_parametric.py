@@ -1,8 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
 from typing import Optional
 
 import numpy as np
 import probnum as pn
 from probnum.typing import ArrayLike
+import scipy.linalg
+
+from linpde_gp import functions, linfunctls
+from linpde_gp.linfuncops import LinearFunctionOperator
+from linpde_gp.linfunctls import LinearFunctional
+from linpde_gp.randprocs.kernels import random_fourier_features, spectral_density
+from linpde_gp.typing import DomainLike, RandomVariableLike
+
+from ._conditional import _iid_noise_variance
 
 
 class ParametricGaussianProcess(pn.randprocs.GaussianProcess):
@@ -29,6 +41,139 @@ class ParametricGaussianProcess(pn.randprocs.GaussianProcess):
             ),
         )
 
+    @classmethod
+    def from_random_fourier_features(
+        cls,
+        kernel: pn.randprocs.kernels.Kernel,
+        num_features: int,
+        rng: np.random.Generator,
+    ) -> ParametricGaussianProcess:
+        """Zero-mean approximation of a Gaussian process with covariance function
+        `kernel` by `num_features` random Fourier features, i.e. a Bayesian linear
+        model with standard normal weights."""
+        return cls(
+            weights=pn.randvars.Normal(
+                mean=np.zeros(num_features),
+                cov=np.eye(num_features),
+            ),
+            feature_fn=random_fourier_features(kernel, num_features, rng),
+        )
+
+    @classmethod
+    def from_laplace_eigenfunctions(
+        cls,
+        kernel: pn.randprocs.kernels.Kernel,
+        domain: DomainLike,
+        num_frequencies: int | Sequence[int],
+    ) -> ParametricGaussianProcess:
+        """Zero-mean reduced-rank approximation of a Gaussian process with stationary
+        covariance function `kernel` on an interval or a box by the eigenfunctions of
+        the Dirichlet Laplacian (Solin and Särkkä, 2020).
+
+        The weights are independent and their variances are given by the spectral
+        density of the kernel at the frequencies of the eigenfunctions. Samples of the
+        process satisfy homogeneous Dirichlet boundary conditions."""
+        basis = functions.bases.SineBasis(domain, num_frequencies)
+
+        return cls(
+            weights=pn.randvars.Normal(
+                mean=np.zeros(len(basis)),
+                cov=pn.linops.Scaling(
+                    spectral_density(kernel, basis.frequencies) / basis.squared_l2_norms
+                ),
+            ),
+            feature_fn=basis,
+        )
+
+    @property
+    def weights(self) -> pn.randvars.Normal:
+        return self._weights
+
+    @property
+    def feature_fn(self) -> pn.functions.Function:
+        return self._feature_fn
+
+    def condition_on_observations(
+        self,
+        Y: ArrayLike,
+        X: ArrayLike | None = None,
+        *,
+        L: LinearFunctional | LinearFunctionOperator | None = None,
+        b: RandomVariableLike | None = None,
+    ) -> pn.randprocs.GaussianProcess:
+        """Conditions the weights on (noisy) observations of the process.
+
+        This is equivalent to conditioning the Gaussian process itself, but, for
+        :math:`N` observations and :math:`F` features, it only costs
+        :math:`O(N F^2)` if the noise is i.i.d. Without noise, or if the mean is not
+        induced by the weights, the conditional process is computed in function space.
+        """
+        if b is not None:
+            b = pn.randvars.asrandvar(b)
+
+        if (
+            not isinstance(b, pn.randvars.Normal)
+            or not isinstance(self.mean, ParametricGaussianProcess.Mean)
+            or _iid_noise_variance(b.cov, b.size) == 0.0
+        ):
+            return super().condition_on_observations(Y, X, L=L, b=b)
+
+        if L is None:
+            L = linfunctls.DiracFunctional(
+                input_domain_shape=self.input_shape,
+                input_codomain_shape=self.output_shape,
+                X=X,
+            )
+        elif isinstance(L, LinearFunctionOperator):
+            L = L.to_linfunctl(X)
+
+        Y = np.asarray(Y)
+
+        if Y.shape != L.output_shape:
+            raise ValueError(f"{Y.shape=} must be equal to {L.output_shape}.")
+
+        if b.shape != L.output_shape:
+            raise ValueError(f"{b.shape=} must be equal to {L.output_shape}")
+
+        Phi = np.reshape(L(self._feature_fn), (L.output_size, -1), order="C")
+
+        noise_var = _iid_noise_variance(b.cov, L.output_size)
+
+        if noise_var is not None:
+            R_inv_Phi = Phi / noise_var
+        else:
+            R_inv_Phi = scipy.linalg.cho_solve(
+                scipy.linalg.cho_factor(_todense(b.cov)), Phi
+            )
+
+        # With the prior covariance `Σ = S S^T` of the weights, the posterior
+        # covariance is `S A^{-1} S^T`, where `A = I + S^T Φ^T R^{-1} Φ S`
+        S = _todense(self._weights.cov_cholesky)
+        m0 = self._weights.mean
+
+        S_T_Phi_T_R_inv = S.T @ R_inv_Phi.T
+
+        A_chol = scipy.linalg.cholesky(
+            np.eye(S.shape[1]) + S_T_Phi_T_R_inv @ (Phi @ S),
+            lower=True,
+        )
+
+        A_chol_inv_S_T = scipy.linalg.solve_triangular(A_chol, S.T, lower=True)
+
+        residual = (Y - b.mean).reshape((-1,), order="C") - Phi @ m0
+
+        return ParametricGaussianProcess(
+            weights=pn.randvars.Normal(
+                mean=m0
+                + A_chol_inv_S_T.T
+                @ scipy.linalg.solve_triangular(
+                    A_chol, S_T_Phi_T_R_inv @ residual, lower=True
+                ),
+                cov=A_chol_inv_S_T.T @ A_chol_inv_S_T,
+            ),
+            feature_fn=self._feature_fn,
+        )
+
     class Mean(pn.functions.Function):
         def __init__(
             self, weights: pn.randvars.Normal, feature_fn: pn.functions.Function
@@ -91,3 +236,10 @@ class ParametricGaussianProcess(pn.randprocs.GaussianProcess):
             assert isinstance(phi_x1_Sigma, np.ndarray)
 
             return (phi_x0[..., None, :] @ phi_x1_Sigma[..., :, None])[..., 0, 0]
+
+
+def _todense(A: np.ndarray | pn.linops.LinearOperator) -> np.ndarray:
+    if isinstance(A, pn.linops.LinearOperator):
+        return A.todense()
+
+    return np.atleast_2d(A)
@@ -10,8 +10,10 @@ import numpy as np
 import probnum as pn
 from probnum.typing import ArrayLike, ShapeLike, ShapeType
 
+from ..._pytree import JaxPyTreeMixin
 
-class ProcessVectorCrossCovariance(abc.ABC):
+
+class ProcessVectorCrossCovariance(JaxPyTreeMixin, abc.ABC):
     def __init__(
         self,
         randproc_input_shape: ShapeLike,
@@ -1,2 +1,3 @@
 from . import _arithmetic, _linfunctl, integrals, projections
 from ._dirac import Kernel_Dirac_Indentity, Kernel_Identity_Dirac
+from ._self_covariance import self_covariance
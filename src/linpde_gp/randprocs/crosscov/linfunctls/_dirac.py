@@ -127,7 +127,7 @@ class Kernel_Identity_Dirac(ProcessVectorCrossCovariance):
 
         assert X.shape == X_batch_shape + self._kernel.input_shape
 
-        kxX = self._kernel(x, X)
+        kxX = self._kernel.jax(x, X)
 
         assert kxX.shape == (
             x_batch_shape + X_batch_shape + x_output_shape + X_output_shape
@@ -265,7 +265,7 @@ class Kernel_Dirac_Indentity(ProcessVectorCrossCovariance):
             self._dirac.X_batch_shape + x_batch_ndim * (1,) + self._kernel.input_shape
         )
 
-        kxX = self._kernel(x, X)
+        kxX = self._kernel.jax(x, X)
 
         assert kxX.shape == (
             X_batch_shape + x_batch_shape + X_output_shape + x_output_shape
@@ -0,0 +1,488 @@
+r"""Closed-form integrals of half-integer Matérn kernels against hat functions.
+
+In terms of the scaled distance :math:`s = \sqrt{2p + 1} r / l`, a Matérn kernel with
+:math:`\nu = p + \frac{1}{2}` is given by :math:`P_p(s) e^{-s}` (see
+:mod:`~linpde_gp.randprocs.kernels._matern_polynomials`). On every cell of the grid,
+the hat functions are linear. After shifting the integration variables to the ends of
+the cells closest to each other, all integrals hence reduce to sums of
+
+.. math::
+    J_n(w) = \int_0^w u^n e^{-u} \, du = n! \, \gamma(n + 1, w) / \Gamma(n + 1),
+
+weighted by the Taylor coefficients of :math:`P_p` at the distance :math:`D \ge 0`
+between the cells. All of these weights are nonnegative, which makes the closed forms
+numerically stable, even on fine grids.
+
+On uniform grids, the integrals over pairs of cells only depend on the offset between
+the cells. Hence, the matrix of double integrals is Toeplitz, except for the rows and
+columns of basis functions at the boundary, and it is assembled from the integrals
+between the first and all other cells in this case.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.special
+
+from linpde_gp import functions
+from linpde_gp.linops._banded import sparsify
+from linpde_gp.randprocs.kernels._matern_polynomials import matern_polynomial
+
+
+class MaternHatFunctionIntegrals:
+    def __init__(
+        self,
+        basis: functions.bases.UnivariateLinearInterpolationBasis,
+        p: int,
+        lengthscale: float,
+    ) -> None:
+        self._basis = basis
+        self._p = int(p)
+        self._scale_factor = np.sqrt(2 * self._p + 1) / lengthscale
+
+        # Coefficients of `P_p` in order of increasing degree
+        self._poly_coeffs = matern_polynomial(self._p)[::-1]
+
+        grid = self._scale_factor * basis.grid
+
+        # Without the zero boundary, the outermost cells only cover the sentinel grid
+        # points, on which all basis functions vanish
+        first_cell_idx = 0
+
+        if not basis.zero_boundary:
+            grid = grid[1:-1]
+            first_cell_idx = 1
+
+        self._cells_lower = grid[:-1]
+        self._cells_upper = grid[1:]
+        self._cells_widths = self._cells_upper - self._cells_lower
+
+        # The `i`-th basis function rises on cell `i` and falls off on cell `i + 1`,
+        # so the pieces on the `k`-th (remaining) cell belong to the basis functions
+        # with indices `k + offset`
+        self._basis_idx_offsets = (first_cell_idx, first_cell_idx - 1)
+
+    @property
+    def basis(self) -> functions.bases.UnivariateLinearInterpolationBasis:
+        return self._basis
+
+    @property
+    def p(self) -> int:
+        return self._p
+
+    def integrate_kernel(self, x: np.ndarray) -> np.ndarray:
+        r"""Integrals :math:`\int \phi_i(t) k(x, t) \, dt` for all basis functions.
+
+        The result has shape `x.shape + (len(basis),)`."""
+        x = self._scale_factor * np.asarray(x)[..., None]
+
+        a, b, h = self._cells_lower, self._cells_upper, self._cells_widths
+
+        # Part of the cells right of `x`, integrated from its left end
+        c = np.maximum(a, x)
+        right = self._shifted_integral(
+            dist=c - x,
+            width=np.maximum(b, x) - c,
+            weights_ascending=((c - a) / h, 1.0 / h),
+            weights_descending=((b - c) / h, -1.0 / h),
+        )
+
+        # Part of the cells left of `x`, integrated from its right end
+        d = np.minimum(b, x)
+        left = self._shifted_integral(
+            dist=x - d,
+            width=d - np.minimum(a, x),
+            weights_ascending=((d - a) / h, -1.0 / h),
+            weights_descending=((b - d) / h, 1.0 / h),
+        )
+
+        res = np.zeros(x.shape[:-1] + (len(self._basis),))
+
+        for piece in range(2):
+            cells, basis_idcs = self._piece_slices(piece)
+
+            res[..., basis_idcs] += right[piece][..., cells] + left[piece][..., cells]
+
+        return res / self._scale_factor
+
+    def integrate_kernel_pairwise(
+        self, drop_tol: float | None = None
+    ) -> np.ndarray | scipy.sparse.csr_matrix:
+        r"""Double integrals :math:`\iint \phi_i(t_0) k(t_0, t_1) \phi_j(t_1) \, dt_1
+        \, dt_0` for all pairs of basis functions.
+
+        If `drop_tol` is given, a sparse matrix is returned, which only contains the
+        entries whose magnitude exceeds `drop_tol` times the largest magnitude. On
+        uniform grids, only the retained diagonals are assembled."""
+        widths = self._cells_widths
+
+        # The widths of the cells of uniform grids (e.g. from `np.linspace`) are only
+        # equal up to the rounding errors in the grid points
+        if np.allclose(
+            widths,
+            widths[0],
+            rtol=1e-12,
+            atol=16 * np.finfo(widths.dtype).eps * np.max(np.abs(self._cells_upper)),
+        ):
+            integrals, boundary_rows = self._toeplitz_integrals()
+
+            if drop_tol is not None:
+                return self._assemble_banded(integrals, boundary_rows, drop_tol)
+
+            num_basis_fns = len(self._basis)
+
+            res = scipy.linalg.toeplitz(
+                integrals[num_basis_fns - 1 :: -1], integrals[num_basis_fns - 1 :]
+            )
+
+            for basis_idx, row in boundary_rows.items():
+                res[basis_idx, :] = row
+                res[:, basis_idx] = row
+        else:
+            cell_pair_integrals = self._cell_pair_integrals()
+
+            res = np.zeros((len(self._basis), len(self._basis)))
+
+            for piece0 in range(2):
+                cells0, basis_idcs0 = self._piece_slices(piece0)
+
+                for piece1 in range(2):
+                    cells1, basis_idcs1 = self._piece_slices(piece1)
+
+                    res[basis_idcs0, basis_idcs1] += cell_pair_integrals[piece0][
+                        piece1
+                    ][cells0, cells1]
+
+        res /= self._scale_factor**2
+
+        if drop_tol is not None:
+            return sparsify(res, drop_tol)
+
+        return res
+
+    def _piece_slices(self, piece: int) -> tuple[slice, slice]:
+        """Slices of the cells and of the basis functions they belong to for the
+        ascending (`0`) and descending (`1`) pieces of the hat functions."""
+        offset = self._basis_idx_offsets[piece]
+
+        cells = slice(
+            max(0, -offset), min(self._cells_lower.size, len(self._basis) - offset)
+        )
+
+        return cells, slice(cells.start + offset, cells.stop + offset)
+
+    def _cell_pair_integrals(self):
+        """Integrals of the kernel against the linear pieces of the hat functions on all
+        pairs of cells, indexed by the pieces (ascending, descending) on both cells."""
+        num_cells = self._cells_lower.size
+
+        # Integrals for the second cell to the right of the first
+        left_idcs, right_idcs = np.triu_indices(num_cells, k=1)
+
+        separated = self._separated_cells_integrals(
+            self._cells_lower[right_idcs] - self._cells_upper[left_idcs],
+            left_idcs=left_idcs,
+            right_idcs=right_idcs,
+        )
+
+        same_cell = self._same_cell_integrals()
+
+        def _assemble(piece0: int, piece1: int) -> np.ndarray:
+            res = np.diag(same_cell[piece0][piece1])
+
+            res[left_idcs, right_idcs] = separated[piece0][piece1]
+            res[right_idcs, left_idcs] = separated[piece1][piece0]
+
+            return res
+
+        return tuple(
+            tuple(_assemble(piece0, piece1) for piece1 in range(2))
+            for piece0 in range(2)
+        )
+
+    def _toeplitz_integrals(self) -> tuple[np.ndarray, dict[int, np.ndarray]]:
+        """Double integrals on a uniform grid for all offsets `-(N - 1), ..., N - 1`
+        between the indices of the basis functions and the rows of the basis functions
+        at the boundary, which differ from the Toeplitz structure (unscaled)."""
+        num_cells = self._cells_lower.size
+        num_basis_fns = len(self._basis)
+
+        # Integrals between the first cell and all cells to its right
+        right_idcs = np.arange(1, num_cells)
+        separated = self._separated_cells_integrals(
+            np.maximum(self._cells_lower[1:] - self._cells_upper[0], 0.0),
+            left_idcs=np.zeros_like(right_idcs),
+            right_idcs=right_idcs,
+        )
+
+        same_cell = self._same_cell_integrals()
+
+        # Integrals over pairs of cells with offsets `-num_cells - 1, ..., num_cells + 1`
+        # between them. The padding is only accessed for basis functions, which are
+        # missing one of their pieces. Their integrals are recomputed below.
+        padding = np.zeros(2)
+        center = num_cells + 1
+
+        offset_integrals = tuple(
+            tuple(
+                np.concatenate(
+                    (
+                        padding,
+                        separated[piece1][piece0][::-1],
+                        [same_cell[piece0][piece1][0]],
+                        separated[piece0][piece1],
+                        padding,
+                    )
+                )
+                for piece1 in range(2)
+            )
+            for piece0 in range(2)
+        )
+
+        # The integrals only depend on the offset between the indices of the basis
+        # functions
+        basis_idx_offsets = np.arange(-(num_basis_fns - 1), num_basis_fns)
+
+        integrals = sum(
+            offset_integrals[piece0][piece1][
+                center
+                + basis_idx_offsets
+                + self._basis_idx_offsets[piece0]
+                - self._basis_idx_offsets[piece1]
+            ]
+            for piece0 in range(2)
+            for piece1 in range(2)
+        )
+
+        # Without the zero boundary, the outermost basis functions only have one piece
+        boundary_rows = {}
+
+        for basis_idx in {0, num_basis_fns - 1}:
+            cells0 = [
+                (piece0, basis_idx - offset0)
+                for piece0, offset0 in enumerate(self._basis_idx_offsets)
+                if 0 <= basis_idx - offset0 < num_cells
+            ]
+
+            if len(cells0) == 2:
+                continue
+
+            row = np.zeros(num_basis_fns)
+
+            for piece0, cell0 in cells0:
+                for piece1, offset1 in enumerate(self._basis_idx_offsets):
+                    cells1 = np.arange(num_basis_fns) - offset1
+
+                    row += np.where(
+                        (0 <= cells1) & (cells1 < num_cells),
+                        offset_integrals[piece0][piece1][center + cells1 - cell0],
+                        0.0,
+                    )
+
+            boundary_rows[basis_idx] = row
+
+        return integrals, boundary_rows
+
+    def _assemble_banded(
+        self,
+        integrals: np.ndarray,
+        boundary_rows: dict[int, np.ndarray],
+        drop_tol: float,
+    ) -> scipy.sparse.csr_matrix:
+        num_basis_fns = len(self._basis)
+
+        threshold = drop_tol * max(
+            [np.max(np.abs(integrals))]
+            + [np.max(np.abs(row)) for row in boundary_rows.values()]
+        )
+
+        # The integrals decay with the distance between the basis functions, so only
+        # the diagonals up to the last retained one are assembled
+        (retained,) = np.nonzero(np.abs(integrals[num_basis_fns - 1 :]) > threshold)
+        bandwidth = retained[-1] if retained.size > 0 else 0
+
+        diag_offsets = np.arange(-bandwidth, bandwidth + 1)
+
+        band = scipy.sparse.diags(
+            [
+                np.full(
+                    num_basis_fns - abs(diag_offset),
+                    integrals[num_basis_fns - 1 + diag_offset],
+                )
+                for diag_offset in diag_offsets
+            ],
+            diag_offsets,
+            shape=(num_basis_fns, num_basis_fns),
+            format="coo",
+        )
+
+        # Replace the rows and columns of the boundary basis functions
+        boundary_idcs = np.array(list(boundary_rows.keys()), dtype=int)
+        in_band = ~(np.isin(band.row, boundary_idcs) | np.isin(band.col, boundary_idcs))
+
+        rows, cols, data = (
+            [band.row[in_band]],
+            [band.col[in_band]],
+            [band.data[in_band]],
+        )
+
+        for basis_idx, row in boundary_rows.items():
+            (idcs,) = np.nonzero(row)
+
+            rows.append(np.full_like(idcs, basis_idx))
+            cols.append(idcs)
+            data.append(row[idcs])
+
+            # The column, except for the entries in the rows of the boundary basis
+            # functions
+            idcs = idcs[~np.isin(idcs, boundary_idcs)]
+
+            rows.append(idcs)
+            cols.append(np.full_like(idcs, basis_idx))
+            data.append(row[idcs])
+
+        rows, cols, data = (np.concatenate(arrs) for arrs in (rows, cols, data))
+
+        retained = np.abs(data) > threshold
+
+        return scipy.sparse.csr_matrix(
+            (data[retained] / self._scale_factor**2, (rows[retained], cols[retained])),
+            shape=(num_basis_fns, num_basis_fns),
+        )
+
+    def _separated_cells_integrals(self, dists, left_idcs, right_idcs):
+        r"""Integrals over pairs of cells with disjoint interiors, where the second
+        cell lies at distance `dists` to the right of the first.
+
+        With :math:`w` and :math:`v` denoting the distances of the integration
+        variables to the gap between the cells, the integrand factorizes after
+        expanding :math:`P_p(D + v + w)` by the binomial theorem."""
+        taylor_coeffs = self._taylor_coeffs(dists)
+        degree = len(taylor_coeffs) - 1
+
+        # On the left cell, the ascending piece is one at the gap, while on the right
+        # cell, it is the descending piece
+        moments_near, moments_far = self._moments(degree)
+
+        moments_left = (moments_near[:, left_idcs], moments_far[:, left_idcs])
+        moments_right = (moments_far[:, right_idcs], moments_near[:, right_idcs])
+
+        return tuple(
+            tuple(
+                np.exp(-dists)
+                * sum(
+                    taylor_coeffs[n]
+                    * sum(
+                        math.comb(n, m)
+                        * moments_left[piece0][n - m]
+                        * moments_right[piece1][m]
+                        for m in range(n + 1)
+                    )
+                    for n in range(degree + 1)
+                )
+                for piece1 in range(2)
+            )
+            for piece0 in range(2)
+        )
+
+    def _same_cell_integrals(self):
+        r"""Integrals of both pieces against each other over each cell.
+
+        For :math:`t_1 > t_0`, substituting :math:`\tau = t_1 - t_0` leaves the
+        integral of :math:`P_p(\tau) e^{-\tau}` against the polynomial
+        :math:`W(\tau) = \int_0^{h - \tau} p(s) q(s + \tau) \, ds`. The case
+        :math:`t_1 < t_0` follows by exchanging the roles of the pieces."""
+        h = self._cells_widths
+
+        # Linear pieces `c_0 + c_1 s` in local coordinates
+        pieces = ((0.0, 1.0 / h), (1.0, -1.0 / h))
+
+        # Powers of `h - tau`, `tau (h - tau)` and `tau (h - tau)^2` in terms of `tau`
+        L1 = (h, -1.0)
+        L2 = (h**2, -2.0 * h, 1.0)
+        L3 = (h**3, -3.0 * h**2, 3.0 * h, -1.0)
+        tau_L1 = (0.0, h, -1.0)
+        tau_L2 = (0.0, h**2, -2.0 * h, 1.0)
+
+        def _W(p, q):
+            (p0, p1), (q0, q1) = p, q
+
+            return _poly_add(
+                _poly_scale(p0 * q0, L1),
+                _poly_scale(p0 * q1, tau_L1),
+                _poly_scale((p0 * q1 + p1 * q0) / 2, L2),
+                _poly_scale(p1 * q1 / 2, tau_L2),
+                _poly_scale(p1 * q1 / 3, L3),
+            )
+
+        def _integrate(W):
+            coeffs = _poly_mul(self._poly_coeffs, W)
+
+            return sum(coeff * _J(n, h) for n, coeff in enumerate(coeffs))
+
+        return tuple(
+            tuple(
+                _integrate(_W(pieces[piece0], pieces[piece1]))
+                + _integrate(_W(pieces[piece1], pieces[piece0]))
+                for piece1 in range(2)
+            )
+            for piece0 in range(2)
+        )
+
+    def _shifted_integral(self, dist, width, weights_ascending, weights_descending):
+        r""":math:`e^{-D} \int_0^w (c_0 + c_1 u) P_p(D + u) e^{-u} \, du` for the
+        weights :math:`(c_0, c_1)` of both pieces."""
+        taylor_coeffs = self._taylor_coeffs(dist)
+        J = [_J(n, width) for n in range(len(taylor_coeffs) + 1)]
+
+        return tuple(
+            np.exp(-dist)
+            * sum(
+                taylor_coeff * (c0 * J[n] + c1 * J[n + 1])
+                for n, taylor_coeff in enumerate(taylor_coeffs)
+            )
+            for c0, c1 in (weights_ascending, weights_descending)
+        )
+
+    def _taylor_coeffs(self, dist):
+        """Coefficients of the Taylor expansion of `P_p` around `dist`."""
+        return [
+            sum(
+                math.comb(m, n) * self._poly_coeffs[m] * dist ** (m - n)
+                for m in range(n, len(self._poly_coeffs))
+            )
+            for n in range(len(self._poly_coeffs))
+        ]
+
+    def _moments(self, degree: int):
+        """Moments of the pieces, which are one (`near`) and zero (`far`) at the end of
+        the cell from which the integration variable is measured."""
+        h = self._cells_widths
+        J = np.stack([_J(n, h) for n in range(degree + 2)])
+
+        return J[:-1] - J[1:] / h, J[1:] / h
+
+
+def _J(n: int, w):
+    return math.factorial(n) * scipy.special.gammainc(n + 1, w)
+
+
+def _poly_scale(factor, coeffs):
+    return tuple(factor * coeff for coeff in coeffs)
+
+
+def _poly_add(*polys):
+    return tuple(
+        sum(poly[i] for poly in polys if i < len(poly))
+        for i in range(max(len(poly) for poly in polys))
+    )
+
+
+def _poly_mul(coeffs0, coeffs1):
+    return _poly_add(
+        *((0.0,) * i + _poly_scale(coeff0, coeffs1) for i, coeff0 in enumerate(coeffs0))
+    )
@@ -0,0 +1,123 @@
+import functools
+from types import ModuleType
+
+from jax import numpy as jnp
+import numpy as np
+import probnum as pn
+
+from linpde_gp.linfunctls import (
+    CompositeLinearFunctional,
+    DiracFunctional,
+    LinearFunctional,
+)
+
+from .._pv_crosscov import ProcessVectorCrossCovariance
+from ._dirac import Kernel_Identity_Dirac
+
+# Number of points per block of the tiled evaluation of symmetric kernel matrices
+_BLOCK_SIZE = 512
+
+
+@functools.singledispatch
+def self_covariance(
+    L: LinearFunctional, kLa: ProcessVectorCrossCovariance, /, *, xp: ModuleType = np
+):
+    """Covariance :math:`L[k]L^*` of :math:`L[f]` given the cross-covariance `kLa`
+    :math:`= k L^*` between :math:`f` and :math:`L[f]`.
+
+    The covariance function :math:`k` of :math:`f` must be symmetric. Then, so is the
+    result, which is exploited for point evaluations (possibly of a linear function
+    operator applied to :math:`f`) by only evaluating the upper triangle of the kernel
+    matrix. `xp` selects the backend (`numpy` or `jax.numpy`)."""
+    return L(kLa) if xp is np else xp.asarray(L(kLa))
+
+
+@self_covariance.register
+def _(L: DiracFunctional, kLa: ProcessVectorCrossCovariance, /, *, xp=np):
+    if (
+        not isinstance(kLa, Kernel_Identity_Dirac)
+        or kLa.dirac is not L
+        or kLa.kernel.output_shape != ()
+    ):
+        return self_covariance.dispatch(LinearFunctional)(L, kLa, xp=xp)
+
+    return _symmetric_kernel_matrix(kLa.kernel, L.X, xp=xp)
+
+
+@self_covariance.register
+def _(L: CompositeLinearFunctional, kLa: ProcessVectorCrossCovariance, /, *, xp=np):
+    if (
+        L.linop is not None
+        or not isinstance(kLa, Kernel_Identity_Dirac)
+        or kLa.dirac is not L.linfunctl
+    ):
+        return self_covariance.dispatch(LinearFunctional)(L, kLa, xp=xp)
+
+    # `kLa` is `D[k L^*]` with `L = D ∘ L'`, so `L'[kLa] = D[L' k L^*]`, where the
+    # kernel `L' k L^*` is symmetric
+    if L.linfuncop is not None:
+        kLa = L.linfuncop(kLa)
+
+    return self_covariance(L.linfunctl, kLa, xp=xp)
+
+
+def _symmetric_kernel_matrix(
+    kernel: pn.randprocs.kernels.Kernel, X: np.ndarray, *, xp: ModuleType
+):
+    X_batch_shape = X.shape[: X.ndim - kernel.input_ndim]
+
+    X = X.reshape((-1,) + kernel.input_shape, order="C")
+    N = X.shape[0]
+
+    blocks = [slice(start, start + _BLOCK_SIZE) for start in range(0, N, _BLOCK_SIZE)]
+
+    if xp is jnp:
+        k_blocks = [[None] * len(blocks) for _ in blocks]
+
+        for i, block_i in enumerate(blocks):
+            k_blocks[i][i] = _symmetric_block(kernel, X[block_i], xp=jnp)
+
+            for j, block_j in enumerate(blocks[i + 1 :], i + 1):
+                k_blocks[i][j] = kernel.jax(X[block_i, None], X[None, block_j])
+                k_blocks[j][i] = k_blocks[i][j].T
+
+        gram = jnp.block(k_blocks)
+    else:
+        gram = np.empty((N, N), dtype=np.result_type(X, np.double))
+
+        for i, block_i in enumerate(blocks):
+            gram[block_i, block_i] = _symmetric_block(kernel, X[block_i], xp=np)
+
+            for block_j in blocks[i + 1 :]:
+                gram[block_i, block_j] = kernel(X[block_i, None], X[None, block_j])
+                gram[block_j, block_i] = gram[block_i, block_j].T
+
+    return gram.reshape(X_batch_shape + X_batch_shape, order="C")
+
+
+def _symmetric_block(
+    kernel: pn.randprocs.kernels.Kernel, X: np.ndarray, *, xp: ModuleType
+):
+    # Only the pairs in the upper triangle are evaluated. Mirroring them also makes
+    # the block exactly symmetric, which is not guaranteed by all kernel
+    # implementations due to rounding.
+    rows, cols = np.triu_indices(X.shape[0])
+
+    if xp is jnp:
+        k_triu = kernel.jax(X[rows], X[cols])
+
+        return (
+            jnp.zeros((X.shape[0], X.shape[0]), dtype=k_triu.dtype)
+            .at[rows, cols]
+            .set(k_triu)
+            .at[cols, rows]
+            .set(k_triu)
+        )
+
+    k_triu = kernel(X[rows], X[cols])
+
+    block = np.empty((X.shape[0], X.shape[0]), dtype=k_triu.dtype)
+    block[rows, cols] = k_triu
+    block[cols, rows] = k_triu
+
+    return block
@@ -1 +1,6 @@
-from ._matern_lebesgue import Matern_Identity_LebesgueIntegral
+from ._expquad_lebesgue import ExpQuad_Identity_LebesgueIntegral
+from ._matern_lebesgue import (
+    Matern_Identity_LebesgueIntegral,
+    ProductMatern_Identity_LebesgueIntegral,
+)
+from ._separable import SeparableKernel_Identity_LebesgueIntegral
@@ -0,0 +1,46 @@
+from types import ModuleType
+
+from jax import numpy as jnp
+import jax.scipy.special
+import numpy as np
+import scipy.special
+
+from linpde_gp import linfunctls
+from linpde_gp.randprocs import kernels
+
+from ._separable import SeparableKernel_Identity_LebesgueIntegral
+
+
+class ExpQuad_Identity_LebesgueIntegral(SeparableKernel_Identity_LebesgueIntegral):
+    def __init__(
+        self,
+        expquad: kernels.ExpQuad,
+        integral: linfunctls.LebesgueIntegral,
+        reverse: bool = False,
+    ):
+        super().__init__(expquad, integral, reverse=reverse)
+
+        self._lengthscales = np.broadcast_to(
+            self._kernel.lengthscales, self._kernel.input_shape
+        )
+
+    @property
+    def expquad(self) -> kernels.ExpQuad:
+        return self._kernel
+
+    def _antiderivatives(self, tau, /, *, order: int, xp: ModuleType = np):
+        erf = jax.scipy.special.erf if xp is jnp else scipy.special.erf
+
+        ell = self._lengthscales
+        z = tau / (np.sqrt(2) * ell)
+
+        # ∫_0^τ exp(-t² / (2 l²)) dt = sqrt(π / 2) l erf(τ / (sqrt(2) l))
+        erf_term = np.sqrt(np.pi / 2) * ell * erf(z)
+
+        if order == 1:
+            return erf_term
+
+        if order == 2:
+            return tau * erf_term + ell**2 * xp.expm1(-(z**2))
+
+        raise ValueError(f"`order` must either be 1 or 2 ({order=}).")
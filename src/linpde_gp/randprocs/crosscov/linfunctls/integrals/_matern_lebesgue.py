@@ -1,128 +1,108 @@
+import math
+from types import ModuleType
+
 from jax import numpy as jnp
+import jax.scipy.special
 import numpy as np
-from probnum.typing import ScalarType
+import scipy.special
 
 from linpde_gp import linfunctls
 from linpde_gp.randprocs import kernels
+from linpde_gp.randprocs.kernels._matern_polynomials import matern_polynomial
 
-from ... import _pv_crosscov
+from ._separable import SeparableKernel_Identity_LebesgueIntegral
 
 
-class Matern_Identity_LebesgueIntegral(_pv_crosscov.ProcessVectorCrossCovariance):
+class Matern_Identity_LebesgueIntegral(SeparableKernel_Identity_LebesgueIntegral):
     def __init__(
         self,
         matern: kernels.Matern,
         integral: linfunctls.LebesgueIntegral,
         reverse: bool = False,
     ):
-        self._matern = matern
-        self._integral = integral
-        self._reverse = bool(reverse)
-
-        assert self._matern.input_shape == self._integral.input_domain_shape
+        # Isotropic Matérn kernels only factorize over a single dimension
+        if matern.input_size != 1:
+            raise ValueError(
+                f"The input of the Matérn kernel must be one-dimensional "
+                f"({matern.input_shape=})."
+            )
 
-        super().__init__(
-            randproc_input_shape=self._matern.input_shape,
-            randproc_output_shape=(),
-            randvar_shape=self._integral.output_shape,
-            reverse=reverse,
-        )
+        super().__init__(matern, integral, reverse=reverse)
 
     @property
     def matern(self) -> kernels.Matern:
-        return self._matern
+        return self._kernel
+
+    def _antiderivatives(self, tau, /, *, order: int, xp: ModuleType = np):
+        return _matern_antiderivatives(
+            tau,
+            p=self._kernel.p,
+            scale_factors=np.sqrt(2 * self._kernel.p + 1) / self._kernel.lengthscale,
+            order=order,
+            xp=xp,
+        )
 
-    @property
-    def integral(self) -> linfunctls.LebesgueIntegral:
-        return self._integral
 
-    def _evaluate(self, x: np.ndarray) -> np.ndarray:
-        ell = self._matern.lengthscale
-        a, b = self._integral.domain
+class ProductMatern_Identity_LebesgueIntegral(
+    SeparableKernel_Identity_LebesgueIntegral
+):
+    def __init__(
+        self,
+        matern: kernels.ProductMatern,
+        integral: linfunctls.LebesgueIntegral,
+        reverse: bool = False,
+    ):
+        super().__init__(matern, integral, reverse=reverse)
 
-        # adapted from `probnum.quad.kernel_embeddings._matern_lebesgue`
-        return (
-            1.0
-            / (105.0 * ell**2)
-            * (
-                96.0 * np.sqrt(7.0) * ell**3
-                - np.exp(np.sqrt(7.0) * (x - b) / ell)
-                * (
-                    48.0 * np.sqrt(7.0) * ell**3
-                    - 231.0 * ell**2 * (x - b)
-                    + 63.0 * np.sqrt(7.0) * ell * (x - b) ** 2
-                    - 49.0 * (x - b) ** 3
-                )
-                - np.exp(np.sqrt(7.0) * (a - x) / ell)
-                * (
-                    48.0 * np.sqrt(7.0) * ell**3
-                    + 231.0 * ell**2 * (x - a)
-                    + 63.0 * np.sqrt(7.0) * ell * (x - a) ** 2
-                    + 49.0 * (x - a) ** 3
-                )
-            )
+    @property
+    def matern(self) -> kernels.ProductMatern:
+        return self._kernel
+
+    def _antiderivatives(self, tau, /, *, order: int, xp: ModuleType = np):
+        return _matern_antiderivatives(
+            tau,
+            p=self._kernel.p,
+            scale_factors=np.broadcast_to(
+                np.sqrt(2 * self._kernel.p + 1) / self._kernel.lengthscales,
+                self._kernel.input_shape,
+            ),
+            order=order,
+            xp=xp,
         )
 
-    def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
-        ell = self._matern.lengthscale
-        a, b = self._integral.domain
 
-        # adapted from `probnum.quad.kernel_embeddings._matern_lebesgue`
+def _matern_antiderivatives(
+    tau, p: int, scale_factors: np.ndarray, order: int, xp: ModuleType
+):
+    r"""Antiderivatives of the factors :math:`P_p(\alpha |\tau|) e^{-\alpha |\tau|}`.
+
+    With :math:`J_m(s) = \int_0^s u^m e^{-u} \, du = m! \, \gamma(m + 1, s) /
+    \Gamma(m + 1)`, the first antiderivative is the odd function given by
+    :math:`\alpha^{-1} \sum_m c_m J_m(s)` for :math:`s = \alpha \tau \ge 0`. Since
+    :math:`\int_0^s J_m(u) \, du = s J_m(s) - J_{m + 1}(s)`, the second
+    antiderivative is the even function given by :math:`\alpha^{-2} \sum_m c_m (s
+    J_m(s) - J_{m + 1}(s))`. All coefficients :math:`c_m` of :math:`P_p` are
+    nonnegative."""
+    gammainc = jax.scipy.special.gammainc if xp is jnp else scipy.special.gammainc
+
+    s = scale_factors * xp.abs(tau)
+
+    # Coefficients of `P_p` in order of increasing degree
+    coeffs = matern_polynomial(p)[::-1]
+
+    J = [math.factorial(m) * gammainc(m + 1, s) for m in range(len(coeffs) + order - 1)]
+
+    if order == 1:
         return (
-            1.0
-            / (105.0 * ell**2)
-            * (
-                96.0 * jnp.sqrt(7.0) * ell**3
-                - jnp.exp(jnp.sqrt(7.0) * (x - b) / ell)
-                * (
-                    48.0 * jnp.sqrt(7.0) * ell**3
-                    - 231.0 * ell**2 * (x - b)
-                    + 63.0 * jnp.sqrt(7.0) * ell * (x - b) ** 2
-                    - 49.0 * (x - b) ** 3
-                )
-                - jnp.exp(jnp.sqrt(7.0) * (a - x) / ell)
-                * (
-                    48.0 * jnp.sqrt(7.0) * ell**3
-                    + 231.0 * ell**2 * (x - a)
-                    + 63.0 * jnp.sqrt(7.0) * ell * (x - a) ** 2
-                    + 49.0 * (x - a) ** 3
-                )
-            )
+            xp.sign(tau)
+            * sum(coeff * J[m] for m, coeff in enumerate(coeffs))
+            / scale_factors
         )
 
-
-@linfunctls.LebesgueIntegral.__call__.register(  # pylint: disable=no-member
-    Matern_Identity_LebesgueIntegral
-)
-def _(self, pv_crosscov: Matern_Identity_LebesgueIntegral, /) -> ScalarType:
-    if self.domain != pv_crosscov.integral.domain:
-        raise NotImplementedError()
-
-    # adapted from `probnum.quad.kernel_embeddings._matern_lebesgue`
-    ell = pv_crosscov.matern.lengthscale
-    a, b = self.domain
-    c = np.sqrt(7.0) * (b - a)
-
-    return (
-        1.0
-        / (105.0 * ell)
-        * (
-            2.0
-            * np.exp(-c / ell)
-            * (
-                7.0 * np.sqrt(7.0) * (b**3 - a**3)
-                + 84.0 * b**2 * ell
-                + 57.0 * np.sqrt(7.0) * b * ell**2
-                + 105.0 * ell**3
-                + 21.0 * a**2 * (np.sqrt(7.0) * b + 4.0 * ell)
-                - 3.0
-                * a
-                * (
-                    7.0 * np.sqrt(7.0) * b**2
-                    + 56.0 * b * ell
-                    + 19.0 * np.sqrt(7.0) * ell**2
-                )
-            )
-            - 6.0 * ell**2 * (35.0 * ell - 16.0 * c)
+    if order == 2:
+        return (
+            sum(coeff * (s * J[m] - J[m + 1]) for m, coeff in enumerate(coeffs))
+            / scale_factors**2
         )
-    )
+
+    raise ValueError(f"`order` must either be 1 or 2 ({order=}).")
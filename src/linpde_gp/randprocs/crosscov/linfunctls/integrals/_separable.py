@@ -0,0 +1,99 @@
+import abc
+from types import ModuleType
+
+from jax import numpy as jnp
+import numpy as np
+import probnum as pn
+from probnum.typing import ScalarType
+
+from linpde_gp import domains, linfunctls
+
+from ... import _pv_crosscov
+
+
+class SeparableKernel_Identity_LebesgueIntegral(
+    _pv_crosscov.ProcessVectorCrossCovariance
+):
+    r"""Cross-covariance between a process with a tensor-product kernel
+    :math:`k(x, y) = \prod_d k_d(x_d - y_d)` and its integral over an interval or a
+    box.
+
+    All integrals factorize over the dimensions. They are evaluated in closed form via
+    the first and second antiderivatives :math:`K_d^{(1)}` and :math:`K_d^{(2)}` of the
+    factors, which vanish at zero.
+    """
+
+    def __init__(
+        self,
+        kernel: pn.randprocs.kernels.Kernel,
+        integral: linfunctls.LebesgueIntegral,
+        reverse: bool = False,
+    ):
+        self._kernel = kernel
+        self._integral = integral
+
+        assert self._kernel.input_shape == self._integral.input_domain_shape
+
+        super().__init__(
+            randproc_input_shape=self._kernel.input_shape,
+            randproc_output_shape=(),
+            randvar_shape=self._integral.output_shape,
+            reverse=reverse,
+        )
+
+    @property
+    def kernel(self) -> pn.randprocs.kernels.Kernel:
+        return self._kernel
+
+    @property
+    def integral(self) -> linfunctls.LebesgueIntegral:
+        return self._integral
+
+    @abc.abstractmethod
+    def _antiderivatives(self, tau, /, *, order: int, xp: ModuleType = np):
+        """Antiderivatives of the given `order` of all factors of the kernel, evaluated
+        at the componentwise differences `tau` of shape `(...,) + input_shape`."""
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        return self._integrate(x, xp=np)
+
+    def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
+        return self._integrate(x, xp=jnp)
+
+    def _integrate(self, x, xp: ModuleType):
+        bounds = np.asarray(self._integral.domain)
+
+        return xp.prod(
+            self._antiderivatives(x - bounds[..., 0], order=1, xp=xp)
+            - self._antiderivatives(x - bounds[..., 1], order=1, xp=xp),
+            axis=tuple(range(-self.randproc_input_ndim, 0)),
+        )
+
+    def integrate(self, domain: domains.Interval | domains.Box) -> ScalarType:
+        """Integral of the cross-covariance over the given `domain`, i.e. the
+        covariance between the integrals of the process over both domains."""
+        bounds0 = np.asarray(domain)
+        bounds1 = np.asarray(self._integral.domain)
+
+        if bounds0.shape != bounds1.shape:
+            raise ValueError(
+                f"The domains must have the same shape ({domain.shape=}, "
+                f"{self._integral.domain.shape=})."
+            )
+
+        a, b = bounds0[..., 0], bounds0[..., 1]
+        c, d = bounds1[..., 0], bounds1[..., 1]
+
+        return np.prod(
+            self._antiderivatives(b - c, order=2)
+            - self._antiderivatives(a - c, order=2)
+            - self._antiderivatives(b - d, order=2)
+            + self._antiderivatives(a - d, order=2)
+        )
+
+
+@linfunctls.LebesgueIntegral.__call__.register(  # pylint: disable=no-member
+    SeparableKernel_Identity_LebesgueIntegral
+)
+def _(self, pv_crosscov: SeparableKernel_Identity_LebesgueIntegral, /) -> ScalarType:
+    return pv_crosscov.integrate(self.domain)
@@ -1,15 +1,18 @@
 from jax import numpy as jnp
 import numpy as np
 import probnum as pn
-import scipy.integrate
 import scipy.linalg
 import scipy.sparse
 
+from linpde_gp import linops
 from linpde_gp.linfunctls.projections.l2 import (
     L2Projection_UnivariateLinearInterpolationBasis,
 )
+from linpde_gp.linops._banded import sparsify
+from linpde_gp.randprocs.kernels._jax import JaxKernelMixin
 
 from .. import _parametric, _pv_crosscov
+from ._matern_hat_integrals import MaternHatFunctionIntegrals
 
 
 class Kernel_L2Projection_UnivariateLinearInterpolationBasis(
@@ -40,20 +43,7 @@ class Kernel_L2Projection_UnivariateLinearInterpolationBasis(
         return self._projection
 
     def _evaluate(self, x: np.ndarray) -> np.ndarray:
-        basis = self._projection.basis
-
-        res = np.vectorize(
-            lambda x: np.array(
-                [
-                    scipy.integrate.quad(
-                        lambda t: basis.eval_elem(idx, t) * self._kernel(x, t),
-                        *basis.support_bounds(idx),
-                    )[0]
-                    for idx in range(len(basis))
-                ]
-            ),
-            signature="()->(m)",
-        )(x)
+        res = self._projection.quadrature.integrate_kernel(self._kernel, x)
 
         res = self._projection.normalizer(res, axis=-1)
 
@@ -63,7 +53,18 @@ class Kernel_L2Projection_UnivariateLinearInterpolationBasis(
         return res
 
     def _evaluate_jax(self, x: jnp.ndarray) -> jnp.ndarray:
-        raise NotImplementedError()
+        if not isinstance(self._kernel, JaxKernelMixin):
+            raise NotImplementedError()
+
+        res = self._projection.quadrature.integrate_kernel(self._kernel.jax, x, xp=jnp)
+
+        # The normalizer is symmetric
+        res = res @ self._projection.normalizer.todense()
+
+        if self._reverse:
+            return jnp.moveaxis(res, -1, 0)
+
+        return res
 
 
 @L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
@@ -72,42 +73,61 @@ class Kernel_L2Projection_UnivariateLinearInterpolationBasis(
 def _(
     self, pv_crosscov: Kernel_L2Projection_UnivariateLinearInterpolationBasis, /
 ) -> np.ndarray:
+    proj0, proj1 = _projections(self, pv_crosscov)
+
+    res = proj0.quadrature.integrate_kernel_pairwise(
+        pv_crosscov.kernel, proj1.quadrature
+    )
+
+    return _covariance_matrix(self, proj0, proj1, res)
+
+
+def _projections(
+    proj: L2Projection_UnivariateLinearInterpolationBasis,
+    pv_crosscov: Kernel_L2Projection_UnivariateLinearInterpolationBasis,
+) -> tuple[
+    L2Projection_UnivariateLinearInterpolationBasis,
+    L2Projection_UnivariateLinearInterpolationBasis,
+]:
     if pv_crosscov.reverse:
-        proj0 = pv_crosscov.projection
-        proj1: L2Projection_UnivariateLinearInterpolationBasis = self
-    else:
-        proj0: L2Projection_UnivariateLinearInterpolationBasis = self
-        proj1 = pv_crosscov.projection
-
-    basis0 = proj0.basis
-    basis1 = proj1.basis
-
-    def kernel_variance(idx0: int, idx1: int):
-        res, _ = scipy.integrate.dblquad(
-            lambda x1, x0: (
-                basis0.eval_elem(idx0, x0)
-                * pv_crosscov.kernel(x0, x1)
-                * basis1.eval_elem(idx1, x1)
-            ),
-            *basis0.support_bounds(idx0),
-            *basis1.support_bounds(idx1),
-        )
+        return pv_crosscov.projection, proj
 
-        return res
+    return proj, pv_crosscov.projection
 
-    res = np.array(
-        [
-            [kernel_variance(idx0, idx1) for idx1 in range(len(basis1))]
-            for idx0 in range(len(basis0))
-        ]
-    )
 
+def _normalize(
+    proj0: L2Projection_UnivariateLinearInterpolationBasis,
+    proj1: L2Projection_UnivariateLinearInterpolationBasis,
+    res: np.ndarray,
+) -> np.ndarray:
     res = proj1.normalizer(res, axis=-1)
     res = proj0.normalizer(res, axis=0)
 
     return res
 
 
+def _covariance_matrix(
+    proj: L2Projection_UnivariateLinearInterpolationBasis,
+    proj0: L2Projection_UnivariateLinearInterpolationBasis,
+    proj1: L2Projection_UnivariateLinearInterpolationBasis,
+    res: np.ndarray | scipy.sparse.spmatrix,
+) -> np.ndarray | pn.linops.LinearOperator:
+    """Normalizes the matrix of integrals `res` and, if `proj` has a drop tolerance,
+    returns it as a sparse linear operator. Sparse `res` must not need normalization."""
+    if not scipy.sparse.issparse(res):
+        res = _normalize(proj0, proj1, res)
+
+        if proj.sparse_drop_tol is None:
+            return res
+
+        res = sparsify(res, proj.sparse_drop_tol)
+
+    if proj0 is proj1:
+        return linops.SymmetricBanded(res)
+
+    return pn.linops.Matrix(res)
+
+
 @L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
     _parametric.ParametricProcessVectorCrossCovariance
 )
@@ -120,8 +140,77 @@ def _(
     raise NotImplementedError()
 
 
-class Matern32_L2Projection_UnivariateLinearInterpolationBasis(
+class Matern_L2Projection_UnivariateLinearInterpolationBasis(
     Kernel_L2Projection_UnivariateLinearInterpolationBasis
+):
+    r"""Closed-form projections of half-integer Matérn kernels, i.e. with
+    :math:`\nu = p + \frac{1}{2}`."""
+
+    def __init__(
+        self,
+        kernel: pn.randprocs.kernels.Kernel,
+        proj: L2Projection_UnivariateLinearInterpolationBasis,
+        reverse: bool = True,
+    ):
+        p = kernel.nu - 0.5
+
+        if not float(p).is_integer() or p < 0:
+            raise ValueError(
+                f"The Matérn kernel must have half-integer smoothness ({kernel.nu=})."
+            )
+
+        self._hat_integrals = MaternHatFunctionIntegrals(
+            proj.basis, p=int(p), lengthscale=float(kernel.lengthscale)
+        )
+
+        super().__init__(kernel, proj, reverse=reverse)
+
+    @property
+    def hat_integrals(self) -> MaternHatFunctionIntegrals:
+        return self._hat_integrals
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        res = self._hat_integrals.integrate_kernel(x)
+
+        res = self._projection.normalizer(res, axis=-1)
+
+        if self._reverse:
+            return np.moveaxis(res, -1, 0)
+
+        return res
+
+
+@L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
+    Matern_L2Projection_UnivariateLinearInterpolationBasis
+)
+def _(
+    self, pv_crosscov: Matern_L2Projection_UnivariateLinearInterpolationBasis, /
+) -> np.ndarray:
+    proj0, proj1 = _projections(self, pv_crosscov)
+
+    basis0, basis1 = proj0.basis, proj1.basis
+
+    if basis0 is basis1 or (
+        basis0.zero_boundary == basis1.zero_boundary
+        and np.array_equal(basis0.grid, basis1.grid)
+    ):
+        res = pv_crosscov.hat_integrals.integrate_kernel_pairwise(
+            # The normalizers are dense, so only unnormalized projections are assembled
+            # directly in sparse form
+            drop_tol=(
+                None if proj0.normalized or proj1.normalized else self.sparse_drop_tol
+            )
+        )
+    else:
+        res = proj0.quadrature.integrate_kernel_pairwise(
+            pv_crosscov.kernel, proj1.quadrature
+        )
+
+    return _covariance_matrix(self, proj0, proj1, res)
+
+
+class Matern32_L2Projection_UnivariateLinearInterpolationBasis(
+    Matern_L2Projection_UnivariateLinearInterpolationBasis
 ):
     def _evaluate(self, x: np.ndarray) -> np.ndarray:
         x = x[..., None]
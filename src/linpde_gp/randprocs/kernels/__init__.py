@@ -1,8 +1,13 @@
 from . import _linfunctls, diffops
+from ._distance_cache import DistanceCache, distance_cache
 from ._expquad import ExpQuad
 from ._galerkin import GalerkinKernel
 from ._jax import JaxKernel, JaxLambdaKernel
-from ._jax_arithmetic import JaxSumKernel
+from ._jax_arithmetic import JaxScaledKernel, JaxSumKernel
 from ._matern import Matern
 from ._parametric_kernel import ParametricKernel
 from ._product_matern import ProductMatern
+from ._random_fourier_features import random_fourier_features
+from ._ski import SKIKernel
+from ._spectral_density import spectral_density
+from ._wendland import Wendland
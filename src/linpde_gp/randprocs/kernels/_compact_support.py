@@ -0,0 +1,68 @@
+import abc
+from typing import Optional
+
+import numpy as np
+from probnum.randprocs.kernels import Kernel
+from probnum.typing import ArrayLike
+import scipy.sparse
+import scipy.spatial
+
+
+class CompactlySupportedKernelMixin(abc.ABC):
+    """Kernels :math:`k(x_0, x_1)`, which vanish if :math:`\\lVert x_0 - x_1 \\rVert
+    \\ge c` for a support radius :math:`c`.
+
+    Their kernel matrices are sparse. They are assembled in :meth:`sparse_matrix` by
+    finding all pairs of inputs within the support radius with a KD-tree and
+    evaluating the kernel only on these pairs."""
+
+    @property
+    @abc.abstractmethod
+    def support_radius(self) -> float:
+        pass
+
+    def sparse_matrix(
+        self: Kernel, x0: ArrayLike, x1: Optional[ArrayLike] = None
+    ) -> scipy.sparse.csr_matrix:
+        """Sparse kernel matrix :math:`k(x_0^{(i)}, x_1^{(j)})` of the inputs in the
+        flattened batches `x0` and `x1`.
+
+        If `x1` is `None`, the kernel matrix of `x0` with itself is computed, which
+        requires the kernel to be symmetric."""
+        x0 = np.asarray(x0).reshape((-1,) + self.input_shape, order="C")
+        x0_points = x0.reshape((x0.shape[0], self.input_size), order="C")
+
+        tree0 = scipy.spatial.cKDTree(x0_points)
+
+        if x1 is None:
+            N0 = N1 = x0_points.shape[0]
+
+            pairs = tree0.query_pairs(self.support_radius, output_type="ndarray")
+            diag_idcs = np.arange(N0)
+
+            rows = np.concatenate((pairs[:, 0], pairs[:, 1], diag_idcs))
+            cols = np.concatenate((pairs[:, 1], pairs[:, 0], diag_idcs))
+
+            offdiag_values = self(x0[pairs[:, 0]], x0[pairs[:, 1]])
+            values = np.concatenate(
+                (offdiag_values, offdiag_values, self(x0, None).reshape(-1))
+            )
+        else:
+            x1 = np.asarray(x1).reshape((-1,) + self.input_shape, order="C")
+            x1_points = x1.reshape((x1.shape[0], self.input_size), order="C")
+
+            N0, N1 = x0_points.shape[0], x1_points.shape[0]
+
+            pairs = tree0.sparse_distance_matrix(
+                scipy.spatial.cKDTree(x1_points),
+                self.support_radius,
+                output_type="ndarray",
+            )
+
+            rows, cols = pairs["i"], pairs["j"]
+            values = self(x0[rows], x1[cols])
+
+        res = scipy.sparse.csr_matrix((values, (rows, cols)), shape=(N0, N1))
+        res.eliminate_zeros()
+
+        return res
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable, Hashable
+
+import numpy as np
+
+from . import _pairwise
+
+
+class DistanceCache:
+    """Size-bounded LRU cache for the pairwise differences `x0 - x1` of kernel inputs
+    and quantities derived from them, e.g. squared Euclidean distances or the
+    exponentials shared by a kernel and its derivatives.
+
+    A kernel and its differential-operator descendants (e.g. `ExpQuad`,
+    `ExpQuad_Identity_Laplacian`, and `ExpQuad_Laplacian_Laplacian`) are usually
+    evaluated on the same pairs of input arrays when building the blocks of a joint
+    Gram matrix. Consulting this cache, the differences and exponentials only need to
+    be computed once.
+
+    Within a single kernel, the squared distances are derived from the cached
+    differences if the kernel needs both, e.g. for the Laplacians of `ExpQuad`.
+
+    The cache is only active inside a `with` block, e.g. around the assembly of a Gram
+    matrix and of the cross-covariances of an observation, and it is cleared when the
+    outermost block exits. Outside of such a scope, all quantities are recomputed on
+    every call. The numbers of `hits` and `misses` of an active cache are counted.
+
+    Entries are keyed on the identity of the input arrays, i.e. on their data pointer,
+    shape, strides, and dtype, so that different views of the same buffer can share an
+    entry. The cache holds references to the inputs, so that their memory can not be
+    reused while an entry is alive. Cached results are read-only. Input arrays must not
+    be modified in-place within an active scope; call `clear` after doing so.
+
+    Parameters
+    ----------
+    max_bytes
+        Upper bound on the total size of the cached arrays. Least recently used entries
+        are evicted first. If `0`, nothing is cached.
+    """
+
+    def __init__(self, max_bytes: int = 2**26):
+        self.max_bytes = max_bytes
+
+        self._entries: collections.OrderedDict[
+            Hashable, tuple[np.ndarray, np.ndarray, np.ndarray]
+        ] = collections.OrderedDict()
+        self._nbytes = 0
+
+        self._depth = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> DistanceCache:
+        self._depth += 1
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+
+        if self._depth == 0:
+            self.clear()
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        self._max_bytes = int(max_bytes)
+
+        if hasattr(self, "_entries"):
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+    def differences(self, x0: np.ndarray, x1: np.ndarray) -> np.ndarray:
+        return self.lookup(("differences",), x0, x1, lambda: x0 - x1)
+
+    def squared_euclidean_distances(
+        self,
+        x0: np.ndarray,
+        x1: np.ndarray,
+        input_ndim: int,
+        lengthscales: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Squared Euclidean norms of `(x0 - x1) / lengthscales` over the last
+        `input_ndim` axes.
+
+        If the differences are cached, the norms are computed from them. Otherwise,
+        kernel matrices are computed by the tiled evaluation in `_pairwise`, which does
+        not materialize the differences."""
+
+        def compute() -> np.ndarray:
+            diffs = self._get(("differences",), x0, x1)
+
+            if diffs is not None:
+                if lengthscales is not None:
+                    diffs = diffs / lengthscales
+
+                return np.sum(diffs**2, axis=tuple(range(-input_ndim, 0)))
+
+            if lengthscales is None:
+                return _pairwise.squared_euclidean_distances(x0, x1, input_ndim)
+
+            return _pairwise.squared_euclidean_distances(
+                x0 / lengthscales, x1 / lengthscales, input_ndim
+            )
+
+        return self.lookup(
+            ("squared_euclidean_distances", input_ndim)
+            + (
+                ()
+                if lengthscales is None
+                else (lengthscales.shape, lengthscales.tobytes())
+            ),
+            x0,
+            x1,
+            compute,
+        )
+
+    def lookup(
+        self,
+        kind: tuple,
+        x0: np.ndarray,
+        x1: np.ndarray,
+        compute: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """Returns the cached value of the quantity identified by `kind` (which must
+        include all parameters it depends on) for the inputs `x0` and `x1`, calling
+        `compute()` on a cache miss or if the cache is not active."""
+        if (
+            not self.active
+            or self._max_bytes <= 0
+            or type(x0) is not np.ndarray  # pylint: disable=unidiomatic-typecheck
+            or type(x1) is not np.ndarray  # pylint: disable=unidiomatic-typecheck
+        ):
+            return compute()
+
+        value = self._get(kind, x0, x1)
+
+        if value is not None:
+            return value
+
+        self.misses += 1
+
+        value = np.asarray(compute())
+
+        if value.nbytes <= self._max_bytes:
+            value.flags.writeable = False
+
+            self._entries[kind + (_array_key(x0), _array_key(x1))] = (x0, x1, value)
+            self._nbytes += value.nbytes
+
+            self._evict()
+
+        return value
+
+    def _get(self, kind: tuple, x0: np.ndarray, x1: np.ndarray) -> np.ndarray | None:
+        if (
+            not self.active
+            or type(x0) is not np.ndarray  # pylint: disable=unidiomatic-typecheck
+            or type(x1) is not np.ndarray  # pylint: disable=unidiomatic-typecheck
+        ):
+            return None
+
+        key = kind + (_array_key(x0), _array_key(x1))
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[2]
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes:
+            _, (_, _, value) = self._entries.popitem(last=False)
+            self._nbytes -= value.nbytes
+
+
+def _array_key(x: np.ndarray) -> Hashable:
+    return (x.__array_interface__["data"][0], x.shape, x.strides, x.dtype.str)
+
+
+distance_cache = DistanceCache()
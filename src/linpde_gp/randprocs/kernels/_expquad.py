@@ -1,4 +1,3 @@
-import functools
 from typing import Optional
 
 import jax
@@ -6,6 +5,7 @@ from jax import numpy as jnp
 import numpy as np
 from probnum.typing import ArrayLike, ShapeLike
 
+from ._distance_cache import distance_cache
 from ._jax import JaxKernel
 from ._stationary import JaxStationaryMixin
 
@@ -36,11 +36,22 @@ class ExpQuad(JaxKernel, JaxStationaryMixin):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        return np.exp(
-            -0.5 * self._squared_euclidean_distances(x0, x1, self._lengthscales)
+        # The cached exponentials are read-only
+        return self._exponentials(x0, x1).copy()
+
+    def _exponentials(self, x0: np.ndarray, x1: np.ndarray) -> np.ndarray:
+        """Values of the kernel, which are shared by the kernel and its derivatives
+        through the `distance_cache`."""
+        return distance_cache.lookup(
+            ("expquad", self._lengthscales.shape, self._lengthscales.tobytes()),
+            x0,
+            x1,
+            lambda: np.exp(
+                -0.5 * self._squared_euclidean_distances(x0, x1, self._lengthscales)
+            ),
         )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.ones_like(
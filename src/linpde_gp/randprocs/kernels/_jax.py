@@ -6,12 +6,14 @@ import functools
 import operator
 from typing import Optional
 
+import jax
 from jax import numpy as jnp
 import numpy as np
 from probnum.randprocs.kernels import Kernel
 from probnum.typing import ArrayLike, ShapeLike
 
 from ... import linfuncops
+from ..._pytree import JaxPyTreeMixin
 
 Kernel.input_size = property(
     lambda self: functools.reduce(operator.mul, self.input_shape, 1)
@@ -38,7 +40,7 @@ Kernel._batched_euclidean_norm = (  # pylint: disable=protected-access
 )
 
 
-class JaxKernelMixin:
+class JaxKernelMixin(JaxPyTreeMixin):
     """Careful: Must come before Kernel in inheritance"""
 
     def jax(self, x0: ArrayLike, x1: Optional[ArrayLike]) -> jnp.ndarray:
@@ -102,14 +104,44 @@ def _(self, k: JaxKernelMixin, /, *, argnum=0):
             k, argnum=argnum
         )
     except NotImplementedError:
-        return JaxLambdaKernel(
-            self._jax_fallback(  # pylint: disable=protected-access
+        return _jax_fallback_kernel(self, k, argnum)
+
+
+def _jax_fallback_kernel(
+    diffop: linfuncops.LinearDifferentialOperator, k: JaxKernelMixin, argnum: int
+) -> JaxLambdaKernel:
+    """Applies `diffop` to `k` by automatic differentiation.
+
+    The result is cached on `k` per (operator, `argnum`), so that repeated
+    applications share the compiled evaluation functions of the `JaxLambdaKernel`."""
+    cache = k.__dict__.setdefault("_jax_fallback_kernels", _KernelCache())
+
+    key = (diffop, argnum)
+
+    if key not in cache:
+        cache[key] = JaxLambdaKernel(
+            diffop._jax_fallback(  # pylint: disable=protected-access
                 k.jax, argnum=argnum
             ),
-            input_shape=self.output_domain_shape,
+            input_shape=diffop.output_domain_shape,
             vectorize=True,
         )
 
+    return cache[key]
+
+
+class _KernelCache(dict):
+    """Cache stored in an attribute of a kernel. It is registered as a pytree without
+    leaves, such that it is not part of the kernel's static structure, and it does not
+    outlive the kernel."""
+
+
+jax.tree_util.register_pytree_node(
+    _KernelCache,
+    lambda cache: ((), None),
+    lambda aux_data, children: _KernelCache(),
+)
+
 
 class JaxLambdaKernel(JaxKernel):
     def __init__(
@@ -121,21 +153,65 @@ class JaxLambdaKernel(JaxKernel):
     ):
         super().__init__(input_shape=input_shape, output_shape=output_shape)
 
-        if vectorize:
-            k = jnp.vectorize(
-                k, signature="(),()->()" if input_shape == () else "(d),(d)->()"
-            )
-
         self._k = k
+        self._vectorize = bool(vectorize)
 
     def _evaluate(self, x0: np.ndarray, x1: np.ndarray) -> np.ndarray:
-        if x1 is None:
-            x1 = x0
-
-        return np.array(self._k(x0, x1))
+        return np.array(self._evaluate_jax(x0, x1))
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             x1 = x0
 
-        return self._k(x0, x1)
+        if not self._vectorize:
+            return self._k(x0, x1)
+
+        x0_batch_ndim = x0.ndim - self.input_ndim
+        x1_batch_ndim = x1.ndim - self.input_ndim
+
+        batch_shape = np.broadcast_shapes(
+            x0.shape[:x0_batch_ndim], x1.shape[:x1_batch_ndim]
+        )
+        batch_ndim = len(batch_shape)
+
+        x0 = jnp.reshape(x0, (1,) * (batch_ndim - x0_batch_ndim) + x0.shape)
+        x1 = jnp.reshape(x1, (1,) * (batch_ndim - x1_batch_ndim) + x1.shape)
+
+        # Batch axes along which an input is broadcast are not mapped over for that
+        # input, so that e.g. Gram matrices are computed without materializing the
+        # broadcast inputs
+        in_axes = tuple(
+            (None if x0.shape[i] == 1 else 0, None if x1.shape[i] == 1 else 0)
+            for i in range(batch_ndim)
+        )
+
+        k_x0_x1 = self._batched_k(
+            tuple(in_axes_i for in_axes_i in in_axes if in_axes_i != (None, None))
+        )(
+            jnp.squeeze(
+                x0, axis=tuple(i for i, (ax0, _) in enumerate(in_axes) if ax0 is None)
+            ),
+            jnp.squeeze(
+                x1, axis=tuple(i for i, (_, ax1) in enumerate(in_axes) if ax1 is None)
+            ),
+        )
+
+        return jnp.reshape(k_x0_x1, batch_shape + self.output_shape)
+
+    def _batched_k(
+        self, in_axes: tuple[tuple[Optional[int], Optional[int]], ...]
+    ) -> Callable[[jnp.ndarray, jnp.ndarray], jnp.ndarray]:
+        """`self._k` mapped over the batch axes with `jax.vmap` according to `in_axes`
+        and compiled with `jax.jit`, which additionally caches the compiled
+        executables per input shape. The result is cached per `in_axes`."""
+        cache = self.__dict__.setdefault("_batched_ks", _KernelCache())
+
+        if in_axes not in cache:
+            k = self._k
+
+            for in_axes_i in reversed(in_axes):
+                k = jax.vmap(k, in_axes=in_axes_i)
+
+            cache[in_axes] = jax.jit(k)
+
+        return cache[in_axes]
@@ -11,8 +11,10 @@ from linpde_gp.linfunctls.projections.l2 import (
     L2Projection_UnivariateLinearInterpolationBasis,
 )
 
+from ._expquad import ExpQuad
 from ._galerkin import GalerkinKernel
 from ._matern import Matern
+from ._product_matern import ProductMatern
 
 
 @LinearFunctional.__call__.register  # pylint: disable=no-member
@@ -65,6 +67,10 @@ def _(self, k: Matern, /, *, argnum: int = 0):
     if argnum not in (0, 1):
         raise ValueError("`argnum` must either be 0 or 1.")
 
+    # Isotropic Matérn kernels only factorize over a single dimension
+    if k.input_size != 1:
+        raise NotImplementedError()
+
     from ..crosscov.linfunctls.integrals import (  # pylint: disable=import-outside-toplevel
         Matern_Identity_LebesgueIntegral,
     )
@@ -76,6 +82,38 @@ def _(self, k: Matern, /, *, argnum: int = 0):
     )
 
 
+@LebesgueIntegral.__call__.register  # pylint: disable=no-member
+def _(self, k: ProductMatern, /, *, argnum: int = 0):
+    if argnum not in (0, 1):
+        raise ValueError("`argnum` must either be 0 or 1.")
+
+    from ..crosscov.linfunctls.integrals import (  # pylint: disable=import-outside-toplevel
+        ProductMatern_Identity_LebesgueIntegral,
+    )
+
+    return ProductMatern_Identity_LebesgueIntegral(
+        matern=k,
+        integral=self,
+        reverse=(argnum == 0),
+    )
+
+
+@LebesgueIntegral.__call__.register  # pylint: disable=no-member
+def _(self, k: ExpQuad, /, *, argnum: int = 0):
+    if argnum not in (0, 1):
+        raise ValueError("`argnum` must either be 0 or 1.")
+
+    from ..crosscov.linfunctls.integrals import (  # pylint: disable=import-outside-toplevel
+        ExpQuad_Identity_LebesgueIntegral,
+    )
+
+    return ExpQuad_Identity_LebesgueIntegral(
+        expquad=k,
+        integral=self,
+        reverse=(argnum == 0),
+    )
+
+
 @L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
     pn.randprocs.kernels.Kernel
 )
@@ -98,6 +136,7 @@ def _(self, k: pn.randprocs.kernels.Matern, /, argnum: int = 0):
     from ..crosscov.linfunctls.projections import (  # pylint: disable=import-outside-toplevel
         Kernel_L2Projection_UnivariateLinearInterpolationBasis,
         Matern32_L2Projection_UnivariateLinearInterpolationBasis,
+        Matern_L2Projection_UnivariateLinearInterpolationBasis,
     )
 
     if k.nu == 1.5:
@@ -107,6 +146,13 @@ def _(self, k: pn.randprocs.kernels.Matern, /, argnum: int = 0):
             reverse=(argnum == 0),
         )
 
+    if (k.nu - 0.5).is_integer():
+        return Matern_L2Projection_UnivariateLinearInterpolationBasis(
+            kernel=k,
+            proj=self,
+            reverse=(argnum == 0),
+        )
+
     return Kernel_L2Projection_UnivariateLinearInterpolationBasis(
         kernel=k,
         proj=self,
@@ -114,6 +160,21 @@ def _(self, k: pn.randprocs.kernels.Matern, /, argnum: int = 0):
     )
 
 
+@L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
+    Matern
+)
+def _(self, k: Matern, /, argnum: int = 0):
+    from ..crosscov.linfunctls.projections import (  # pylint: disable=import-outside-toplevel
+        Matern_L2Projection_UnivariateLinearInterpolationBasis,
+    )
+
+    return Matern_L2Projection_UnivariateLinearInterpolationBasis(
+        kernel=k,
+        proj=self,
+        reverse=(argnum == 0),
+    )
+
+
 @L2Projection_UnivariateLinearInterpolationBasis.__call__.register(  # pylint: disable=no-member
     GalerkinKernel
 )
@@ -1,4 +1,3 @@
-import functools
 from typing import Optional
 
 import jax
@@ -7,6 +6,7 @@ import numpy as np
 from probnum.typing import ArrayLike, FloatLike, ShapeLike
 
 from ._jax import JaxKernel
+from ._matern_polynomials import horner, matern_polynomial
 from ._stationary import JaxStationaryMixin
 
 
@@ -20,6 +20,10 @@ class Matern(JaxKernel, JaxStationaryMixin):
         super().__init__(input_shape, output_shape=())
 
         self._p = int(p)
+
+        if self._p < 0:
+            raise ValueError(f"`p` must be non-negative ({p=}).")
+
         self._lengthscale = float(lengthscale)
 
         self._scale_factor = np.sqrt(2 * self.p + 1) / self._lengthscale
@@ -39,30 +43,14 @@ class Matern(JaxKernel, JaxStationaryMixin):
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
         scaled_distances = self._scale_factor * self._euclidean_distances(x0, x1)
 
-        if self.p == 3:
-            return (
-                1.0
-                + scaled_distances
-                * (
-                    1.0
-                    + scaled_distances * (2.0 / 5.0 + scaled_distances * (1.0 / 15.0))
-                )
-            ) * np.exp(-scaled_distances)
+        return horner(matern_polynomial(self.p), scaled_distances) * np.exp(
+            -scaled_distances
+        )
 
-        raise ValueError()
-
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         scaled_distances = self._scale_factor * self._euclidean_distances_jax(x0, x1)
 
-        if self.p == 3:
-            return (
-                1.0
-                + scaled_distances
-                * (
-                    1.0
-                    + scaled_distances * (2.0 / 5.0 + scaled_distances * (1.0 / 15.0))
-                )
-            ) * jnp.exp(-scaled_distances)
-
-        raise ValueError()
+        return horner(matern_polynomial(self.p), scaled_distances) * jnp.exp(
+            -scaled_distances
+        )
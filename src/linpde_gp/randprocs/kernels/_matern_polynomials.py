@@ -0,0 +1,108 @@
+r"""Closed-form polynomials of half-integer Matérn kernels and their derivatives.
+
+For :math:`\nu = p + \frac{1}{2}`, the Matérn kernel is given by :math:`g_p(s) =
+P_p(s) e^{-s}` in terms of the scaled distance :math:`s = \sqrt{2p + 1} r / l`, where
+
+.. math::
+    P_p(s) = \frac{p!}{(2p)!} \sum_{i = 0}^p \frac{(p + i)!}{i! (p - i)!} (2s)^{p - i}.
+
+The derivatives of :math:`g_p` are of the same form, i.e. :math:`g_p^{(n)}(s) =
+R_{p, n}(s) e^{-s}` with :math:`R_{p, 0} = P_p` and :math:`R_{p, n + 1} = R_{p, n}' -
+R_{p, n}`. All polynomials are computed in exact rational arithmetic and cached per
+:math:`p`. Their coefficients are returned in order of decreasing degree, i.e. in the
+order expected by `horner`.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+import functools
+import math
+
+
+def horner(coeffs: tuple[float, ...], x):
+    """Evaluates the polynomial with coefficients `coeffs` (in order of decreasing
+    degree) at `x` using Horner's scheme. Works for NumPy and JAX arrays alike."""
+    res = coeffs[0]
+
+    for coeff in coeffs[1:]:
+        res = res * x + coeff
+
+    return res
+
+
+@functools.cache
+def matern_polynomial(p: int, order: int = 0, s_power: int = 0) -> tuple[float, ...]:
+    r"""Coefficients of :math:`R_{p, \mathrm{order}}(s) / s^{\mathrm{s\_power}}`.
+
+    Raises
+    ------
+    ValueError
+        If the division by :math:`s^{\mathrm{s\_power}}` is not exact, i.e. if the
+        kernel is not smooth enough for the requested derivative.
+    """
+    return _to_float_coeffs(_divide_by_s_power(_matern_polynomial(p, order), s_power))
+
+
+@functools.cache
+def matern_hessian_polynomial(p: int) -> tuple[float, ...]:
+    r"""Coefficients of :math:`(s R_{p, 2}(s) - R_{p, 1}(s)) / s^3`, which is the
+    coefficient of the radial part :math:`\hat{d} \hat{d}^T` of the Hessian of an
+    isotropic Matérn kernel (divided by :math:`s^2`)."""
+    s_R_2 = (Fraction(0),) + _matern_polynomial(p, 2)
+    R_1 = _matern_polynomial(p, 1)
+
+    return _to_float_coeffs(
+        _divide_by_s_power(
+            tuple(
+                (s_R_2[i] if i < len(s_R_2) else 0) - (R_1[i] if i < len(R_1) else 0)
+                for i in range(max(len(s_R_2), len(R_1)))
+            ),
+            3,
+        )
+    )
+
+
+@functools.cache
+def _matern_polynomial(p: int, order: int) -> tuple[Fraction, ...]:
+    r"""Coefficients of :math:`R_{p, \mathrm{order}}` in increasing order of degree."""
+    if p < 0 or order < 0:
+        raise ValueError(f"`p` and `order` must be non-negative ({p=}, {order=}).")
+
+    if order == 0:
+        return tuple(
+            Fraction(
+                math.factorial(p) * math.factorial(2 * p - i) * 2**i,
+                math.factorial(2 * p) * math.factorial(p - i) * math.factorial(i),
+            )
+            for i in range(p + 1)
+        )
+
+    R = _matern_polynomial(p, order - 1)
+
+    # R' - R
+    return tuple(
+        (i + 1) * R[i + 1] - R[i] if i + 1 < len(R) else -R[i] for i in range(len(R))
+    )
+
+
+def _divide_by_s_power(
+    coeffs: tuple[Fraction, ...], s_power: int
+) -> tuple[Fraction, ...]:
+    if any(coeff != 0 for coeff in coeffs[:s_power]):
+        raise ValueError(
+            "The Matérn kernel is not smooth enough for the requested derivative. "
+            "Increase `p`."
+        )
+
+    return coeffs[s_power:]
+
+
+def _to_float_coeffs(coeffs: tuple[Fraction, ...]) -> tuple[float, ...]:
+    coeffs = tuple(float(coeff) for coeff in reversed(coeffs))
+
+    # Strip leading zeros
+    while len(coeffs) > 1 and coeffs[0] == 0.0:
+        coeffs = coeffs[1:]
+
+    return coeffs or (0.0,)
@@ -0,0 +1,124 @@
+r"""Tiled evaluation of pairwise squared Euclidean distances.
+
+If the batch shapes of the inputs `x0` and `x1` form an "outer product", as is the
+case when evaluating a kernel matrix, the distances are computed block by block via
+the expansion :math:`\lVert x_0 - x_1 \rVert_2^2 = \lVert x_0 \rVert_2^2 +
+\lVert x_1 \rVert_2^2 - 2 \langle x_0, x_1 \rangle`, where the inner products are
+evaluated by a matrix-matrix product. In contrast to broadcasting `x0 - x1`, this never
+materializes a temporary whose size is the product of the batch sizes and the input
+size. Each block is written directly into the output array.
+
+The expansion suffers from cancellation if the distance between two points is small
+compared to their norms. Hence, the inputs are centered before the expansion is
+applied and the (few) distances for which cancellation could cause a significant
+relative error are recomputed directly.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+
+import numpy as np
+
+# Size of the blocks of the output array, chosen such that a block fits into the L2
+# cache
+BLOCK_BYTES = 2**18
+
+# Distances whose square is smaller than this fraction of the sum of the squared norms
+# of the (centered) points are recomputed directly
+_CANCELLATION_RTOL = 1e-5
+
+
+def squared_euclidean_distances(
+    x0: np.ndarray,
+    x1: np.ndarray,
+    input_ndim: int,
+    *,
+    block_bytes: int = BLOCK_BYTES,
+) -> np.ndarray:
+    """Squared Euclidean norms of `x0 - x1` over the last `input_ndim` axes, where
+    the leading axes of `x0` and `x1` are broadcast against each other."""
+    input_shape = x0.shape[x0.ndim - input_ndim :]
+    input_size = functools.reduce(operator.mul, input_shape, 1)
+
+    x0_batch_shape = x0.shape[: x0.ndim - input_ndim]
+    x1_batch_shape = x1.shape[: x1.ndim - input_ndim]
+
+    batch_shape = np.broadcast_shapes(x0_batch_shape, x1_batch_shape)
+    batch_ndim = len(batch_shape)
+
+    x0_batch_shape = (1,) * (batch_ndim - len(x0_batch_shape)) + x0_batch_shape
+    x1_batch_shape = (1,) * (batch_ndim - len(x1_batch_shape)) + x1_batch_shape
+
+    # The batch axes of `x1` start at the first non-trivial axis of `x1`'s batch shape
+    split = next(
+        (i for i, size in enumerate(x1_batch_shape) if size != 1),
+        batch_ndim,
+    )
+
+    if input_size <= 1 or any(size != 1 for size in x0_batch_shape[split:]):
+        # Either the difference is cheap (scalar inputs) or the batch shapes share
+        # an axis, in which case the result is not a kernel matrix
+        return np.sum(
+            (x0 - x1) ** 2,
+            axis=tuple(range(-input_ndim, 0)),
+        )
+
+    x0 = np.reshape(x0, (-1, input_size))
+    x1 = np.reshape(x1, (-1, input_size))
+
+    dists_sq = np.empty(
+        (x0.shape[0], x1.shape[0]),
+        dtype=np.result_type(x0, x1, np.double),
+    )
+
+    if dists_sq.size > 0:
+        _squared_euclidean_distances_gemm(x0, x1, out=dists_sq, block_bytes=block_bytes)
+
+    return dists_sq.reshape(batch_shape)
+
+
+def _squared_euclidean_distances_gemm(
+    x0: np.ndarray,
+    x1: np.ndarray,
+    *,
+    out: np.ndarray,
+    block_bytes: int,
+) -> None:
+    # Centering reduces cancellation in the expansion
+    center = np.mean(x1, axis=0)
+
+    x0 = x0 - center
+    x1 = x1 - center
+
+    x0_norms_sq = np.sum(x0**2, axis=-1)
+    x1_norms_sq = np.sum(x1**2, axis=-1)
+
+    x1_T = np.ascontiguousarray(x1.T)
+
+    block_size = max(1, block_bytes // (out.itemsize * x1.shape[0]))
+
+    for start in range(0, x0.shape[0], block_size):
+        block = slice(start, start + block_size)
+
+        out_block = out[block]
+
+        # |x0|^2 + |x1|^2 - 2 <x0, x1>
+        np.matmul(x0[block], x1_T, out=out_block)
+        out_block *= -2.0
+        out_block += x0_norms_sq[block, None]
+        out_block += x1_norms_sq
+
+        np.maximum(out_block, 0.0, out=out_block)
+
+        # Recompute distances which are potentially affected by cancellation
+        idcs0, idcs1 = np.nonzero(
+            out_block <= _CANCELLATION_RTOL * (x0_norms_sq[block, None] + x1_norms_sq)
+        )
+
+        if idcs0.size > 0:
+            out_block[idcs0, idcs1] = np.sum(
+                (x0[block][idcs0] - x1[idcs1]) ** 2,
+                axis=-1,
+            )
@@ -5,7 +5,9 @@ from jax import numpy as jnp
 import numpy as np
 from probnum.typing import ArrayLike, ShapeLike
 
+from ._distance_cache import distance_cache
 from ._jax import JaxKernel
+from ._matern_polynomials import horner, matern_polynomial
 from ._stationary import JaxStationaryMixin
 
 
@@ -22,6 +24,10 @@ class ProductMatern(JaxKernel, JaxStationaryMixin):
             raise ValueError()
 
         self._p = int(p)
+
+        if self._p < 0:
+            raise ValueError(f"`p` must be non-negative ({p=}).")
+
         self._lengthscales = np.asarray(lengthscales)
 
         self._scale_factors = np.sqrt(2 * self.p + 1) / self._lengthscales
@@ -42,40 +48,52 @@ class ProductMatern(JaxKernel, JaxStationaryMixin):
         return np.prod(self._evaluate_factors(x0, x1), axis=-1)
 
     def _evaluate_factors(self, x0: ArrayLike, x1: ArrayLike | None) -> np.ndarray:
+        return horner(
+            matern_polynomial(self.p), self._scaled_distances(x0, x1)
+        ) * self._exp_neg_scaled_distances(x0, x1)
+
+    def _scaled_distances(self, x0: ArrayLike, x1: ArrayLike | None) -> np.ndarray:
+        """Componentwise scaled distances `sqrt(2p + 1) / l * |x0 - x1|`, which are
+        shared by the factors of the kernel and of its derivatives."""
         if x1 is None:
-            scaled_distances = np.zeros_like(x0)
-        else:
-            scaled_distances = self._scale_factors * np.abs(x0 - x1)
+            return np.zeros_like(x0)
+
+        return distance_cache.lookup(
+            ("product_matern_scaled_distances",) + self._scale_factors_key,
+            x0,
+            x1,
+            lambda: self._scale_factors * np.abs(distance_cache.differences(x0, x1)),
+        )
+
+    def _exp_neg_scaled_distances(
+        self, x0: ArrayLike, x1: ArrayLike | None
+    ) -> np.ndarray:
+        if x1 is None:
+            return np.ones_like(x0)
 
-        if self.p == 3:
-            return (
-                1.0
-                + scaled_distances
-                * (
-                    1.0
-                    + scaled_distances * (2.0 / 5.0 + scaled_distances * (1.0 / 15.0))
-                )
-            ) * np.exp(-scaled_distances)
+        return distance_cache.lookup(
+            ("product_matern_exp_neg_scaled_distances",) + self._scale_factors_key,
+            x0,
+            x1,
+            lambda: np.exp(-self._scaled_distances(x0, x1)),
+        )
 
-        raise ValueError()
+    @functools.cached_property
+    def _scale_factors_key(self) -> tuple:
+        return (self._scale_factors.shape, self._scale_factors.tobytes())
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: jnp.ndarray | None) -> jnp.ndarray:
+        return jnp.prod(self._evaluate_factors_jax(x0, x1), axis=-1)
+
+    def _evaluate_factors_jax(
+        self, x0: jnp.ndarray, x1: jnp.ndarray | None
+    ) -> jnp.ndarray:
         if x1 is None:
             scaled_distances = jnp.zeros_like(x0)
         else:
             scaled_distances = self._scale_factors * jnp.abs(x0 - x1)
 
-        if self.p == 3:
-            ks_x0_x1 = (
-                1.0
-                + scaled_distances
-                * (
-                    1.0
-                    + scaled_distances * (2.0 / 5.0 + scaled_distances * (1.0 / 15.0))
-                )
-            ) * jnp.exp(-scaled_distances)
-        else:
-            raise ValueError()
-
-        return jnp.prod(ks_x0_x1, axis=-1)
+        return horner(matern_polynomial(self.p), scaled_distances) * jnp.exp(
+            -scaled_distances
+        )
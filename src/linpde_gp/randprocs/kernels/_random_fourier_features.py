@@ -0,0 +1,89 @@
+import functools
+
+import numpy as np
+import probnum as pn
+
+from linpde_gp import functions
+
+from ._expquad import ExpQuad
+from ._jax_arithmetic import JaxScaledKernel
+from ._matern import Matern
+
+
+@functools.singledispatch
+def random_fourier_features(
+    k: pn.randprocs.kernels.Kernel, num_features: int, rng: np.random.Generator
+) -> functions.FourierFeatures:
+    r"""Random Fourier features :math:`\phi` of a stationary kernel :math:`k`, such
+    that :math:`k(x_0, x_1) \approx \phi(x_0)^T \phi(x_1)`.
+
+    The features are pairs :math:`\cos(\langle \omega_i, x \rangle)` and
+    :math:`\sin(\langle \omega_i, x \rangle)`, where the frequencies :math:`\omega_i`
+    are sampled from the spectral density of :math:`k` (Bochner's theorem). Hence,
+    `num_features` must be even."""
+    raise NotImplementedError(
+        f"Random Fourier features are not implemented for kernels of type {type(k)}."
+    )
+
+
+@random_fourier_features.register
+def _(
+    k: ExpQuad, num_features: int, rng: np.random.Generator
+) -> functions.FourierFeatures:
+    num_frequencies = _num_frequencies(num_features)
+
+    frequencies = (
+        rng.standard_normal(size=(num_frequencies,) + k.input_shape) / k.lengthscales
+    )
+
+    return _cos_sin_features(frequencies)
+
+
+@random_fourier_features.register
+def _(
+    k: Matern, num_features: int, rng: np.random.Generator
+) -> functions.FourierFeatures:
+    num_frequencies = _num_frequencies(num_features)
+
+    # The spectral density is a multivariate t-distribution with 2ν degrees of
+    # freedom, i.e. a Gaussian scale mixture
+    z = rng.standard_normal(size=(num_frequencies,) + k.input_shape)
+    u = rng.chisquare(df=2 * k.nu, size=(num_frequencies,) + (1,) * k.input_ndim)
+
+    frequencies = z * np.sqrt(2 * k.nu / u) / k.lengthscale
+
+    return _cos_sin_features(frequencies)
+
+
+@random_fourier_features.register
+def _(
+    k: JaxScaledKernel, num_features: int, rng: np.random.Generator
+) -> functions.FourierFeatures:
+    if k.scalar < 0:
+        raise ValueError("The kernel must be positive definite.")
+
+    return random_fourier_features(k.kernel, num_features, rng).rescale(
+        np.sqrt(k.scalar)
+    )
+
+
+def _num_frequencies(num_features: int) -> int:
+    if num_features <= 0 or num_features % 2 != 0:
+        raise ValueError(
+            f"`num_features` must be a positive even integer ({num_features=})."
+        )
+
+    return num_features // 2
+
+
+def _cos_sin_features(frequencies: np.ndarray) -> functions.FourierFeatures:
+    # Re(exp(i <ω, x>)) = cos(<ω, x>) and Re(-i exp(i <ω, x>)) = sin(<ω, x>)
+    num_frequencies = frequencies.shape[0]
+
+    return functions.FourierFeatures(
+        frequencies=np.concatenate((frequencies, frequencies), axis=0),
+        coefficients=np.concatenate(
+            (np.ones(num_frequencies), np.full(num_frequencies, -1j))
+        )
+        / np.sqrt(num_frequencies),
+    )
@@ -0,0 +1,47 @@
+from collections.abc import Sequence
+
+import numpy as np
+import probnum as pn
+
+from ._expquad import ExpQuad
+from ._jax_arithmetic import JaxScaledKernel
+from ._product_matern import ProductMatern
+
+
+def tensor_grid_gram_factors(
+    k: pn.randprocs.kernels.Kernel, axis_coords: Sequence[np.ndarray]
+) -> list[np.ndarray] | None:
+    """If `k` is a (scaled) product of one-dimensional kernels, returns the Gram
+    matrices of the factors on the one-dimensional grids `axis_coords`. Their
+    Kronecker product is the Gram matrix of `k` on the tensor grid spanned by
+    `axis_coords` (in C order). Returns `None` if `k` is not known to be separable."""
+    scale = 1.0
+
+    if isinstance(k, JaxScaledKernel):
+        scale = k.scalar
+        k = k.kernel
+
+    if k.input_shape != (len(axis_coords),):
+        return None
+
+    match k:
+        case ProductMatern():
+            factor_kernels = [
+                ProductMatern((1,), p=k.p, lengthscales=lengthscale)
+                for lengthscale in np.broadcast_to(k.lengthscales, k.input_shape)
+            ]
+        case ExpQuad():
+            factor_kernels = [
+                ExpQuad((1,), lengthscales=lengthscale)
+                for lengthscale in np.broadcast_to(k.lengthscales, k.input_shape)
+            ]
+        case _:
+            return None
+
+    factors = [
+        factor_kernel(coords[:, None, None], coords[None, :, None])
+        for factor_kernel, coords in zip(factor_kernels, axis_coords)
+    ]
+    factors[0] = scale * factors[0]
+
+    return factors
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+import functools
+
+import numpy as np
+import probnum as pn
+from probnum.typing import ArrayLike
+import scipy.sparse
+
+from ... import linops
+from ...functions.bases import UnivariateLinearInterpolationBasis
+from ._separable import tensor_grid_gram_factors
+
+
+class SKIKernel(pn.randprocs.kernels.Kernel):
+    r"""Structured kernel interpolation (KISS-GP) approximation
+
+    .. math::
+        k(x_0, x_1) \approx w(x_0)^T K_{\mathrm{grid}} w(x_1)
+
+    of `kernel`, where :math:`K_{\mathrm{grid}}` is the Gram matrix of `kernel` on a
+    tensor grid of inducing points and :math:`w(x)` are the (sparse) weights of
+    piecewise multilinear interpolation on that grid, given by tensor products of
+    `UnivariateLinearInterpolationBasis` functions. The approximation vanishes
+    outside of the grid.
+
+    On uniform one-dimensional grids, :math:`K_{\mathrm{grid}}` of a stationary
+    kernel is represented as a `SymmetricToeplitz` operator and for separable
+    kernels (e.g. `ProductMatern`) as a `KroneckerProduct`, so that matrix-vector
+    products with the Gram matrix :math:`W K_{\mathrm{grid}} W^T` of `N` data points
+    cost `O(N)` plus the cost of a structured matrix-vector product on the grid."""
+
+    def __init__(
+        self,
+        kernel: pn.randprocs.kernels.Kernel,
+        grids: ArrayLike | Sequence[ArrayLike],
+    ):
+        self._kernel = kernel
+
+        if kernel.output_shape != () or kernel.input_ndim > 1:
+            raise ValueError(
+                "Only scalar-valued kernels on (at most) one-dimensional inputs are "
+                "supported."
+            )
+
+        if np.ndim(grids[0]) == 0:
+            grids = (grids,)
+
+        self._grids = tuple(np.asarray(grid, dtype=np.double) for grid in grids)
+
+        if len(self._grids) != max(kernel.input_size, 1):
+            raise ValueError(
+                f"Expected one grid per input dimension ({kernel.input_shape=}), but "
+                f"{len(self._grids)} grids were given."
+            )
+
+        self._bases = tuple(
+            UnivariateLinearInterpolationBasis(grid) for grid in self._grids
+        )
+
+        super().__init__(input_shape=kernel.input_shape, output_shape=())
+
+    @property
+    def kernel(self) -> pn.randprocs.kernels.Kernel:
+        return self._kernel
+
+    @property
+    def grids(self) -> tuple[np.ndarray, ...]:
+        return self._grids
+
+    @property
+    def grid_shape(self) -> tuple[int, ...]:
+        return tuple(grid.size for grid in self._grids)
+
+    @functools.cached_property
+    def grid_points(self) -> np.ndarray:
+        """Inducing points of shape `(G,) + input_shape` in C order."""
+        return np.stack(np.meshgrid(*self._grids, indexing="ij"), axis=-1).reshape(
+            (-1,) + self.input_shape
+        )
+
+    @functools.cached_property
+    def grid_gram(self) -> pn.linops.LinearOperator:
+        r""":math:`K_{\mathrm{grid}}`"""
+        if len(self._grids) == 1:
+            toeplitz_gram = self._toeplitz_grid_gram()
+
+            if toeplitz_gram is not None:
+                return toeplitz_gram
+
+        factors = tensor_grid_gram_factors(self._kernel, self._grids)
+
+        if factors is not None:
+            return linops.KroneckerProduct(factors)
+
+        return pn.linops.Matrix(
+            self._kernel(self.grid_points[:, None], self.grid_points[None, :])
+        )
+
+    def _toeplitz_grid_gram(self) -> linops.SymmetricToeplitz | None:
+        (grid,) = self._grids
+        G = grid.size
+
+        dgrid = np.diff(grid)
+
+        if not np.allclose(dgrid, dgrid[0], rtol=1e-10, atol=0.0):
+            return None
+
+        c = self._kernel(self.grid_points, self.grid_points[0])
+
+        # Check stationarity on a central and the last row
+        for i in (G // 2, G - 1):
+            if not np.allclose(
+                self._kernel(self.grid_points, self.grid_points[i]),
+                c[np.abs(np.arange(G) - i)],
+                rtol=1e-10,
+                atol=1e-12 * np.abs(c[0]),
+            ):
+                return None
+
+        return linops.SymmetricToeplitz(c)
+
+    def interpolation_matrix(self, X: ArrayLike) -> scipy.sparse.csr_matrix:
+        """Sparse interpolation matrix :math:`W` of shape `(N, G)` with
+        :math:`2^D` nonzero entries per row."""
+        X = np.asarray(X).reshape((-1,) + self.input_shape, order="C")
+
+        idcs, weights = self._stencils(X)
+
+        N, S = idcs.shape
+
+        return scipy.sparse.csr_matrix(
+            (weights.reshape(-1), idcs.reshape(-1), np.arange(0, N * S + 1, S)),
+            shape=(N, self.grid_points.shape[0]),
+        )
+
+    def _stencils(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Flat indices of the :math:`2^D` grid points surrounding each input and the
+        corresponding interpolation weights, both of shape `batch_shape + (2^D,)`."""
+        batch_shape = x.shape[: x.ndim - self.input_ndim]
+        x = x.reshape(batch_shape + (len(self._grids),))
+
+        D = len(self._grids)
+
+        axis_idcs = []
+        weights = 1.0
+
+        for i, basis in enumerate(self._bases):
+            x_i = x[..., i]
+
+            # Index of the left neighbor of `x_i` among the grid points
+            left_idcs_i = np.clip(
+                np.searchsorted(basis.x_i, x_i, side="right") - 1, 0, len(basis) - 2
+            )
+            idcs_i = left_idcs_i[..., None] + np.array([0, 1])
+
+            weights_i = basis.eval_elem(
+                idcs_i, np.broadcast_to(x_i[..., None], idcs_i.shape)
+            )
+
+            stencil_shape = batch_shape + (1,) * i + (2,) + (1,) * (D - i - 1)
+
+            axis_idcs.append(idcs_i.reshape(stencil_shape))
+            weights = weights * weights_i.reshape(stencil_shape)
+
+        stencil_shape = batch_shape + (2,) * D
+
+        idcs = np.ravel_multi_index(
+            tuple(np.broadcast_to(idcs_i, stencil_shape) for idcs_i in axis_idcs),
+            self.grid_shape,
+        )
+
+        return (
+            idcs.reshape(batch_shape + (-1,)),
+            np.broadcast_to(weights, stencil_shape).reshape(batch_shape + (-1,)),
+        )
+
+    def _evaluate(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
+        idcs0, weights0 = self._stencils(x0)
+        idcs1, weights1 = (idcs0, weights0) if x1 is None else self._stencils(x1)
+
+        batch_ndim0 = idcs0.ndim - 1
+        batch_ndim1 = idcs1.ndim - 1
+
+        # Kernel matrices between the stencils of `x0` and `x1`
+        k_stencils = self._kernel(
+            np.expand_dims(self.grid_points[idcs0], batch_ndim0 + 1),
+            np.expand_dims(self.grid_points[idcs1], batch_ndim1),
+        )
+
+        return np.einsum("...i,...ij,...j->...", weights0, k_stencils, weights1)
@@ -0,0 +1,71 @@
+import functools
+
+import numpy as np
+import probnum as pn
+from probnum.typing import ArrayLike
+import scipy.special
+
+from ._expquad import ExpQuad
+from ._jax_arithmetic import JaxScaledKernel
+from ._matern import Matern
+
+
+@functools.singledispatch
+def spectral_density(k: pn.randprocs.kernels.Kernel, omega: ArrayLike) -> np.ndarray:
+    r"""Spectral density :math:`S` of a stationary kernel :math:`k`, i.e. the Fourier
+    transform
+
+    .. math::
+        S(\omega) = \int k(\tau) \exp(-i \langle \omega, \tau \rangle) \, d\tau,
+
+    such that :math:`k(x_0, x_1) = (2 \pi)^{-D} \int S(\omega) \exp(i \langle \omega,
+    x_0 - x_1 \rangle) \, d\omega`, evaluated at the (batched) frequencies `omega`."""
+    raise NotImplementedError(
+        f"The spectral density is not implemented for kernels of type {type(k)}."
+    )
+
+
+@spectral_density.register
+def _(k: ExpQuad, omega: ArrayLike) -> np.ndarray:
+    omega = np.asarray(omega)
+    lengthscales = np.broadcast_to(k.lengthscales, k.input_shape)
+
+    return (
+        (2 * np.pi) ** (lengthscales.size / 2)
+        * np.prod(lengthscales)
+        * np.exp(
+            -0.5
+            * np.sum(
+                (lengthscales * omega) ** 2,
+                axis=tuple(range(-k.input_ndim, 0)),
+            )
+        )
+    )
+
+
+@spectral_density.register
+def _(k: Matern, omega: ArrayLike) -> np.ndarray:
+    omega = np.asarray(omega)
+
+    D = k.input_size
+    nu = k.nu
+    l = k.lengthscale
+
+    log_normalization = (
+        D * np.log(2.0)
+        + (D / 2) * np.log(np.pi)
+        + scipy.special.gammaln(nu + D / 2)
+        - scipy.special.gammaln(nu)
+        + nu * np.log(2 * nu / l**2)
+    )
+
+    return np.exp(
+        log_normalization
+        - (nu + D / 2)
+        * np.log(2 * nu / l**2 + np.sum(omega**2, axis=tuple(range(-k.input_ndim, 0))))
+    )
+
+
+@spectral_density.register
+def _(k: JaxScaledKernel, omega: ArrayLike) -> np.ndarray:
+    return k.scalar * spectral_density(k.kernel, omega)
@@ -4,6 +4,7 @@ from jax import numpy as jnp
 import numpy as np
 from probnum.randprocs.kernels import Kernel
 
+from ._distance_cache import distance_cache
 from ._jax import JaxKernel
 
 
@@ -22,12 +23,16 @@ class StationaryMixin:
                 shape=x0.shape[: x0.ndim - self.input_ndim] + self.output_shape,
             )
 
-        diffs = x0 - x1
+        if lengthscales is None or np.ndim(lengthscales) == 0:
+            dists_sq = distance_cache.squared_euclidean_distances(
+                x0, x1, self.input_ndim
+            )
 
-        if lengthscales is not None:
-            diffs /= lengthscales
+            return dists_sq if lengthscales is None else dists_sq / lengthscales**2
 
-        return self._batched_euclidean_norm_sq(diffs)
+        return distance_cache.squared_euclidean_distances(
+            x0, x1, self.input_ndim, lengthscales=lengthscales
+        )
 
     def _euclidean_distances(
         self: Kernel,
@@ -0,0 +1,68 @@
+from typing import Optional
+
+import jax
+from jax import numpy as jnp
+import numpy as np
+from probnum.typing import FloatLike, ShapeLike
+
+from ._compact_support import CompactlySupportedKernelMixin
+from ._jax import JaxKernel
+from ._matern_polynomials import horner
+from ._stationary import JaxStationaryMixin
+from ._wendland_polynomials import wendland_polynomial
+
+
+class Wendland(JaxKernel, JaxStationaryMixin, CompactlySupportedKernelMixin):
+    r"""Compactly supported Wendland kernel
+
+    .. math::
+        k(x_0, x_1) = \phi_{d, k}\left( \frac{\lVert x_0 - x_1 \rVert_2}{c} \right),
+
+    where :math:`d` is the input size and :math:`c` the support radius. The kernel is
+    positive definite on :math:`\mathbb{R}^d`, its sample paths are :math:`k` times
+    differentiable, and it vanishes for :math:`\lVert x_0 - x_1 \rVert_2 \ge c`.
+    Hence, its kernel matrices are sparse (see :meth:`sparse_matrix`)."""
+
+    def __init__(
+        self,
+        input_shape: ShapeLike,
+        k: int = 2,
+        support_radius: FloatLike = 1.0,
+    ):
+        super().__init__(input_shape, output_shape=())
+
+        self._k = int(k)
+
+        if self._k < 0:
+            raise ValueError(f"`k` must be non-negative ({k=}).")
+
+        self._support_radius = float(support_radius)
+
+        if self._support_radius <= 0.0:
+            raise ValueError(f"`support_radius` must be positive ({support_radius=}).")
+
+        # \phi_{d, k}(r) = (1 - r)^m Q(r) on [0, 1]
+        self._power, self._polynomial = wendland_polynomial(self.input_size, self._k)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def support_radius(self) -> float:
+        return self._support_radius
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        scaled_dists = self._euclidean_distances(x0, x1) / self._support_radius
+
+        return np.maximum(1.0 - scaled_dists, 0.0) ** self._power * horner(
+            self._polynomial, scaled_dists
+        )
+
+    @jax.jit
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        scaled_dists = self._euclidean_distances_jax(x0, x1) / self._support_radius
+
+        return jnp.maximum(1.0 - scaled_dists, 0.0) ** self._power * horner(
+            self._polynomial, scaled_dists
+        )
@@ -0,0 +1,144 @@
+r"""Closed-form polynomials of Wendland kernels and their derivatives.
+
+The Wendland function :math:`\phi_{d, k}` is positive definite on :math:`\mathbb{R}^d`,
+:math:`2k` times continuously differentiable, and vanishes for :math:`r \ge 1`. It is
+obtained from the truncated power function :math:`(1 - r)_+^\ell` with :math:`\ell =
+\lfloor d / 2 \rfloor + k + 1` by applying the operator :math:`(I \phi)(r) =
+\int_r^\infty t \phi(t) \, dt` :math:`k` times. Here, it is normalized to
+:math:`\phi_{d, k}(0) = 1`.
+
+Derivatives of the isotropic kernel :math:`\phi_{d, k}(\lVert x \rVert)` are again
+isotropic or products of isotropic functions with polynomials in :math:`x`. They are
+expressed in terms of the operators
+
+.. math::
+    (T g)(r) = \frac{g'(r)}{r}
+    \quad \text{and} \quad
+    (\Delta_d g)(r) = g''(r) + \frac{d - 1}{r} g'(r) = d \, (T g)(r) + r (T g)'(r),
+
+i.e. :math:`\nabla g(\lVert x \rVert) = (T g)(\lVert x \rVert) x` and :math:`\Delta
+g(\lVert x \rVert) = (\Delta_d g)(\lVert x \rVert)`. On :math:`[0, 1]`, all resulting
+functions are of the form :math:`(1 - r)^m Q(r)` for a polynomial :math:`Q`. All
+polynomials are computed in exact rational arithmetic and cached. Their coefficients
+are returned in order of decreasing degree, i.e. in the order expected by `horner`.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+import functools
+
+
+@functools.cache
+def wendland_polynomial(
+    d: int, k: int, laplacians: int = 0, radial_derivatives: int = 0
+) -> tuple[int, tuple[float, ...]]:
+    r"""Power :math:`m` and coefficients of :math:`Q` with :math:`(T^n \Delta_d^l
+    \phi_{d, k})(r) = (1 - r)^m Q(r)` on :math:`[0, 1]`, where :math:`l` is the
+    number of `laplacians` and :math:`n` the number of `radial_derivatives`.
+
+    Raises
+    ------
+    ValueError
+        If the kernel is not smooth enough for the requested derivative.
+    """
+    coeffs = _wendland_polynomial(d, k)
+
+    for _ in range(laplacians):
+        T_coeffs = _T(coeffs)
+
+        # d T g + r (T g)'
+        coeffs = _add(
+            tuple(d * coeff for coeff in T_coeffs),
+            (Fraction(0),) + _derivative(T_coeffs),
+        )
+
+    for _ in range(radial_derivatives):
+        coeffs = _T(coeffs)
+
+    power, coeffs = _factor_one_minus_r(coeffs)
+
+    return power, _to_float_coeffs(coeffs)
+
+
+@functools.cache
+def _wendland_polynomial(d: int, k: int) -> tuple[Fraction, ...]:
+    r"""Coefficients of :math:`\phi_{d, k}` on :math:`[0, 1]` in increasing order of
+    degree."""
+    if d < 1 or k < 0:
+        raise ValueError(f"`d` must be positive and `k` non-negative ({d=}, {k=}).")
+
+    ell = d // 2 + k + 1
+
+    # (1 - r)^ell
+    coeffs = (Fraction(1),)
+
+    for _ in range(ell):
+        coeffs = _add(coeffs, (Fraction(0),) + tuple(-coeff for coeff in coeffs))
+
+    for _ in range(k):
+        # \int_r^1 t \phi(t) dt, since \phi vanishes on [1, \infty)
+        antideriv = (Fraction(0), Fraction(0)) + tuple(
+            coeff / (i + 2) for i, coeff in enumerate(coeffs)
+        )
+
+        coeffs = _add((sum(antideriv),), tuple(-coeff for coeff in antideriv))
+
+    return tuple(coeff / coeffs[0] for coeff in coeffs)
+
+
+def _T(coeffs: tuple[Fraction, ...]) -> tuple[Fraction, ...]:
+    r"""Coefficients of :math:`g'(r) / r`."""
+    deriv = _derivative(coeffs)
+
+    if deriv[0] != 0:
+        raise ValueError(
+            "The Wendland kernel is not smooth enough for the requested derivative. "
+            "Increase `k`."
+        )
+
+    return deriv[1:] or (Fraction(0),)
+
+
+def _derivative(coeffs: tuple[Fraction, ...]) -> tuple[Fraction, ...]:
+    return tuple(i * coeff for i, coeff in enumerate(coeffs))[1:] or (Fraction(0),)
+
+
+def _add(*polys: tuple[Fraction, ...]) -> tuple[Fraction, ...]:
+    return tuple(
+        sum(poly[i] for poly in polys if i < len(poly))
+        for i in range(max(len(poly) for poly in polys))
+    )
+
+
+def _factor_one_minus_r(
+    coeffs: tuple[Fraction, ...],
+) -> tuple[int, tuple[Fraction, ...]]:
+    r"""Divides out the largest power of :math:`(1 - r)`, which divides the polynomial
+    with the given coefficients."""
+    power = 0
+
+    while any(coeff != 0 for coeff in coeffs) and sum(coeffs) == 0:
+        # Synthetic division by (r - 1)
+        quotient = [Fraction(0)] * (len(coeffs) - 1)
+        carry = Fraction(0)
+
+        for i in range(len(coeffs) - 1, 0, -1):
+            carry = coeffs[i] + carry
+            quotient[i - 1] = carry
+
+        # Division by (1 - r) = -(r - 1)
+        coeffs = tuple(-coeff for coeff in quotient)
+        power += 1
+
+    return power, coeffs
+
+
+def _to_float_coeffs(coeffs: tuple[Fraction, ...]) -> tuple[float, ...]:
+    coeffs = tuple(float(coeff) for coeff in reversed(coeffs))
+
+    # Strip leading zeros
+    while len(coeffs) > 1 and coeffs[0] == 0.0:
+        coeffs = coeffs[1:]
+
+    return coeffs or (0.0,)
@@ -25,3 +25,12 @@ from ._product_matern_laplacian import (
     ProductMatern_Identity_Laplacian,
     ProductMatern_Laplacian_Laplacian,
 )
+from ._wendland_directional_derivative import (
+    Wendland_DirectionalDerivative_DirectionalDerivative,
+    Wendland_Identity_DirectionalDerivative,
+)
+from ._wendland_laplacian import (
+    Wendland_DirectionalDerivative_Laplacian,
+    Wendland_Identity_Laplacian,
+    Wendland_Laplacian_Laplacian,
+)
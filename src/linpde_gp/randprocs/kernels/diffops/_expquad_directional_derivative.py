@@ -7,6 +7,7 @@ import numpy as np
 from linpde_gp.linfuncops import diffops
 
 from .._expquad import ExpQuad
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
 
 
@@ -50,12 +51,11 @@ class ExpQuad_Identity_DirectionalDerivative(JaxKernel):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_diffs = self._batched_sum(self._rescaled_direction * diffs)
-        dists_sq = self._batched_euclidean_norm_sq(diffs / self._expquad.lengthscales)
 
-        return proj_diffs * np.exp(-0.5 * dists_sq)
+        return proj_diffs * self._expquad._exponentials(x0, x1)
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
@@ -121,15 +121,14 @@ class ExpQuad_DirectionalDerivative_DirectionalDerivative(JaxKernel):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_diffs0 = self._batched_sum(self._rescaled_direction0 * diffs)
         proj_diffs1 = self._batched_sum(self._rescaled_direction1 * diffs)
-        dists_sq = self._batched_euclidean_norm_sq(diffs / self._expquad.lengthscales)
 
-        return (self._directions_inprod - proj_diffs0 * proj_diffs1) * np.exp(
-            -0.5 * dists_sq
-        )
+        return (
+            self._directions_inprod - proj_diffs0 * proj_diffs1
+        ) * self._expquad._exponentials(x0, x1)
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
@@ -8,6 +8,7 @@ import numpy as np
 from linpde_gp.linfuncops import diffops
 
 from .._expquad import ExpQuad
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
 from ._expquad_directional_derivative import ExpQuad_Identity_DirectionalDerivative
 
@@ -49,20 +50,17 @@ class ExpQuad_Identity_Laplacian(JaxKernel):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
-        dists_sq_lengthscales_sq_inv = self._batched_euclidean_norm_sq(
-            diffs / self._expquad.lengthscales
-        )
         dists_sq_lengthscales_4_inv = self._batched_euclidean_norm_sq(
             diffs / self._lengthscales_sq
         )
 
-        return (dists_sq_lengthscales_4_inv - self._trace_lengthscales_sq_inv) * np.exp(
-            -0.5 * dists_sq_lengthscales_sq_inv
-        )
+        return (
+            dists_sq_lengthscales_4_inv - self._trace_lengthscales_sq_inv
+        ) * self._expquad._exponentials(x0, x1)
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.full_like(
@@ -144,11 +142,8 @@ class ExpQuad_Laplacian_Laplacian(JaxKernel):
                 shape=x0.shape[: x0.ndim - self._input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
-        dists_sq_lengthscales_sq_inv = self._batched_euclidean_norm_sq(
-            diffs / self._expquad.lengthscales
-        )
         dists_sq_lengthscales_4_inv = self._batched_euclidean_norm_sq(
             diffs / self._lengthscales_sq
         )
@@ -160,9 +155,9 @@ class ExpQuad_Laplacian_Laplacian(JaxKernel):
             (dists_sq_lengthscales_4_inv - self._trace_lengthscales_sq_inv) ** 2
             - 4 * dists_sq_lengthscales_6_inv
             + 2 * self._trace_lengthscales_4_inv
-        ) * np.exp(-0.5 * dists_sq_lengthscales_sq_inv)
+        ) * self._expquad._exponentials(x0, x1)
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.full_like(
@@ -249,7 +244,7 @@ class ExpQuad_DirectionalDerivative_Laplacian(JaxKernel):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_diffs_direction_lengthscales_sq_inv = self._batched_sum(
             self._direction_lengthscales_sq_inv * diffs
@@ -258,9 +253,6 @@ class ExpQuad_DirectionalDerivative_Laplacian(JaxKernel):
             self._direction_lengthscales_4_inv * diffs
         )
 
-        dists_sq_lengthscales_sq_inv = self._batched_euclidean_norm_sq(
-            diffs / self._expquad.lengthscales
-        )
         dists_sq_lengthscales_4_inv = self._batched_euclidean_norm_sq(
             diffs / self._expquad_laplacian._lengthscales_sq
         )
@@ -272,14 +264,14 @@ class ExpQuad_DirectionalDerivative_Laplacian(JaxKernel):
                 dists_sq_lengthscales_4_inv
                 - self._expquad_laplacian._trace_lengthscales_sq_inv
             )
-        ) * np.exp(-0.5 * dists_sq_lengthscales_sq_inv)
+        ) * self._expquad._exponentials(x0, x1)
 
         if self._reverse:
             return -k_x0_x1
 
         return k_x0_x1
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.zeros_like(
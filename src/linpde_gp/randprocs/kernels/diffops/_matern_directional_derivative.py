@@ -6,8 +6,10 @@ import numpy as np
 
 from linpde_gp.linfuncops import diffops
 
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
 from .._matern import Matern
+from .._matern_polynomials import horner, matern_hessian_polynomial, matern_polynomial
 from .._stationary import JaxStationaryMixin
 
 
@@ -28,6 +30,9 @@ class Matern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin):
 
         self._scale_factor = np.sqrt(2 * self._matern.p + 1) / self._matern.lengthscale
 
+        # g^{(1)}(s) / s = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._matern.p, order=1, s_power=1)
+
     @property
     def matern(self) -> Matern:
         return self._matern
@@ -42,7 +47,8 @@ class Matern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin):
 
     @functools.cached_property
     def _rescaled_direction(self) -> np.ndarray:
-        rescaled_dir = self._scale_factor**2 * self._direction
+        # Includes the sign of the derivative w.r.t. `x1`
+        rescaled_dir = -self._scale_factor**2 * self._direction
 
         return -rescaled_dir if self._reverse else rescaled_dir
 
@@ -53,15 +59,14 @@ class Matern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_scaled_diffs = self._batched_sum(self._rescaled_direction * diffs)
         scaled_dists = self._scale_factor * self._batched_euclidean_norm(diffs)
 
         return (
             np.exp(-scaled_dists)
-            * (1 / 15)
-            * (3 + scaled_dists * (3 + scaled_dists))
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
@@ -79,8 +84,7 @@ class Matern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin):
 
         return (
             jnp.exp(-scaled_dists)
-            * (1 / 15)
-            * (3 + scaled_dists * (3 + scaled_dists))
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
@@ -110,6 +114,10 @@ class Matern_DirectionalDerivative_DirectionalDerivative(JaxKernel):
 
         self._scale_factor = np.sqrt(2 * self._matern.p + 1) / self._matern.lengthscale
 
+        # Tangential and radial parts of the Hessian of g(s)
+        self._polynomial = matern_polynomial(self._matern.p, order=1, s_power=1)
+        self._hessian_polynomial = matern_hessian_polynomial(self._matern.p)
+
     @property
     def matern(self) -> Matern:
         return self._matern
@@ -130,30 +138,28 @@ class Matern_DirectionalDerivative_DirectionalDerivative(JaxKernel):
         if x1 is None:
             return np.full_like(  # pylint: disable=unexpected-keyword-arg
                 x0,
-                0.2 * self._directions_inprod,
+                -self._polynomial[-1] * self._directions_inprod,
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_scaled_diffs0 = self._batched_sum(self._rescaled_direction0 * diffs)
         proj_scaled_diffs1 = self._batched_sum(self._rescaled_direction1 * diffs)
         scaled_dists = self._scale_factor * self._batched_euclidean_norm(diffs)
 
-        return (
-            np.exp(-scaled_dists)
-            * (1 / 15)
-            * (
-                (3 + scaled_dists * (3 + scaled_dists)) * self._directions_inprod
-                - (1 + scaled_dists) * proj_scaled_diffs0 * proj_scaled_diffs1
-            )
+        return -np.exp(-scaled_dists) * (
+            horner(self._polynomial, scaled_dists) * self._directions_inprod
+            + horner(self._hessian_polynomial, scaled_dists)
+            * proj_scaled_diffs0
+            * proj_scaled_diffs1
         )
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.full_like(  # pylint: disable=unexpected-keyword-arg
                 x0,
-                0.2 * self._directions_inprod,
+                -self._polynomial[-1] * self._directions_inprod,
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
@@ -163,13 +169,11 @@ class Matern_DirectionalDerivative_DirectionalDerivative(JaxKernel):
         proj_scaled_diffs1 = self._batched_sum_jax(self._rescaled_direction1 * diffs)
         scaled_dists = self._scale_factor * self._batched_euclidean_norm_jax(diffs)
 
-        return (
-            jnp.exp(-scaled_dists)
-            * (1 / 15)
-            * (
-                (3 + scaled_dists * (3 + scaled_dists)) * self._directions_inprod
-                - (1 + scaled_dists) * proj_scaled_diffs0 * proj_scaled_diffs1
-            )
+        return -jnp.exp(-scaled_dists) * (
+            horner(self._polynomial, scaled_dists) * self._directions_inprod
+            + horner(self._hessian_polynomial, scaled_dists)
+            * proj_scaled_diffs0
+            * proj_scaled_diffs1
         )
 
 
@@ -7,8 +7,10 @@ import numpy as np
 
 from linpde_gp.linfuncops import diffops
 
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
 from .._matern import Matern
+from .._matern_polynomials import horner, matern_polynomial
 from .._stationary import JaxStationaryMixin
 from ._matern_directional_derivative import Matern_Identity_DirectionalDerivative
 
@@ -21,10 +23,19 @@ class Matern_Identity_Laplacian(JaxKernel, JaxStationaryMixin):
         if self._matern.input_ndim != 0:
             raise ValueError()
 
+        if self._matern.p < 2:
+            raise ValueError(
+                "The Laplacian of a `Matern` kernel requires `p >= 2` "
+                f"({self._matern.p=})."
+            )
+
         super().__init__(self._matern.input_shape, output_shape=())
 
         self._reverse = bool(reverse)
 
+        # g^{(2)}(s) = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._matern.p, order=2)
+
     @property
     def matern(self) -> Matern:
         return self._matern
@@ -37,30 +48,24 @@ class Matern_Identity_Laplacian(JaxKernel, JaxStationaryMixin):
         dists = self._euclidean_distances(x0, x1) / self._matern.lengthscale
         scaled_dists = np.sqrt(2 * self._matern.p + 1) * dists
 
-        if self._matern.p == 3:
-            return (
-                (2 * self._matern.p + 1)
-                / self._matern.lengthscale**2
-                * np.exp(-scaled_dists)
-                * ((1.0 / 15.0 * scaled_dists**2 - 0.2) * scaled_dists - 0.2)
-            )
-
-        raise ValueError()
+        return (
+            (2 * self._matern.p + 1)
+            / self._matern.lengthscale**2
+            * np.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         dists = self._euclidean_distances_jax(x0, x1) / self._matern.lengthscale
         scaled_dists = jnp.sqrt(2 * self._matern.p + 1) * dists
 
-        if self._matern.p == 3:
-            return (
-                (2 * self._matern.p + 1)
-                / self._matern.lengthscale**2
-                * jnp.exp(-scaled_dists)
-                * ((1.0 / 15.0 * scaled_dists**2 - 0.2) * scaled_dists - 0.2)
-            )
-
-        raise ValueError()
+        return (
+            (2 * self._matern.p + 1)
+            / self._matern.lengthscale**2
+            * jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
 
 @diffops.Laplacian.__call__.register  # pylint: disable=no-member
@@ -75,8 +80,17 @@ class Matern_Laplacian_Laplacian(JaxKernel, JaxStationaryMixin):
     def __init__(self, matern: Matern):
         self._matern = matern
 
+        if self._matern.p < 2:
+            raise ValueError(
+                "The Laplacian of a `Matern` kernel requires `p >= 2` "
+                f"({self._matern.p=})."
+            )
+
         super().__init__(self._matern.input_shape, output_shape=())
 
+        # g^{(4)}(s) = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._matern.p, order=4)
+
     @property
     def matern(self) -> Matern:
         return self._matern
@@ -85,36 +99,22 @@ class Matern_Laplacian_Laplacian(JaxKernel, JaxStationaryMixin):
         dists = self._euclidean_distances(x0, x1) / self._matern.lengthscale
         scaled_dists = np.sqrt(2 * self._matern.p + 1) * dists
 
-        if self._matern.p == 3:
-            return (
-                ((2 * self._matern.p + 1) / self._matern.lengthscale**2) ** 2
-                * np.exp(-scaled_dists)
-                * (
-                    ((1.0 / 15.0 * scaled_dists - 0.4) * scaled_dists + 0.2)
-                    * scaled_dists
-                    + 0.2
-                )
-            )
-
-        raise ValueError()
+        return (
+            ((2 * self._matern.p + 1) / self._matern.lengthscale**2) ** 2
+            * np.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         dists = self._euclidean_distances_jax(x0, x1) / self._matern.lengthscale
         scaled_dists = np.sqrt(2 * self._matern.p + 1) * dists
 
-        if self._matern.p == 3:
-            return (
-                ((2 * self._matern.p + 1) / self._matern.lengthscale**2) ** 2
-                * jnp.exp(-scaled_dists)
-                * (
-                    ((1.0 / 15.0 * scaled_dists - 0.4) * scaled_dists + 0.2)
-                    * scaled_dists
-                    + 0.2
-                )
-            )
-
-        raise ValueError()
+        return (
+            ((2 * self._matern.p + 1) / self._matern.lengthscale**2) ** 2
+            * jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
 
 @diffops.Laplacian.__call__.register  # pylint: disable=no-member
@@ -140,6 +140,9 @@ class Matern_DirectionalDerivative_Laplacian(JaxKernel, JaxStationaryMixin):
 
         self._reverse = bool(reverse)
 
+        # g^{(3)}(s) / s = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._matern.p, order=3, s_power=1)
+
     @property
     def matern(self) -> Matern:
         return self._matern
@@ -157,19 +160,18 @@ class Matern_DirectionalDerivative_Laplacian(JaxKernel, JaxStationaryMixin):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_scaled_diffs = self._batched_sum(self._rescaled_direction * diffs)
         scaled_dists = self._matern._scale_factor * self._batched_euclidean_norm(diffs)
 
         return (
-            (1 / 15)
-            * np.exp(-scaled_dists)
-            * (3 + scaled_dists * (3 - scaled_dists))
+            np.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
         if x1 is None:
             return jnp.zeros_like(  # pylint: disable=unexpected-keyword-arg
@@ -185,9 +187,8 @@ class Matern_DirectionalDerivative_Laplacian(JaxKernel, JaxStationaryMixin):
         )
 
         return (
-            (1 / 15)
-            * jnp.exp(-scaled_dists)
-            * (3 + scaled_dists * (3 - scaled_dists))
+            jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
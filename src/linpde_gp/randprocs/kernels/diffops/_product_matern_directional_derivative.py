@@ -5,9 +5,12 @@ import numpy as np
 
 from linpde_gp.linfuncops import diffops
 
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
+from .._matern_polynomials import horner, matern_polynomial
 from .._product_matern import ProductMatern
 from .._stationary import JaxStationaryMixin
+from ._product_rule import sum_one_factor_replaced, sum_two_factors_replaced
 
 
 class ProductMatern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin):
@@ -25,6 +28,9 @@ class ProductMatern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin
 
         self._reverse = reverse
 
+        # g^{(1)}(s) / s = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._prod_matern.p, order=1, s_power=1)
+
     @property
     def prod_matern(self) -> ProductMatern:
         return self._prod_matern
@@ -39,44 +45,39 @@ class ProductMatern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin
 
     @functools.cached_property
     def _rescaled_direction(self) -> np.ndarray:
-        rescaled_dir = self._prod_matern._scale_factors**2 * self._direction
+        # Includes the sign of the derivative w.r.t. `x1`
+        rescaled_dir = -self._prod_matern._scale_factors**2 * self._direction
 
         return -rescaled_dir if self._reverse else rescaled_dir
 
     def _evaluate(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
-        ks_x0_x1 = np.where(
-            np.eye(self.input_shape[0], dtype=np.bool_),
-            self._evaluate_factors(x0, x1)[..., None, :],
-            self._prod_matern._evaluate_factors(x0, x1)[..., None, :],
+        return sum_one_factor_replaced(
+            self._prod_matern._evaluate_factors(x0, x1),
+            self._evaluate_factors(x0, x1),
         )
 
-        return np.sum(np.prod(ks_x0_x1, axis=-1), axis=-1)
-
     def _evaluate_factors(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
         if x1 is None:
             return np.zeros_like(x0)
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
-        scaled_dists = self._prod_matern._scale_factors * np.abs(diffs)
+        scaled_dists = self._prod_matern._scaled_distances(x0, x1)
         proj_scaled_diffs = self._rescaled_direction * diffs
 
         return (
-            np.exp(-scaled_dists)
-            * (1 / 15)
-            * (3 + scaled_dists * (3 + scaled_dists))
+            self._prod_matern._exp_neg_scaled_distances(x0, x1)
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: jnp.ndarray | None) -> jnp.ndarray:
-        ks_x0_x1 = jnp.where(
-            jnp.eye(self.input_shape[0], dtype=jnp.bool_),
-            self._evaluate_factors_jax(x0, x1)[..., None, :],
-            self._prod_matern._evaluate_factors_jax(x0, x1)[..., None, :],
+        return sum_one_factor_replaced(
+            self._prod_matern._evaluate_factors_jax(x0, x1),
+            self._evaluate_factors_jax(x0, x1),
+            xp=jnp,
         )
 
-        return jnp.sum(jnp.prod(ks_x0_x1, axis=-1), axis=-1)
-
     def _evaluate_factors_jax(
         self, x0: jnp.ndarray, x1: jnp.ndarray | None
     ) -> jnp.ndarray:
@@ -90,8 +91,7 @@ class ProductMatern_Identity_DirectionalDerivative(JaxKernel, JaxStationaryMixin
 
         return (
             jnp.exp(-scaled_dists)
-            * (1 / 15)
-            * (3 + scaled_dists * (3 + scaled_dists))
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
@@ -135,120 +135,54 @@ class ProductMatern_DirectionalDerivative_DirectionalDerivative(JaxKernel):
     def prod_matern(self) -> ProductMatern:
         return self._prod_matern
 
-    @functools.cached_property
-    def _rescaled_direction0(self) -> np.ndarray:
-        return self._prod_matern._scale_factors**2 * self._direction0
-
-    @functools.cached_property
-    def _rescaled_direction1(self) -> np.ndarray:
-        return self._prod_matern._scale_factors**2 * self._direction1
-
     @functools.cached_property
     def _directions_prod(self) -> np.ndarray:
-        return self._direction0 * self._rescaled_direction1
-
-    def _evaluate(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
-        idx_equal_mask = np.eye(self.input_shape[0], dtype=np.bool_)
-
-        ks_dderiv_dderiv_x0_x1 = self._prod_matern._evaluate_factors(x0, x1)[
-            ..., None, None, :
-        ]
-
-        ks_dderiv_dderiv_x0_x1 = np.where(
-            idx_equal_mask[None, :, :],
-            self._prod_matern_id_dderiv._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_dderiv_x0_x1,
+        # Includes the sign of the derivative w.r.t. `x1`
+        return -(self._prod_matern._scale_factors**2) * (
+            self._direction0 * self._direction1
         )
 
-        ks_dderiv_dderiv_x0_x1 = np.where(
-            idx_equal_mask[:, None, :],
-            self._prod_matern_dderiv_id._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_dderiv_x0_x1,
-        )
-
-        ks_dderiv_dderiv_x0_x1 = np.where(
-            idx_equal_mask[:, None, :] & idx_equal_mask[None, :, :],
-            self._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_dderiv_x0_x1,
-        )
+    @functools.cached_property
+    def _polynomial(self) -> tuple[float, ...]:
+        # g^{(2)}(s) = R(s) e^{-s}
+        return matern_polynomial(self._prod_matern.p, order=2)
 
-        return np.sum(
-            np.prod(ks_dderiv_dderiv_x0_x1, axis=-1),
-            axis=(-2, -1),
+    def _evaluate(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors(x0, x1),
+            self._prod_matern_dderiv_id._evaluate_factors(x0, x1),
+            self._prod_matern_id_dderiv._evaluate_factors(x0, x1),
+            self._evaluate_factors(x0, x1),
         )
 
     def _evaluate_factors(self, x0: np.ndarray, x1: np.ndarray | None) -> np.ndarray:
-        if x1 is None:
-            return np.broadcast_to(0.2 * self._directions_prod, shape=x0.shape)
-
-        diffs = x0 - x1
-
-        proj_scaled_diffs0 = self._rescaled_direction0 * diffs
-        proj_scaled_diffs1 = self._rescaled_direction1 * diffs
-        scaled_dists = self._prod_matern._scale_factors * np.abs(diffs)
-
         return (
-            np.exp(-scaled_dists)
-            * (1 / 15)
-            * (
-                (3 + scaled_dists * (3 + scaled_dists)) * self._directions_prod
-                - (1 + scaled_dists) * proj_scaled_diffs0 * proj_scaled_diffs1
-            )
+            self._prod_matern._exp_neg_scaled_distances(x0, x1)
+            * horner(self._polynomial, self._prod_matern._scaled_distances(x0, x1))
+            * self._directions_prod
         )
 
     def _evaluate_jax(self, x0: jnp.ndarray, x1: jnp.ndarray | None) -> jnp.ndarray:
-        idx_equal_mask = np.eye(self.input_shape[0], dtype=np.bool_)
-
-        ks_dderiv_dderiv_x0_x1 = self._prod_matern._evaluate_factors_jax(x0, x1)[
-            ..., None, None, :
-        ]
-
-        ks_dderiv_dderiv_x0_x1 = jnp.where(
-            idx_equal_mask[None, :, :],
-            self._prod_matern_id_dderiv._evaluate_factors_jax(x0, x1)[
-                ..., None, None, :
-            ],
-            ks_dderiv_dderiv_x0_x1,
-        )
-
-        ks_dderiv_dderiv_x0_x1 = jnp.where(
-            idx_equal_mask[:, None, :],
-            self._prod_matern_dderiv_id._evaluate_factors_jax(x0, x1)[
-                ..., None, None, :
-            ],
-            ks_dderiv_dderiv_x0_x1,
-        )
-
-        ks_dderiv_dderiv_x0_x1 = jnp.where(
-            idx_equal_mask[:, None, :] & idx_equal_mask[None, :, :],
-            self._evaluate_factors_jax(x0, x1)[..., None, None, :],
-            ks_dderiv_dderiv_x0_x1,
-        )
-
-        return jnp.sum(
-            jnp.prod(ks_dderiv_dderiv_x0_x1, axis=-1),
-            axis=(-2, -1),
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors_jax(x0, x1),
+            self._prod_matern_dderiv_id._evaluate_factors_jax(x0, x1),
+            self._prod_matern_id_dderiv._evaluate_factors_jax(x0, x1),
+            self._evaluate_factors_jax(x0, x1),
+            xp=jnp,
         )
 
     def _evaluate_factors_jax(
         self, x0: jnp.ndarray, x1: jnp.ndarray | None
     ) -> jnp.ndarray:
         if x1 is None:
-            return jnp.broadcast_to(0.2 * self._directions_prod, shape=x0.shape)
-
-        diffs = x0 - x1
-
-        proj_scaled_diffs0 = self._rescaled_direction0 * diffs
-        proj_scaled_diffs1 = self._rescaled_direction1 * diffs
-        scaled_dists = self._prod_matern._scale_factors * np.abs(diffs)
+            scaled_dists = jnp.zeros_like(x0)
+        else:
+            scaled_dists = self._prod_matern._scale_factors * jnp.abs(x0 - x1)
 
         return (
             jnp.exp(-scaled_dists)
-            * (1 / 15)
-            * (
-                (3 + scaled_dists * (3 + scaled_dists)) * self._directions_prod
-                - (1 + scaled_dists) * proj_scaled_diffs0 * proj_scaled_diffs1
-            )
+            * horner(self._polynomial, scaled_dists)
+            * self._directions_prod
         )
 
 
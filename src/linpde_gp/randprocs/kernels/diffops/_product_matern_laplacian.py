@@ -7,22 +7,34 @@ import numpy as np
 
 from linpde_gp.linfuncops import diffops
 
+from .._distance_cache import distance_cache
 from .._jax import JaxKernel
+from .._matern_polynomials import horner, matern_polynomial
 from .._product_matern import ProductMatern
 from .._stationary import JaxStationaryMixin
 from ._product_matern_directional_derivative import (
     ProductMatern_Identity_DirectionalDerivative,
 )
+from ._product_rule import sum_one_factor_replaced, sum_two_factors_replaced
 
 
 class ProductMatern_Identity_Laplacian(JaxKernel, JaxStationaryMixin):
     def __init__(self, prod_matern: ProductMatern, reverse: bool = True):
         self._prod_matern = prod_matern
 
+        if self._prod_matern.p < 2:
+            raise ValueError(
+                "The Laplacian of a `ProductMatern` kernel requires `p >= 2` "
+                f"({self._prod_matern.p=})."
+            )
+
         super().__init__(self._prod_matern.input_shape, output_shape=())
 
         self._reverse = bool(reverse)
 
+        # g^{(2)}(s) = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._prod_matern.p, order=2)
+
     @property
     def prod_matern(self) -> ProductMatern:
         return self._prod_matern
@@ -32,48 +44,27 @@ class ProductMatern_Identity_Laplacian(JaxKernel, JaxStationaryMixin):
         return self._reverse
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        return np.sum(
-            np.prod(
-                np.where(
-                    np.eye(self.input_shape[0], dtype=np.bool_),
-                    self._evaluate_factors(x0, x1)[..., None, :],
-                    self._prod_matern._evaluate_factors(x0, x1)[..., None, :],
-                ),
-                axis=-1,
-            ),
-            axis=-1,
+        return sum_one_factor_replaced(
+            self._prod_matern._evaluate_factors(x0, x1),
+            self._evaluate_factors(x0, x1),
         )
 
     def _evaluate_factors(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        if x1 is None:
-            scaled_dists = np.zeros_like(x0)
-        else:
-            scaled_dists = self._prod_matern._scale_factors * np.abs(x0 - x1)
-
-        if self._prod_matern.p == 3:
-            return (
-                self._prod_matern._scale_factors**2
-                * np.exp(-scaled_dists)
-                * ((1.0 / 15.0 * scaled_dists**2 - 0.2) * scaled_dists - 0.2)
-            )
-
-        raise ValueError()
+        return (
+            self._prod_matern._scale_factors**2
+            * self._prod_matern._exp_neg_scaled_distances(x0, x1)
+            * horner(self._polynomial, self._prod_matern._scaled_distances(x0, x1))
+        )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
-        return jnp.sum(
-            jnp.prod(
-                jnp.where(
-                    jnp.eye(self.input_shape[0], dtype=jnp.bool_),
-                    self._evaluate_factors(x0, x1)[..., None, :],
-                    self._prod_matern._evaluate_factors(x0, x1)[..., None, :],
-                ),
-                axis=-1,
-            ),
-            axis=-1,
+        return sum_one_factor_replaced(
+            self._prod_matern._evaluate_factors_jax(x0, x1),
+            self._evaluate_factors_jax(x0, x1),
+            xp=jnp,
         )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_factors_jax(
         self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]
     ) -> jnp.ndarray:
@@ -82,14 +73,11 @@ class ProductMatern_Identity_Laplacian(JaxKernel, JaxStationaryMixin):
         else:
             scaled_dists = self._prod_matern._scale_factors * jnp.abs(x0 - x1)
 
-        if self._prod_matern.p == 3:
-            return (
-                self._prod_matern._scale_factors**2
-                * jnp.exp(-scaled_dists)
-                * ((1.0 / 15.0 * scaled_dists**2 - 0.2) * scaled_dists - 0.2)
-            )
-
-        raise ValueError()
+        return (
+            self._prod_matern._scale_factors**2
+            * jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
 
 @diffops.Laplacian.__call__.register  # pylint: disable=no-member
@@ -110,71 +98,43 @@ class ProductMatern_Laplacian_Laplacian(JaxKernel, JaxStationaryMixin):
 
         super().__init__(self._prod_matern.input_shape, output_shape=())
 
+        # g^{(4)}(s) = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._prod_matern.p, order=4)
+
     @property
     def prod_matern(self) -> ProductMatern:
         return self._prod_matern
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        idx_equal_mask = np.eye(self.input_shape[0], dtype=np.bool_)
-
-        ks_x0_x1 = np.where(
-            idx_equal_mask[None, :, :] ^ idx_equal_mask[:, None, :],
-            self._prod_matern_id_lap._evaluate_factors(x0, x1)[..., None, None, :],
-            self._prod_matern._evaluate_factors(x0, x1)[..., None, None, :],
-        )
+        ks_id_lap_x0_x1 = self._prod_matern_id_lap._evaluate_factors(x0, x1)
 
-        ks_x0_x1 = np.where(
-            idx_equal_mask[None, :, :] & idx_equal_mask[:, None, :],
-            self._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_x0_x1,
-        )
-
-        return np.sum(
-            np.prod(ks_x0_x1, axis=-1),
-            axis=(-2, -1),
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors(x0, x1),
+            ks_id_lap_x0_x1,
+            ks_id_lap_x0_x1,
+            self._evaluate_factors(x0, x1),
         )
 
     def _evaluate_factors(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        if x1 is None:
-            scaled_dists = np.zeros_like(x0)
-        else:
-            scaled_dists = self._prod_matern._scale_factors * np.abs(x0 - x1)
-
-        if self._prod_matern.p == 3:
-            return (
-                self._prod_matern._scale_factors**4
-                * np.exp(-scaled_dists)
-                * (
-                    ((1.0 / 15.0 * scaled_dists - 0.4) * scaled_dists + 0.2)
-                    * scaled_dists
-                    + 0.2
-                )
-            )
-
-        raise ValueError()
-
-    @functools.partial(jax.jit, static_argnums=0)
-    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
-        idx_equal_mask = np.eye(self.input_shape[0], dtype=np.bool)
-
-        ks_x0_x1 = np.where(
-            idx_equal_mask[None, :, :] ^ idx_equal_mask[:, None, :],
-            self._prod_matern_id_lap._evaluate_factors(x0, x1)[..., None, None, :],
-            self._prod_matern._evaluate_factors(x0, x1)[..., None, None, :],
-        )
-
-        ks_x0_x1 = np.where(
-            idx_equal_mask[None, :, :] & idx_equal_mask[:, None, :],
-            self._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_x0_x1,
+        return (
+            self._prod_matern._scale_factors**4
+            * self._prod_matern._exp_neg_scaled_distances(x0, x1)
+            * horner(self._polynomial, self._prod_matern._scaled_distances(x0, x1))
         )
 
-        return np.sum(
-            np.prod(ks_x0_x1, axis=-1),
-            axis=(-2, -1),
+    @jax.jit
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        ks_id_lap_x0_x1 = self._prod_matern_id_lap._evaluate_factors_jax(x0, x1)
+
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors_jax(x0, x1),
+            ks_id_lap_x0_x1,
+            ks_id_lap_x0_x1,
+            self._evaluate_factors_jax(x0, x1),
+            xp=jnp,
         )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_factors_jax(
         self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]
     ) -> jnp.ndarray:
@@ -183,18 +143,11 @@ class ProductMatern_Laplacian_Laplacian(JaxKernel, JaxStationaryMixin):
         else:
             scaled_dists = self._prod_matern._scale_factors * jnp.abs(x0 - x1)
 
-        if self._prod_matern.p == 3:
-            return (
-                self._prod_matern._scale_factors**4
-                * jnp.exp(-scaled_dists)
-                * (
-                    ((1.0 / 15.0 * scaled_dists - 0.4) * scaled_dists + 0.2)
-                    * scaled_dists
-                    + 0.2
-                )
-            )
-
-        raise ValueError()
+        return (
+            self._prod_matern._scale_factors**4
+            * jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
+        )
 
 
 @diffops.Laplacian.__call__.register  # pylint: disable=no-member
@@ -231,6 +184,9 @@ class ProductMatern_DirectionalDerivative_Laplacian(JaxKernel, JaxStationaryMixi
             reverse=self._reverse,
         )
 
+        # g^{(3)}(s) / s = R(s) e^{-s}
+        self._polynomial = matern_polynomial(self._prod_matern.p, order=3, s_power=1)
+
     @property
     def prod_matern(self) -> ProductMatern:
         return self._prod_matern
@@ -242,70 +198,52 @@ class ProductMatern_DirectionalDerivative_Laplacian(JaxKernel, JaxStationaryMixi
         return -rescaled_dir if self._reverse else rescaled_dir
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        idx_equal_mask = np.eye(self.input_shape[0], dtype=np.bool_)
-
-        ks_dderiv_lap_x0_x1 = self._prod_matern._evaluate_factors(x0, x1)[
-            ..., None, None, :
-        ]
-
-        ks_dderiv_lap_x0_x1 = np.where(
-            idx_equal_mask[:, None, :],
-            self._prod_matern_dderiv_id._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_lap_x0_x1,
-        )
-
-        ks_dderiv_lap_x0_x1 = np.where(
-            idx_equal_mask[None, :, :],
-            self._prod_matern_id_lap._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_lap_x0_x1,
-        )
-
-        ks_dderiv_lap_x0_x1 = np.where(
-            idx_equal_mask[:, None, :] & idx_equal_mask[None, :, :],
-            self._evaluate_factors(x0, x1)[..., None, None, :],
-            ks_dderiv_lap_x0_x1,
-        )
-
-        return np.sum(
-            np.prod(ks_dderiv_lap_x0_x1, axis=-1),
-            axis=(-2, -1),
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors(x0, x1),
+            self._prod_matern_dderiv_id._evaluate_factors(x0, x1),
+            self._prod_matern_id_lap._evaluate_factors(x0, x1),
+            self._evaluate_factors(x0, x1),
         )
 
     def _evaluate_factors(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
         if x1 is None:
             return np.zeros_like(x0)
 
-        diffs = x0 - x1
+        diffs = distance_cache.differences(x0, x1)
 
         proj_scaled_diffs = self._rescaled_direction * diffs
-        scaled_dists = self._prod_matern._scale_factors * np.abs(diffs)
+        scaled_dists = self._prod_matern._scaled_distances(x0, x1)
 
         return (
-            (1 / 15)
-            * np.exp(-scaled_dists)
-            * (3 + scaled_dists * (3 - scaled_dists))
+            self._prod_matern._exp_neg_scaled_distances(x0, x1)
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @jax.jit
     def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        return sum_two_factors_replaced(
+            self._prod_matern._evaluate_factors_jax(x0, x1),
+            self._prod_matern_dderiv_id._evaluate_factors_jax(x0, x1),
+            self._prod_matern_id_lap._evaluate_factors_jax(x0, x1),
+            self._evaluate_factors_jax(x0, x1),
+            xp=jnp,
+        )
+
+    def _evaluate_factors_jax(
+        self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]
+    ) -> jnp.ndarray:
         if x1 is None:
-            return jnp.zeros_like(  # pylint: disable=unexpected-keyword-arg
-                x0,
-                shape=x0.shape[: x0.ndim - self.input_ndim],
-            )
+            return jnp.zeros_like(x0)
 
         diffs = x0 - x1
 
-        proj_scaled_diffs = self._batched_sum_jax(self._rescaled_direction * diffs)
-        scaled_dists = (
-            self._prod_matern._scale_factor * self._batched_euclidean_norm_jax(diffs)
-        )
+        proj_scaled_diffs = self._rescaled_direction * diffs
+        scaled_dists = self._prod_matern._scale_factors * jnp.abs(diffs)
 
         return (
-            (1 / 15)
-            * jnp.exp(-scaled_dists)
-            * (3 + scaled_dists * (3 - scaled_dists))
+            jnp.exp(-scaled_dists)
+            * horner(self._polynomial, scaled_dists)
             * proj_scaled_diffs
         )
 
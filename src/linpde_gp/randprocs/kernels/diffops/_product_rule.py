@@ -0,0 +1,59 @@
+r"""Evaluation of (mixed) derivatives of product kernels
+
+.. math::
+    k(x_0, x_1) = \prod_{l = 1}^D k_l(x_{0, l}, x_{1, l}).
+
+Applying first-order differential operators (or sums thereof, like the Laplacian) on
+both sides of a product kernel results in sums of products in which one or two of the
+factors are replaced by their derivatives. Instead of materializing all `D` (or `D^2`)
+products, we use prefix and suffix products, such that the evaluation costs `O(D)`
+per input pair. The functions work with both `numpy` and `jax.numpy` arrays, which is
+selected by the `xp` argument."""
+
+import numpy as np
+
+
+def sum_one_factor_replaced(ks, as_, *, xp=np):
+    r""":math:`\sum_i a_i \prod_{j \ne i} k_j` along the last axis.
+
+    The leave-one-out products are assembled from exclusive prefix and suffix
+    products, so that no division by the (possibly underflowing) factors is
+    needed."""
+    ones = xp.ones_like(ks[..., :1])
+
+    prefix_prods = xp.cumprod(xp.concatenate((ones, ks[..., :-1]), axis=-1), axis=-1)
+    suffix_prods = xp.flip(
+        xp.cumprod(
+            xp.concatenate((ones, xp.flip(ks[..., 1:], axis=-1)), axis=-1),
+            axis=-1,
+        ),
+        axis=-1,
+    )
+
+    return xp.sum(as_ * prefix_prods * suffix_prods, axis=-1)
+
+
+def sum_two_factors_replaced(ks, as_, bs, cs, *, xp=np):
+    r""":math:`\sum_i c_i \prod_{l \ne i} k_l + \sum_{i \ne j} a_i b_j
+    \prod_{l \ne i, j} k_l` along the last axis.
+
+    This is the coefficient of :math:`\epsilon_0 \epsilon_1` in the product
+    :math:`\prod_l (k_l + \epsilon_0 a_l + \epsilon_1 b_l + \epsilon_0 \epsilon_1
+    c_l)` with :math:`\epsilon_0^2 = \epsilon_1^2 = 0`, which we accumulate as a
+    prefix product over the factors."""
+    prod = xp.ones_like(ks[..., 0])
+    prod_a = xp.zeros_like(prod)
+    prod_b = xp.zeros_like(prod)
+    prod_ab = xp.zeros_like(prod)
+
+    for l in range(ks.shape[-1]):
+        k, a, b, c = ks[..., l], as_[..., l], bs[..., l], cs[..., l]
+
+        prod, prod_a, prod_b, prod_ab = (
+            prod * k,
+            prod_a * k + prod * a,
+            prod_b * k + prod * b,
+            prod_ab * k + prod_a * b + prod_b * a + prod * c,
+        )
+
+    return prod_ab
@@ -0,0 +1,230 @@
+import functools
+from typing import Optional
+
+from jax import numpy as jnp
+import numpy as np
+
+from linpde_gp.linfuncops import diffops
+
+from .._compact_support import CompactlySupportedKernelMixin
+from .._distance_cache import distance_cache
+from .._jax import JaxKernel
+from .._matern_polynomials import horner
+from .._stationary import JaxStationaryMixin
+from .._wendland import Wendland
+from .._wendland_polynomials import wendland_polynomial
+
+
+class Wendland_Identity_DirectionalDerivative(
+    JaxKernel, JaxStationaryMixin, CompactlySupportedKernelMixin
+):
+    def __init__(
+        self,
+        wendland: Wendland,
+        direction: np.ndarray,
+        reverse: bool = False,
+    ):
+        self._wendland = wendland
+
+        super().__init__(self._wendland.input_shape, output_shape=())
+
+        self._direction = direction
+
+        self._reverse = reverse
+
+        # (T \phi)(r) = (1 - r)^m Q(r)
+        self._power, self._polynomial = wendland_polynomial(
+            self._wendland.input_size, self._wendland.k, radial_derivatives=1
+        )
+
+    @property
+    def wendland(self) -> Wendland:
+        return self._wendland
+
+    @property
+    def direction(self) -> np.ndarray:
+        return self._direction
+
+    @property
+    def reverse(self) -> bool:
+        return self._reverse
+
+    @property
+    def support_radius(self) -> float:
+        return self._wendland.support_radius
+
+    @functools.cached_property
+    def _rescaled_direction(self) -> np.ndarray:
+        # Includes the sign of the derivative w.r.t. `x1`
+        rescaled_dir = -self._direction / self._wendland.support_radius**2
+
+        return -rescaled_dir if self._reverse else rescaled_dir
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        if x1 is None:
+            return np.zeros_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = distance_cache.differences(x0, x1)
+
+        proj_scaled_diffs = self._batched_sum(self._rescaled_direction * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm(diffs) / self._wendland.support_radius
+        )
+
+        return (
+            np.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            * proj_scaled_diffs
+        )
+
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        if x1 is None:
+            return jnp.zeros_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = x0 - x1
+
+        proj_scaled_diffs = self._batched_sum_jax(self._rescaled_direction * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm_jax(diffs) / self._wendland.support_radius
+        )
+
+        return (
+            jnp.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            * proj_scaled_diffs
+        )
+
+
+@diffops.DirectionalDerivative.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland, /, *, argnum: int = 0):
+    return Wendland_Identity_DirectionalDerivative(
+        wendland=k,
+        direction=self.direction,
+        reverse=(argnum == 0),
+    )
+
+
+class Wendland_DirectionalDerivative_DirectionalDerivative(
+    JaxKernel, CompactlySupportedKernelMixin
+):
+    def __init__(
+        self,
+        wendland: Wendland,
+        direction0: np.ndarray,
+        direction1: np.ndarray,
+    ):
+        self._wendland = wendland
+
+        super().__init__(self._wendland.input_shape, output_shape=())
+
+        self._direction0 = direction0
+        self._direction1 = direction1
+
+        # Tangential and radial parts of the Hessian of \phi(r), i.e. T \phi and
+        # T^2 \phi, respectively
+        self._power, self._polynomial = wendland_polynomial(
+            self._wendland.input_size, self._wendland.k, radial_derivatives=1
+        )
+        self._hessian_power, self._hessian_polynomial = wendland_polynomial(
+            self._wendland.input_size, self._wendland.k, radial_derivatives=2
+        )
+
+    @property
+    def wendland(self) -> Wendland:
+        return self._wendland
+
+    @property
+    def support_radius(self) -> float:
+        return self._wendland.support_radius
+
+    @functools.cached_property
+    def _rescaled_direction0(self) -> np.ndarray:
+        return self._direction0 / self._wendland.support_radius**2
+
+    @functools.cached_property
+    def _rescaled_direction1(self) -> np.ndarray:
+        return self._direction1 / self._wendland.support_radius**2
+
+    @functools.cached_property
+    def _directions_inprod(self) -> np.ndarray:
+        return self._batched_sum(self._direction0 * self._rescaled_direction1)
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        if x1 is None:
+            return np.full_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                -self._polynomial[-1] * self._directions_inprod,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = distance_cache.differences(x0, x1)
+
+        proj_scaled_diffs0 = self._batched_sum(self._rescaled_direction0 * diffs)
+        proj_scaled_diffs1 = self._batched_sum(self._rescaled_direction1 * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm(diffs) / self._wendland.support_radius
+        )
+
+        one_minus_scaled_dists = np.maximum(1.0 - scaled_dists, 0.0)
+
+        return -(
+            one_minus_scaled_dists**self._power
+            * horner(self._polynomial, scaled_dists)
+            * self._directions_inprod
+            + one_minus_scaled_dists**self._hessian_power
+            * horner(self._hessian_polynomial, scaled_dists)
+            * proj_scaled_diffs0
+            * proj_scaled_diffs1
+        )
+
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        if x1 is None:
+            return jnp.full_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                -self._polynomial[-1] * self._directions_inprod,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = x0 - x1
+
+        proj_scaled_diffs0 = self._batched_sum_jax(self._rescaled_direction0 * diffs)
+        proj_scaled_diffs1 = self._batched_sum_jax(self._rescaled_direction1 * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm_jax(diffs) / self._wendland.support_radius
+        )
+
+        one_minus_scaled_dists = jnp.maximum(1.0 - scaled_dists, 0.0)
+
+        return -(
+            one_minus_scaled_dists**self._power
+            * horner(self._polynomial, scaled_dists)
+            * self._directions_inprod
+            + one_minus_scaled_dists**self._hessian_power
+            * horner(self._hessian_polynomial, scaled_dists)
+            * proj_scaled_diffs0
+            * proj_scaled_diffs1
+        )
+
+
+@diffops.DirectionalDerivative.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland_Identity_DirectionalDerivative, /, *, argnum: int = 0):
+    if argnum == 0 and not k.reverse:
+        direction0 = self.direction
+        direction1 = k.direction
+    elif argnum == 1 and k.reverse:
+        direction0 = k.direction
+        direction1 = self.direction
+    else:
+        return super(diffops.DirectionalDerivative, self).__call__(k, argnum=argnum)
+
+    return Wendland_DirectionalDerivative_DirectionalDerivative(
+        wendland=k.wendland,
+        direction0=direction0,
+        direction1=direction1,
+    )
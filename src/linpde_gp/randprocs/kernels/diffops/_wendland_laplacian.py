@@ -0,0 +1,230 @@
+import functools
+from typing import Optional
+
+import jax
+from jax import numpy as jnp
+import numpy as np
+
+from linpde_gp.linfuncops import diffops
+
+from .._compact_support import CompactlySupportedKernelMixin
+from .._distance_cache import distance_cache
+from .._jax import JaxKernel
+from .._matern_polynomials import horner
+from .._stationary import JaxStationaryMixin
+from .._wendland import Wendland
+from .._wendland_polynomials import wendland_polynomial
+from ._wendland_directional_derivative import Wendland_Identity_DirectionalDerivative
+
+
+class Wendland_Identity_Laplacian(
+    JaxKernel, JaxStationaryMixin, CompactlySupportedKernelMixin
+):
+    def __init__(self, wendland: Wendland, reverse: bool = True):
+        self._wendland = wendland
+
+        super().__init__(self._wendland.input_shape, output_shape=())
+
+        self._reverse = bool(reverse)
+
+        # (\Delta_d \phi)(r) = (1 - r)^m Q(r)
+        self._power, self._polynomial = wendland_polynomial(
+            self._wendland.input_size, self._wendland.k, laplacians=1
+        )
+
+    @property
+    def wendland(self) -> Wendland:
+        return self._wendland
+
+    @property
+    def reverse(self) -> bool:
+        return self._reverse
+
+    @property
+    def support_radius(self) -> float:
+        return self._wendland.support_radius
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        scaled_dists = self._euclidean_distances(x0, x1) / self._wendland.support_radius
+
+        return (
+            np.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            / self._wendland.support_radius**2
+        )
+
+    @jax.jit
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        scaled_dists = (
+            self._euclidean_distances_jax(x0, x1) / self._wendland.support_radius
+        )
+
+        return (
+            jnp.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            / self._wendland.support_radius**2
+        )
+
+
+@diffops.Laplacian.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland, /, *, argnum: int = 0):  # pylint: disable=unused-argument
+    return Wendland_Identity_Laplacian(
+        wendland=k,
+        reverse=(argnum == 0),
+    )
+
+
+class Wendland_Laplacian_Laplacian(
+    JaxKernel, JaxStationaryMixin, CompactlySupportedKernelMixin
+):
+    def __init__(self, wendland: Wendland):
+        self._wendland = wendland
+
+        super().__init__(self._wendland.input_shape, output_shape=())
+
+        # (\Delta_d^2 \phi)(r) = (1 - r)^m Q(r)
+        self._power, self._polynomial = wendland_polynomial(
+            self._wendland.input_size, self._wendland.k, laplacians=2
+        )
+
+    @property
+    def wendland(self) -> Wendland:
+        return self._wendland
+
+    @property
+    def support_radius(self) -> float:
+        return self._wendland.support_radius
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        scaled_dists = self._euclidean_distances(x0, x1) / self._wendland.support_radius
+
+        return (
+            np.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            / self._wendland.support_radius**4
+        )
+
+    @jax.jit
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        scaled_dists = (
+            self._euclidean_distances_jax(x0, x1) / self._wendland.support_radius
+        )
+
+        return (
+            jnp.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            / self._wendland.support_radius**4
+        )
+
+
+@diffops.Laplacian.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland_Identity_Laplacian, /, *, argnum: int = 0):
+    if (argnum == 0 and not k.reverse) or (argnum == 1 and k.reverse):
+        return Wendland_Laplacian_Laplacian(wendland=k.wendland)
+
+    return super(diffops.Laplacian, self).__call__(k, argnum=argnum)
+
+
+class Wendland_DirectionalDerivative_Laplacian(
+    JaxKernel, JaxStationaryMixin, CompactlySupportedKernelMixin
+):
+    def __init__(
+        self,
+        wendland: Wendland,
+        direction: np.ndarray,
+        reverse: bool = False,
+    ):
+        self._wendland = wendland
+
+        super().__init__(self._wendland.input_shape, output_shape=())
+
+        self._direction = direction
+
+        self._reverse = bool(reverse)
+
+        # (T \Delta_d \phi)(r) = (1 - r)^m Q(r)
+        self._power, self._polynomial = wendland_polynomial(
+            self._wendland.input_size,
+            self._wendland.k,
+            laplacians=1,
+            radial_derivatives=1,
+        )
+
+    @property
+    def wendland(self) -> Wendland:
+        return self._wendland
+
+    @property
+    def support_radius(self) -> float:
+        return self._wendland.support_radius
+
+    @functools.cached_property
+    def _rescaled_direction(self) -> np.ndarray:
+        rescaled_dir = self._direction / self._wendland.support_radius**4
+
+        return -rescaled_dir if self._reverse else rescaled_dir
+
+    def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        if x1 is None:
+            return np.zeros_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = distance_cache.differences(x0, x1)
+
+        proj_scaled_diffs = self._batched_sum(self._rescaled_direction * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm(diffs) / self._wendland.support_radius
+        )
+
+        return (
+            np.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            * proj_scaled_diffs
+        )
+
+    @jax.jit
+    def _evaluate_jax(self, x0: jnp.ndarray, x1: Optional[jnp.ndarray]) -> jnp.ndarray:
+        if x1 is None:
+            return jnp.zeros_like(  # pylint: disable=unexpected-keyword-arg
+                x0,
+                shape=x0.shape[: x0.ndim - self.input_ndim],
+            )
+
+        diffs = x0 - x1
+
+        proj_scaled_diffs = self._batched_sum_jax(self._rescaled_direction * diffs)
+        scaled_dists = (
+            self._batched_euclidean_norm_jax(diffs) / self._wendland.support_radius
+        )
+
+        return (
+            jnp.maximum(1.0 - scaled_dists, 0.0) ** self._power
+            * horner(self._polynomial, scaled_dists)
+            * proj_scaled_diffs
+        )
+
+
+@diffops.DirectionalDerivative.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland_Identity_Laplacian, /, *, argnum: int = 0):
+    if (argnum == 0 and not k.reverse) or (argnum == 1 and k.reverse):
+        return Wendland_DirectionalDerivative_Laplacian(
+            wendland=k.wendland,
+            direction=self.direction,
+            reverse=(argnum == 1),
+        )
+
+    return super(diffops.DirectionalDerivative, self).__call__(k, argnum=argnum)
+
+
+@diffops.Laplacian.__call__.register  # pylint: disable=no-member
+def _(self, k: Wendland_Identity_DirectionalDerivative, /, *, argnum: int = 0):
+    if (argnum == 0 and not k.reverse) or (argnum == 1 and k.reverse):
+        return Wendland_DirectionalDerivative_Laplacian(
+            wendland=k.wendland,
+            direction=k.direction,
+            reverse=(argnum == 0),
+        )
+
+    return super(diffops.Laplacian, self).__call__(k, argnum=argnum)
@@ -22,3 +22,37 @@ def test_valid_matrix_square_root(dim: int, A: np.ndarray):
     L = linpde_gp.linalg.pivoted_cholesky(A, k=dim)
 
     np.testing.assert_almost_equal(L @ L.T, A)
+
+
+def test_lazy_trace_error_termination(A: np.ndarray):
+    rtol = 1e-2
+
+    L = linpde_gp.linalg.lazy_pivoted_cholesky(
+        np.diag(A).copy(), lambda i: A[:, i], rtol=rtol
+    )
+
+    assert np.trace(A - L @ L.T) <= rtol * np.trace(A) * (1 + 1e-12)
+
+
+def test_preconditioner_woodbury(dim: int, A: np.ndarray):
+    shift = 1e-2
+
+    preconditioner = (
+        linpde_gp.linalg.solvers.preconditioners.PivotedCholeskyPreconditioner(
+            max_rank=dim // 4, shift=shift
+        )
+    )
+    precond_inv = preconditioner(pn.problems.LinearSystem(A, np.ones(dim)))
+
+    L = linpde_gp.linalg.lazy_pivoted_cholesky(
+        np.diag(A) - shift,
+        lambda i: A[:, i] - shift * np.eye(dim)[:, i],
+        max_rank=dim // 4,
+        rtol=1e-2,
+    )
+
+    np.testing.assert_allclose(
+        precond_inv @ np.eye(dim),
+        np.linalg.inv(L @ L.T + shift * np.eye(dim)),
+        rtol=1e-8,
+    )
@@ -0,0 +1,88 @@
+import numpy as np
+import probnum as pn
+import pytest
+
+import linpde_gp
+
+
+@pytest.fixture
+def dim() -> int:
+    return 300
+
+
+@pytest.fixture
+def problem(dim: int) -> pn.problems.LinearSystem:
+    rng = np.random.default_rng(2349)
+
+    X = rng.uniform(size=(dim, 1))
+
+    # Ill-conditioned kernel Gram matrix with a small nugget, for which unpreconditioned
+    # CG does not converge within `maxiter` iterations
+    A = np.exp(-0.5 * (X - X.T) ** 2 / 0.1**2) + 1e-4 * np.eye(dim)
+
+    return pn.problems.LinearSystem(A, rng.standard_normal(dim))
+
+
+@pytest.fixture
+def preconditioner() -> linpde_gp.linalg.solvers.preconditioners.Preconditioner:
+    return linpde_gp.linalg.solvers.preconditioners.PivotedCholeskyPreconditioner(
+        max_rank=20, shift=1e-4, rtol=0.0
+    )
+
+
+@pytest.fixture
+def maxiter() -> int:
+    return 30
+
+
+def _relative_residual_norm(problem: pn.problems.LinearSystem, x: np.ndarray) -> float:
+    return np.linalg.norm(problem.b - problem.A @ x) / np.linalg.norm(problem.b)
+
+
+def test_bayescg(
+    problem: pn.problems.LinearSystem,
+    preconditioner: linpde_gp.linalg.solvers.preconditioners.Preconditioner,
+    maxiter: int,
+):
+    x = linpde_gp.linalg.solvers.bayescg(
+        problem.A,
+        problem.b,
+        maxiter=maxiter,
+        atol=0.0,
+        rtol=1e-5,
+        preconditioner=preconditioner,
+    )
+
+    assert _relative_residual_norm(problem, x.mean) <= 1e-5
+
+
+def test_lowrank_cg(
+    problem: pn.problems.LinearSystem,
+    preconditioner: linpde_gp.linalg.solvers.preconditioners.Preconditioner,
+    maxiter: int,
+):
+    solver = linpde_gp.linalg.solvers.LowRankCG(
+        stopping_criteria=(
+            linpde_gp.linalg.solvers.stopping_criteria.MaxIterations(maxiter),
+            linpde_gp.linalg.solvers.stopping_criteria.ResidualNorm(
+                atol=0.0, rtol=1e-5
+            ),
+        ),
+        preconditioner=preconditioner,
+    )
+
+    belief, _ = solver.solve(problem)
+
+    assert _relative_residual_norm(problem, belief.x.mean) <= 1e-5
+
+
+def test_cg(
+    problem: pn.problems.LinearSystem,
+    preconditioner: linpde_gp.linalg.solvers.preconditioners.Preconditioner,
+    maxiter: int,
+):
+    solver = linpde_gp.linalg.solvers.ConjugateGradients(preconditioner=preconditioner)
+
+    x = solver.solve(problem, maxiter=maxiter)
+
+    assert _relative_residual_norm(problem, x.support) <= 1e-5
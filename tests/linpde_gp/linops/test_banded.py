@@ -0,0 +1,50 @@
+import numpy as np
+import probnum as pn
+import pytest
+import scipy.sparse
+
+import linpde_gp
+
+
+@pytest.fixture
+def dim() -> int:
+    return 64
+
+
+@pytest.fixture
+def operator(dim: int) -> linpde_gp.linops.SymmetricBanded:
+    ts = np.linspace(0.0, 1.0, dim)
+    diffs = np.abs(ts[:, None] - ts[None, :])
+
+    # Wendland kernel with compact support
+    gram = np.maximum(1.0 - diffs / 0.1, 0.0) ** 4 * (1.0 + 4.0 * diffs / 0.1)
+
+    return linpde_gp.linops.SymmetricBanded(
+        scipy.sparse.csr_matrix(gram + 1e-3 * np.eye(dim))
+    )
+
+
+def test_bandwidth(operator: linpde_gp.linops.SymmetricBanded):
+    assert operator.bandwidth == 6
+
+
+def test_matmul(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(435).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(operator @ x, operator.todense() @ x, atol=1e-12)
+    np.testing.assert_allclose(x.T @ operator, x.T @ operator.todense(), atol=1e-12)
+
+
+def test_inv(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(3245).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(
+        operator.inv() @ x, np.linalg.solve(operator.todense(), x)
+    )
+
+
+def test_inverse_factor(dim: int, operator: linpde_gp.linops.SymmetricBanded):
+    U = operator.inverse_factor.todense()
+
+    np.testing.assert_allclose(U @ U.T @ operator.todense(), np.eye(dim), atol=1e-9)
+    np.testing.assert_allclose(operator.inverse_factor.T.todense(), U.T, atol=1e-12)
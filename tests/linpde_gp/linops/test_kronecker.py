@@ -0,0 +1,56 @@
+import functools
+
+import numpy as np
+import probnum as pn
+import pytest
+
+import linpde_gp
+
+
+@pytest.fixture
+def factors() -> tuple[np.ndarray, ...]:
+    return tuple(
+        np.exp(-0.5 * ((ts[:, None] - ts[None, :]) / 0.3) ** 2)
+        for ts in (np.linspace(0.0, 1.0, 5), np.linspace(0.0, 2.0, 4), np.zeros(1))
+    )
+
+
+@pytest.fixture
+def operator(factors: tuple[np.ndarray, ...]) -> linpde_gp.linops.KroneckerProduct:
+    return linpde_gp.linops.KroneckerProduct(factors, shift=1e-2)
+
+
+def test_todense(factors: tuple[np.ndarray, ...], operator: pn.linops.LinearOperator):
+    np.testing.assert_allclose(
+        operator.todense(),
+        functools.reduce(np.kron, factors) + 1e-2 * np.eye(operator.shape[0]),
+    )
+
+
+def test_matmul(operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(8734).standard_normal((operator.shape[1], 3))
+
+    np.testing.assert_allclose(operator @ x, operator.todense() @ x, atol=1e-12)
+
+
+def test_inv(operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(2341).standard_normal((operator.shape[1], 3))
+
+    np.testing.assert_allclose(
+        operator.inv() @ x, np.linalg.solve(operator.todense(), x)
+    )
+
+
+def test_inverse_factor(operator: linpde_gp.linops.KroneckerProduct):
+    U = operator.inverse_factor.todense()
+
+    np.testing.assert_allclose(
+        U @ U.T, np.linalg.inv(operator.todense()), rtol=1e-8, atol=1e-8
+    )
+
+
+def test_oracles(operator: linpde_gp.linops.KroneckerProduct):
+    dense = operator.todense()
+
+    np.testing.assert_allclose(operator.diagonal(), np.diag(dense))
+    np.testing.assert_allclose(operator.column(7), dense[:, 7])
@@ -0,0 +1,56 @@
+import numpy as np
+import probnum as pn
+import pytest
+import scipy.sparse
+
+import linpde_gp
+
+
+@pytest.fixture
+def dim() -> int:
+    return 100
+
+
+@pytest.fixture
+def operator(dim: int) -> linpde_gp.linops.SymmetricSparse:
+    X = np.random.default_rng(2390).uniform(size=(dim, 2))
+    dists = np.sqrt(np.sum((X[:, None, :] - X[None, :, :]) ** 2, axis=-1))
+
+    # Wendland kernel with compact support on scattered points, i.e. without banded
+    # structure
+    gram = np.maximum(1.0 - dists / 0.2, 0.0) ** 4 * (1.0 + 4.0 * dists / 0.2)
+
+    return linpde_gp.linops.SymmetricSparse(
+        scipy.sparse.csr_matrix(gram + 1e-3 * np.eye(dim))
+    )
+
+
+def test_sparsity(dim: int, operator: linpde_gp.linops.SymmetricSparse):
+    assert operator.A.nnz < dim**2 // 4
+
+
+def test_matmul(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(435).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(operator @ x, operator.todense() @ x, atol=1e-12)
+    np.testing.assert_allclose(x.T @ operator, x.T @ operator.todense(), atol=1e-12)
+
+
+def test_inv(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(3245).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(
+        operator.inv() @ x, np.linalg.solve(operator.todense(), x)
+    )
+
+
+def test_inverse_factor(dim: int, operator: linpde_gp.linops.SymmetricSparse):
+    U = operator.inverse_factor.todense()
+
+    np.testing.assert_allclose(U @ U.T @ operator.todense(), np.eye(dim), atol=1e-9)
+    np.testing.assert_allclose(operator.inverse_factor.T.todense(), U.T, atol=1e-12)
+
+
+def test_not_positive_definite(dim: int):
+    with pytest.raises(np.linalg.LinAlgError):
+        linpde_gp.linops.SymmetricSparse(-scipy.sparse.identity(dim)).ldl
@@ -0,0 +1,55 @@
+import numpy as np
+import probnum as pn
+import pytest
+import scipy.linalg
+
+import linpde_gp
+
+
+@pytest.fixture
+def dim() -> int:
+    return 64
+
+
+@pytest.fixture
+def operator(dim: int) -> linpde_gp.linops.SymmetricToeplitz:
+    ts = np.linspace(0.0, 1.0, dim)
+
+    return linpde_gp.linops.SymmetricToeplitz(
+        np.exp(-0.5 * (ts / 0.1) ** 2) + 1e-3 * (ts == 0.0)
+    )
+
+
+def test_todense(operator: pn.linops.LinearOperator):
+    np.testing.assert_array_equal(
+        operator.todense(), scipy.linalg.toeplitz(operator.first_column)
+    )
+
+
+def test_matmul(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(435).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(operator @ x, operator.todense() @ x, atol=1e-12)
+
+
+def test_inv(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(3245).standard_normal((dim, 3))
+
+    np.testing.assert_allclose(
+        operator.inv() @ x, np.linalg.solve(operator.todense(), x)
+    )
+
+
+def test_oracles(dim: int, operator: pn.linops.LinearOperator):
+    dense = operator.todense()
+
+    np.testing.assert_array_equal(operator.diagonal(), np.diag(dense))
+    np.testing.assert_array_equal(operator.column(dim // 3), dense[:, dim // 3])
+
+
+def test_inv_batched(dim: int, operator: pn.linops.LinearOperator):
+    x = np.random.default_rng(9812).standard_normal((2, dim, 3))
+
+    np.testing.assert_allclose(
+        operator.inv() @ x, np.linalg.solve(operator.todense(), x)
+    )
@@ -0,0 +1,109 @@
+import jax
+import numpy as np
+import probnum as pn
+import scipy.integrate
+
+import pytest
+
+import linpde_gp
+
+jax.config.update("jax_enable_x64", True)
+
+Interval = linpde_gp.domains.Interval
+Box = linpde_gp.domains.Box
+
+
+@pytest.fixture(
+    params=[
+        (
+            linpde_gp.randprocs.kernels.Matern(input_shape=(), p=3, lengthscale=0.4),
+            (Interval(-0.3, 1.1), Interval(0.5, 2.0)),
+        ),
+        (
+            linpde_gp.randprocs.kernels.Matern(input_shape=(), p=1, lengthscale=0.9),
+            (Interval(-0.3, 1.1), Interval(-0.3, 1.1)),
+        ),
+        (
+            linpde_gp.randprocs.kernels.ExpQuad(input_shape=(), lengthscales=0.7),
+            (Interval(-0.3, 1.1), Interval(0.5, 2.0)),
+        ),
+        (
+            linpde_gp.randprocs.kernels.ExpQuad(
+                input_shape=(2,), lengthscales=[0.5, 0.8]
+            ),
+            (Box([[0.0, 1.0], [-1.0, 0.5]]), Box([[0.5, 2.0], [-0.5, 0.0]])),
+        ),
+        (
+            linpde_gp.randprocs.kernels.ProductMatern(
+                input_shape=(2,), p=2, lengthscales=[0.5, 0.8]
+            ),
+            (Box([[0.0, 1.0], [-1.0, 0.5]]), Box([[0.5, 2.0], [-0.5, 0.0]])),
+        ),
+    ],
+    ids=[
+        "matern-interval",
+        "matern-same-interval",
+        "expquad-interval",
+        "expquad-box",
+        "product-matern-box",
+    ],
+)
+def kernel_and_domains(request):
+    return request.param
+
+
+@pytest.fixture
+def kernel(kernel_and_domains) -> pn.randprocs.kernels.Kernel:
+    return kernel_and_domains[0]
+
+
+@pytest.fixture
+def integrals(kernel_and_domains) -> tuple[linpde_gp.linfunctls.LebesgueIntegral]:
+    return tuple(
+        linpde_gp.linfunctls.LebesgueIntegral(domain)
+        for domain in kernel_and_domains[1]
+    )
+
+
+def _integrate(f, domain: Interval | Box) -> float:
+    bounds = np.reshape(np.asarray(domain), (-1, 2))
+
+    return scipy.integrate.nquad(
+        lambda *x: f(np.reshape(x, domain.shape)),
+        ranges=[tuple(interval) for interval in bounds],
+        opts={"epsabs": 1e-12},
+    )[0]
+
+
+def test_kL_matches_quadrature(
+    kernel: pn.randprocs.kernels.Kernel,
+    integrals: tuple[linpde_gp.linfunctls.LebesgueIntegral],
+):
+    integral = integrals[0]
+    kL = integral(kernel, argnum=1)
+
+    xs = np.random.default_rng(3249).uniform(-1.0, 2.0, size=(4,) + kernel.input_shape)
+
+    np.testing.assert_allclose(
+        kL(xs),
+        [_integrate(lambda t, x=x: kernel(x, t), integral.domain) for x in xs],
+        rtol=1e-8,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(kL.jax(xs), kL(xs), rtol=1e-12)
+
+
+def test_LkL_matches_quadrature(
+    kernel: pn.randprocs.kernels.Kernel,
+    integrals: tuple[linpde_gp.linfunctls.LebesgueIntegral],
+):
+    integral0, integral1 = integrals
+
+    Lk = integral0(kernel, argnum=0)
+
+    np.testing.assert_allclose(
+        integral1(Lk),
+        _integrate(Lk, integral1.domain),
+        rtol=1e-8,
+    )
+    np.testing.assert_allclose(integral1(Lk), integral0(integral1(kernel, argnum=1)))
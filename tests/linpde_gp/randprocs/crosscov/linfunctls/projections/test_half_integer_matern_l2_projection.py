@@ -0,0 +1,97 @@
+import numpy as np
+
+import pytest
+from pytest_cases import fixture
+
+import linpde_gp
+from linpde_gp.linfunctls.projections.l2 import (
+    L2Projection_UnivariateLinearInterpolationBasis,
+)
+from linpde_gp.randprocs.crosscov.linfunctls.projections import (
+    Matern_L2Projection_UnivariateLinearInterpolationBasis,
+)
+
+
+@fixture
+@pytest.mark.parametrize("p", [1, 3])
+def kernel(p: int) -> linpde_gp.randprocs.kernels.Matern:
+    return linpde_gp.randprocs.kernels.Matern(input_shape=(), p=p, lengthscale=0.3)
+
+
+@fixture
+def kernel_lambda(
+    kernel: linpde_gp.randprocs.kernels.Matern,
+) -> linpde_gp.randprocs.kernels.JaxLambdaKernel:
+    return linpde_gp.randprocs.kernels.JaxLambdaKernel(
+        kernel.jax, input_shape=(), vectorize=False
+    )
+
+
+@fixture
+@pytest.mark.parametrize("uniform", [True, False])
+@pytest.mark.parametrize("zero_boundary", [False, True])
+def projection(
+    uniform: bool, zero_boundary: bool
+) -> L2Projection_UnivariateLinearInterpolationBasis:
+    if uniform:
+        grid = np.linspace(-1.0, 1.0, 12)
+    else:
+        grid = np.sort(np.random.default_rng(4576).uniform(-1.0, 1.0, size=12))
+
+    return linpde_gp.functions.bases.UnivariateLinearInterpolationBasis(
+        grid, zero_boundary=zero_boundary
+    ).l2_projection()
+
+
+@fixture
+def projection_reference(
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+) -> L2Projection_UnivariateLinearInterpolationBasis:
+    # The default quadrature order is not accurate enough for the tolerances below on
+    # the non-uniform grid
+    return projection.basis.l2_projection(
+        normalized=projection.normalized, quadrature_order=30
+    )
+
+
+def test_dispatch(
+    kernel: linpde_gp.randprocs.kernels.Matern,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    assert isinstance(
+        projection(kernel, argnum=1),
+        Matern_L2Projection_UnivariateLinearInterpolationBasis,
+    )
+
+
+def test_kPa_matches_quadrature(
+    kernel: linpde_gp.randprocs.kernels.Matern,
+    kernel_lambda: linpde_gp.randprocs.kernels.JaxLambdaKernel,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+    projection_reference: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    xs = np.concatenate((np.linspace(-1.3, 1.3, 20), projection.basis.x_i[[2, 5]]))
+
+    np.testing.assert_allclose(
+        projection(kernel, argnum=1)(xs),
+        projection_reference(kernel_lambda, argnum=1)(xs),
+        rtol=1e-10,
+        atol=1e-12,
+    )
+
+
+def test_PkPa_matches_quadrature(
+    kernel: linpde_gp.randprocs.kernels.Matern,
+    kernel_lambda: linpde_gp.randprocs.kernels.JaxLambdaKernel,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+    projection_reference: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    PkPa = projection(projection(kernel, argnum=1))
+
+    np.testing.assert_allclose(PkPa, PkPa.T, rtol=1e-12)
+    np.testing.assert_allclose(
+        PkPa,
+        projection_reference(projection_reference(kernel_lambda, argnum=1)),
+        rtol=1e-9,
+        atol=1e-11,
+    )
@@ -0,0 +1,121 @@
+from jax import numpy as jnp
+import numpy as np
+import scipy.integrate
+
+import pytest
+from pytest_cases import fixture
+
+import linpde_gp
+from linpde_gp.linfunctls.projections.l2 import (
+    L2Projection_UnivariateLinearInterpolationBasis,
+)
+
+
+@fixture
+def kernel() -> linpde_gp.randprocs.kernels.JaxKernel:
+    # Hide the Matérn kernel behind a lambda, so that the projections are computed by
+    # quadrature instead of in closed form
+    return linpde_gp.randprocs.kernels.JaxLambdaKernel(
+        linpde_gp.randprocs.kernels.Matern(input_shape=(), p=2, lengthscale=0.4).jax,
+        input_shape=(),
+        vectorize=False,
+    )
+
+
+@fixture
+@pytest.mark.parametrize("zero_boundary", [False, True])
+def projection(zero_boundary: bool) -> L2Projection_UnivariateLinearInterpolationBasis:
+    grid = np.sort(np.random.default_rng(2934).uniform(-1.0, 1.0, size=9))
+
+    return linpde_gp.functions.bases.UnivariateLinearInterpolationBasis(
+        grid, zero_boundary=zero_boundary
+    ).l2_projection(normalized=False)
+
+
+def _hat_integral(basis, idx: int, f, **kwargs) -> float:
+    return scipy.integrate.quad(
+        lambda t: basis.eval_elem(idx, t) * f(t),
+        *basis.support_bounds(idx),
+        points=[basis.x_i[idx]],
+        epsabs=1e-13,
+        **kwargs,
+    )[0]
+
+
+def test_kPa_matches_adaptive_quadrature(
+    kernel: linpde_gp.randprocs.kernels.JaxKernel,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    basis = projection.basis
+    xs = np.concatenate((np.linspace(-1.2, 1.2, 7), basis.x_i[[1, 4]]))
+
+    kPa_xs = projection(kernel, argnum=1)(xs)
+
+    for x, kPa_x in zip(xs, kPa_xs):
+        np.testing.assert_allclose(
+            kPa_x,
+            [
+                _hat_integral(basis, idx, lambda t, x=x: kernel(x, t), limit=200)
+                for idx in range(len(basis))
+            ],
+            atol=1e-12,
+        )
+
+
+def test_kPa_jax(
+    kernel: linpde_gp.randprocs.kernels.JaxKernel,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    kPa = projection(kernel, argnum=1)
+    xs = np.linspace(-1.2, 1.2, 11)
+
+    np.testing.assert_allclose(kPa.jax(jnp.asarray(xs)), kPa(xs), rtol=1e-12)
+
+
+def _matern_p2(x0: np.ndarray, x1: np.ndarray) -> np.ndarray:
+    # NumPy version of the Matérn kernel hidden in the `kernel` fixture
+    scaled_dists = np.sqrt(5) * np.abs(x0 - x1) / 0.4
+
+    return (1.0 + scaled_dists + scaled_dists**2 / 3.0) * np.exp(-scaled_dists)
+
+
+def test_PkPa_matches_adaptive_quadrature(
+    kernel: linpde_gp.randprocs.kernels.JaxKernel,
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    basis = projection.basis
+    projection = basis.l2_projection(normalized=False, quadrature_order=20)
+
+    PkPa = projection(projection(kernel, argnum=1))
+
+    np.testing.assert_allclose(PkPa, PkPa.T, rtol=1e-12)
+
+    # Nested adaptive quadrature, since `dblquad` does not resolve the kink of the
+    # kernel on the diagonal to the required accuracy
+    for idx0, idx1 in [(0, 0), (2, 3)]:
+        np.testing.assert_allclose(
+            PkPa[idx0, idx1],
+            _hat_integral(
+                basis,
+                idx0,
+                lambda x0: _hat_integral(
+                    basis, idx1, lambda x1, x0=x0: _matern_p2(x0, x1), limit=200
+                ),
+            ),
+            atol=1e-10,
+        )
+
+
+def test_function_projection(
+    projection: L2Projection_UnivariateLinearInterpolationBasis,
+):
+    f = linpde_gp.functions.JaxLambdaFunction(jnp.cos, input_shape=())
+
+    np.testing.assert_allclose(
+        projection(f),
+        [
+            _hat_integral(projection.basis, idx, np.cos)
+            for idx in range(len(projection.basis))
+        ],
+        atol=1e-12,
+    )
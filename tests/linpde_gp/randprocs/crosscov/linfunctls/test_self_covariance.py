@@ -0,0 +1,49 @@
+from jax import numpy as jnp
+import numpy as np
+import pytest
+
+import linpde_gp
+from linpde_gp.randprocs.crosscov.linfunctls import _self_covariance, self_covariance
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch: pytest.MonkeyPatch):
+    # Test the tiling with multiple (and ragged) blocks
+    monkeypatch.setattr(_self_covariance, "_BLOCK_SIZE", 7)
+
+
+@pytest.fixture
+def k() -> linpde_gp.randprocs.kernels.JaxKernel:
+    return linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=0.4)
+
+
+@pytest.fixture
+def X() -> np.ndarray:
+    return np.random.default_rng(2348).uniform(size=(4, 5, 2))
+
+
+@pytest.mark.parametrize("xp", [np, jnp])
+def test_dirac(k: linpde_gp.randprocs.kernels.JaxKernel, X: np.ndarray, xp):
+    L = linpde_gp.linfunctls.DiracFunctional(
+        input_domain_shape=(2,), input_codomain_shape=(), X=X
+    )
+    kLa = L(k, argnum=1)
+
+    gram = self_covariance(L, kLa, xp=xp)
+
+    assert gram.shape == L.output_shape + L.output_shape
+
+    np.testing.assert_allclose(gram, L(kLa), rtol=1e-12)
+
+
+@pytest.mark.parametrize("xp", [np, jnp])
+def test_composite(k: linpde_gp.randprocs.kernels.JaxKernel, X: np.ndarray, xp):
+    L = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,)).to_linfunctl(X)
+    kLa = L(k, argnum=1)
+
+    gram = np.reshape(self_covariance(L, kLa, xp=xp), (L.output_size, -1))
+
+    np.testing.assert_array_equal(gram, gram.T)
+    np.testing.assert_allclose(
+        gram, np.reshape(L(kLa), (L.output_size, -1)), rtol=1e-10
+    )
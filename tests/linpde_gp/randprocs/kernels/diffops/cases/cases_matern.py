@@ -7,14 +7,16 @@ import linpde_gp
 from ._test_case import KernelLinFuncOpTestCase
 
 input_shapes = ((),)
+ps = (2, 3, 5)
 
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps,
 )
-def case_identity_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_identity_laplacian(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape, p=p),
         L0=None,
         L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
     )
@@ -22,10 +24,11 @@ def case_identity_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps,
 )
-def case_laplacian_identity(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_laplacian_identity(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
         L1=None,
     )
@@ -33,10 +36,11 @@ def case_laplacian_identity(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps,
 )
-def case_laplacian_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_laplacian_laplacian(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.Matern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
         L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
     )
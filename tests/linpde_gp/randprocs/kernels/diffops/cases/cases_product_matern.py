@@ -7,14 +7,18 @@ import linpde_gp
 
 from ._test_case import KernelLinFuncOpTestCase
 
-input_shapes = ((1,), (2,))
+input_shapes = ((1,), (2,), (5,))
+ps_directional_derivative = (1, 3, 4)
+ps_laplacian = (2, 3, 4)
 
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_directional_derivative,
 )
 def case_identity_directional_derivative(
     input_shape: ShapeType,
+    p: int,
 ) -> KernelLinFuncOpTestCase:
     rng = np.random.default_rng(390852098)
 
@@ -22,7 +26,7 @@ def case_identity_directional_derivative(
     direction /= np.sqrt(np.sum(direction**2))
 
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=None,
         L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
     )
@@ -30,9 +34,11 @@ def case_identity_directional_derivative(
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_directional_derivative,
 )
 def case_directional_derivative_identity(
     input_shape: ShapeType,
+    p: int,
 ) -> KernelLinFuncOpTestCase:
     rng = np.random.default_rng(390852098)
 
@@ -40,7 +46,7 @@ def case_directional_derivative_identity(
     direction /= np.sqrt(np.sum(direction**2))
 
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
         L1=None,
     )
@@ -48,9 +54,11 @@ def case_directional_derivative_identity(
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_directional_derivative,
 )
 def case_directional_derivative_directional_derivative(
     input_shape: ShapeType,
+    p: int,
 ) -> KernelLinFuncOpTestCase:
     rng = np.random.default_rng(390852098)
 
@@ -61,7 +69,7 @@ def case_directional_derivative_directional_derivative(
     direction1 /= np.sqrt(np.sum(direction1**2))
 
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction0),
         L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction1),
     )
@@ -69,10 +77,11 @@ def case_directional_derivative_directional_derivative(
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_laplacian,
 )
-def case_identity_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_identity_laplacian(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=None,
         L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
     )
@@ -80,10 +89,11 @@ def case_identity_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_laplacian,
 )
-def case_laplacian_identity(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_laplacian_identity(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
         L1=None,
     )
@@ -91,10 +101,11 @@ def case_laplacian_identity(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_laplacian,
 )
-def case_laplacian_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
+def case_laplacian_laplacian(input_shape: ShapeType, p: int) -> KernelLinFuncOpTestCase:
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
         L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
     )
@@ -102,9 +113,11 @@ def case_laplacian_laplacian(input_shape: ShapeType) -> KernelLinFuncOpTestCase:
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_laplacian,
 )
 def case_directional_derivative_laplacian(
     input_shape: ShapeType,
+    p: int,
 ) -> KernelLinFuncOpTestCase:
     rng = np.random.default_rng(390852098)
 
@@ -112,7 +125,7 @@ def case_directional_derivative_laplacian(
     direction /= np.sqrt(np.sum(direction**2))
 
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
         L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
     )
@@ -120,9 +133,11 @@ def case_directional_derivative_laplacian(
 
 @parametrize(
     input_shape=input_shapes,
+    p=ps_laplacian,
 )
 def case_laplacian_directional_derivative(
     input_shape: ShapeType,
+    p: int,
 ) -> KernelLinFuncOpTestCase:
     rng = np.random.default_rng(390852098)
 
@@ -130,7 +145,7 @@ def case_laplacian_directional_derivative(
     direction /= np.sqrt(np.sum(direction**2))
 
     return KernelLinFuncOpTestCase(
-        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape),
+        k=linpde_gp.randprocs.kernels.ProductMatern(input_shape=input_shape, p=p),
         L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
         L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
     )
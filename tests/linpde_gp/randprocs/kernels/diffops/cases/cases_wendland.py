@@ -0,0 +1,171 @@
+import numpy as np
+from probnum.typing import ShapeType
+
+from pytest_cases import parametrize
+
+import linpde_gp
+
+from ._test_case import KernelLinFuncOpTestCase
+
+input_shapes = ((1,), (2,), (3,))
+ks_directional_derivative = (1, 2, 3)
+ks_hessian = (2, 3)
+ks_laplacian = (2, 3)
+
+# Most pairs of the test inputs lie within the support of the kernel
+support_radius = 6.0
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_directional_derivative,
+)
+def case_identity_directional_derivative(
+    input_shape: ShapeType,
+    k: int,
+) -> KernelLinFuncOpTestCase:
+    rng = np.random.default_rng(390852098)
+
+    direction = rng.standard_normal(size=input_shape)
+    direction /= np.sqrt(np.sum(direction**2))
+
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=None,
+        L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_directional_derivative,
+)
+def case_directional_derivative_identity(
+    input_shape: ShapeType,
+    k: int,
+) -> KernelLinFuncOpTestCase:
+    rng = np.random.default_rng(390852098)
+
+    direction = rng.standard_normal(size=input_shape)
+    direction /= np.sqrt(np.sum(direction**2))
+
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
+        L1=None,
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_hessian,
+)
+def case_directional_derivative_directional_derivative(
+    input_shape: ShapeType,
+    k: int,
+) -> KernelLinFuncOpTestCase:
+    rng = np.random.default_rng(390852098)
+
+    direction0 = rng.standard_normal(size=input_shape)
+    direction0 /= np.sqrt(np.sum(direction0**2))
+
+    direction1 = rng.standard_normal(size=input_shape)
+    direction1 /= np.sqrt(np.sum(direction1**2))
+
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction0),
+        L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction1),
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_laplacian,
+)
+def case_identity_laplacian(input_shape: ShapeType, k: int) -> KernelLinFuncOpTestCase:
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=None,
+        L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_laplacian,
+)
+def case_laplacian_identity(input_shape: ShapeType, k: int) -> KernelLinFuncOpTestCase:
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+        L1=None,
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_laplacian,
+)
+def case_laplacian_laplacian(input_shape: ShapeType, k: int) -> KernelLinFuncOpTestCase:
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+        L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_laplacian,
+)
+def case_directional_derivative_laplacian(
+    input_shape: ShapeType,
+    k: int,
+) -> KernelLinFuncOpTestCase:
+    rng = np.random.default_rng(390852098)
+
+    direction = rng.standard_normal(size=input_shape)
+    direction /= np.sqrt(np.sum(direction**2))
+
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
+        L1=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+    )
+
+
+@parametrize(
+    input_shape=input_shapes,
+    k=ks_laplacian,
+)
+def case_laplacian_directional_derivative(
+    input_shape: ShapeType,
+    k: int,
+) -> KernelLinFuncOpTestCase:
+    rng = np.random.default_rng(390852098)
+
+    direction = rng.standard_normal(size=input_shape)
+    direction /= np.sqrt(np.sum(direction**2))
+
+    return KernelLinFuncOpTestCase(
+        k=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=input_shape, k=k, support_radius=support_radius
+        ),
+        L0=linpde_gp.linfuncops.diffops.Laplacian(domain_shape=input_shape),
+        L1=linpde_gp.linfuncops.diffops.DirectionalDerivative(direction),
+    )
@@ -31,4 +31,19 @@ def test_L0_k_L1_adj(test_case: KernelLinFuncOpTestCase):
     if np.any(nan_mask):
         L0_k_L1_adj_jax[nan_mask] = L0_k_L1_adj[nan_mask]
 
-    np.testing.assert_allclose(L0_k_L1_adj, L0_k_L1_adj_jax, atol=1e-14)
+    # Automatic differentiation of radial kernels through the Euclidean norm suffers
+    # from cancellation for distinct, but (nearly) coincident inputs, so the reference
+    # values are inaccurate for such pairs
+    dists = np.sqrt(
+        np.sum(
+            (Xs[:, None] - Xs[None, :]) ** 2,
+            axis=tuple(range(2, 2 + len(test_case.k.input_shape))),
+        )
+    )
+    compare_mask = (dists == 0.0) | (dists > 1e-3)
+
+    np.testing.assert_allclose(
+        L0_k_L1_adj[compare_mask],
+        L0_k_L1_adj_jax[compare_mask],
+        atol=1e-12 * np.max(np.abs(L0_k_L1_adj_jax)),
+    )
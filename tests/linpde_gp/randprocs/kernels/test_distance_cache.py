@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+import linpde_gp
+from linpde_gp.randprocs.kernels import DistanceCache
+
+
+@pytest.fixture
+def xs() -> np.ndarray:
+    return np.random.default_rng(9823).standard_normal((20, 3))
+
+
+def test_shared_between_views(xs: np.ndarray):
+    cache = DistanceCache()
+
+    with cache:
+        diffs = cache.differences(xs[:, None], xs[None, :])
+
+        assert cache.differences(xs[:, None], xs[None, :]) is diffs
+        assert not diffs.flags.writeable
+
+        np.testing.assert_array_equal(diffs, xs[:, None] - xs[None, :])
+        np.testing.assert_allclose(
+            cache.squared_euclidean_distances(xs[:, None], xs[None, :], input_ndim=1),
+            np.sum((xs[:, None] - xs[None, :]) ** 2, axis=-1),
+        )
+
+
+def test_scoped(xs: np.ndarray):
+    cache = DistanceCache()
+
+    with cache:
+        with cache:
+            cache.differences(xs[:, None], xs[None, :])
+
+        # Only the outermost scope clears the cache
+        assert len(cache) == 1
+
+    assert not cache.active
+    assert len(cache) == 0
+
+    # Outside of a scope, in-place updates of the inputs are visible
+    cache.differences(xs[:, None], xs[None, :])
+    xs[0] += 1.0
+
+    assert len(cache) == 0
+    np.testing.assert_array_equal(
+        cache.differences(xs[:, None], xs[None, :]), xs[:, None] - xs[None, :]
+    )
+
+
+def test_lru_eviction(xs: np.ndarray):
+    entry_nbytes = (xs[:, None] - xs[None, :]).nbytes
+
+    cache = DistanceCache(max_bytes=2 * entry_nbytes)
+
+    with cache:
+        ys = [xs + i for i in range(3)]
+
+        diffs_0 = cache.differences(ys[0][:, None], ys[0][None, :])
+        cache.differences(ys[1][:, None], ys[1][None, :])
+
+        # Touch the first entry, such that the second one is evicted next
+        assert cache.differences(ys[0][:, None], ys[0][None, :]) is diffs_0
+
+        cache.differences(ys[2][:, None], ys[2][None, :])
+
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+        assert cache.differences(ys[0][:, None], ys[0][None, :]) is diffs_0
+
+        cache.max_bytes = 0
+
+        assert len(cache) == 0
+
+
+def test_kernel_values_unchanged(xs: np.ndarray):
+    k = linpde_gp.randprocs.kernels.ExpQuad(input_shape=(3,), lengthscales=0.7)
+    k_lap = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(3,))(k, argnum=1)
+
+    cache = linpde_gp.randprocs.kernels.distance_cache
+
+    with cache:
+        k_X_X = k(xs[:, None], xs[None, :])
+        k_lap_X_X = k_lap(xs[:, None], xs[None, :])
+
+        assert len(cache) > 0
+
+    assert len(cache) == 0
+
+    np.testing.assert_allclose(k(xs[:, None], xs[None, :]), k_X_X)
+    np.testing.assert_allclose(k_lap(xs[:, None], xs[None, :]), k_lap_X_X)
+
+
+@pytest.mark.parametrize(
+    "k",
+    [
+        linpde_gp.randprocs.kernels.ExpQuad(input_shape=(3,), lengthscales=0.7),
+        linpde_gp.randprocs.kernels.ProductMatern(
+            input_shape=(3,), lengthscales=[0.5, 0.8, 1.2]
+        ),
+    ],
+)
+def test_exponentials_shared_with_derivatives(
+    k: linpde_gp.randprocs.kernels.JaxKernel, xs: np.ndarray
+):
+    laplacian = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(3,))
+    k_lap_lap = laplacian(laplacian(k, argnum=1), argnum=0)
+
+    cache = linpde_gp.randprocs.kernels.distance_cache
+
+    with cache:
+        k_lap_lap(xs[:, None], xs[None, :])
+
+        num_entries = len(cache)
+
+        # All quantities needed to evaluate the kernel itself are already cached
+        k_X_X = k(xs[:, None], xs[None, :])
+
+        assert len(cache) == num_entries
+
+    np.testing.assert_allclose(k_X_X, k.jax(xs[:, None], xs[None, :]))
+
+
+@pytest.mark.parametrize("lengthscales", [None, np.array([0.5, 0.8, 1.2])])
+def test_squared_distances_from_differences(
+    xs: np.ndarray, lengthscales: np.ndarray | None
+):
+    cache = DistanceCache()
+
+    with cache:
+        diffs = cache.differences(xs[:, None], xs[None, :])
+
+        assert cache.hits == 0
+        assert cache.misses == 1
+
+        dists_sq = cache.squared_euclidean_distances(
+            xs[:, None], xs[None, :], input_ndim=1, lengthscales=lengthscales
+        )
+
+        # The squared distances are derived from the cached differences
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    scaled_diffs = diffs if lengthscales is None else diffs / lengthscales
+
+    np.testing.assert_allclose(dists_sq, np.sum(scaled_diffs**2, axis=-1))
@@ -0,0 +1,117 @@
+import gc
+import weakref
+
+from jax import numpy as jnp
+import numpy as np
+import pytest
+
+import linpde_gp
+
+
+def _k(x0: jnp.ndarray, x1: jnp.ndarray) -> jnp.ndarray:
+    return jnp.sum(x0 * x1) * jnp.exp(-0.5 * jnp.sum((x0 - x1) ** 2))
+
+
+@pytest.fixture
+def k() -> linpde_gp.randprocs.kernels.JaxLambdaKernel:
+    return linpde_gp.randprocs.kernels.JaxLambdaKernel(_k, input_shape=(3,))
+
+
+@pytest.mark.parametrize(
+    "x0_shape,x1_shape",
+    [
+        ((5, 1, 3), (1, 4, 3)),
+        ((5, 3), (5, 3)),
+        ((3,), (6, 3)),
+        ((3,), (3,)),
+        ((2, 1, 1, 3), (7, 3)),
+    ],
+)
+def test_batched_evaluation(
+    k: linpde_gp.randprocs.kernels.JaxLambdaKernel,
+    x0_shape: tuple[int, ...],
+    x1_shape: tuple[int, ...],
+):
+    rng = np.random.default_rng(3481)
+
+    x0 = rng.standard_normal(x0_shape)
+    x1 = rng.standard_normal(x1_shape)
+
+    np.testing.assert_allclose(
+        k(x0, x1),
+        jnp.vectorize(_k, signature="(d),(d)->()")(x0, x1),
+        rtol=1e-12,
+    )
+
+
+def test_fallback_cached(k: linpde_gp.randprocs.kernels.JaxLambdaKernel):
+    L = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(3,))
+
+    k_L_adj = L(k, argnum=1)
+
+    assert L(k, argnum=1) is k_L_adj
+    assert L(k_L_adj, argnum=0) is L(k_L_adj, argnum=0)
+
+
+@pytest.mark.parametrize(
+    "make_L",
+    [
+        lambda: linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(3,)),
+        lambda: linpde_gp.linfuncops.diffops.TimeDerivative(domain_shape=(3,)),
+    ],
+)
+def test_fallback_cached_for_equal_operators(
+    k: linpde_gp.randprocs.kernels.JaxLambdaKernel, make_L
+):
+    L0 = make_L()
+    L1 = make_L()
+
+    assert L0 is not L1
+    assert L0 == L1 and hash(L0) == hash(L1)
+
+    assert L0(k, argnum=1) is L1(k, argnum=1)
+
+
+def test_operator_equality():
+    diffops = linpde_gp.linfuncops.diffops
+
+    assert diffops.HeatOperator((3,), alpha=0.5) == diffops.HeatOperator((3,), 0.5)
+    assert hash(diffops.HeatOperator((3,), alpha=0.5)) == hash(
+        diffops.HeatOperator((3,), alpha=0.5)
+    )
+    assert diffops.HeatOperator((3,), alpha=0.5) != diffops.HeatOperator((3,), 0.25)
+    assert diffops.PartialDerivative((3,), 1) != diffops.PartialDerivative((3,), 2)
+    assert diffops.Laplacian((3,)) != diffops.Laplacian((2,))
+    assert diffops.Laplacian((3,)) != diffops.SpatialLaplacian((3,))
+
+
+def test_fallback_cache_does_not_keep_kernel_alive():
+    # Not a fixture, since pytest holds references to fixture values
+    k = linpde_gp.randprocs.kernels.JaxLambdaKernel(_k, input_shape=(3,))
+    L = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(3,))
+
+    k_L_adj = L(k, argnum=1)
+    k_L_adj(np.zeros((2, 3)), np.ones((2, 3)))
+
+    k_ref = weakref.ref(k)
+    k_L_adj_ref = weakref.ref(k_L_adj)
+
+    del k, k_L_adj
+    gc.collect()
+
+    assert k_ref() is None
+    assert k_L_adj_ref() is None
+
+
+def test_fallback_heat_operator(k: linpde_gp.randprocs.kernels.JaxLambdaKernel):
+    L = linpde_gp.linfuncops.diffops.HeatOperator(domain_shape=(3,), alpha=0.5)
+
+    L_k_L_adj = L(L(k, argnum=1), argnum=0)
+
+    xs = np.random.default_rng(129).standard_normal((10, 3))
+
+    np.testing.assert_allclose(
+        L_k_L_adj(xs[:, None], xs[None, :]),
+        L_k_L_adj(xs[:, None], xs[None, :]).T,
+        rtol=1e-10,
+    )
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import scipy.special
+
+from linpde_gp.randprocs.kernels._matern_polynomials import (
+    horner,
+    matern_hessian_polynomial,
+    matern_polynomial,
+)
+
+
+@pytest.mark.parametrize("p", range(7))
+def test_matern_polynomial_matches_bessel_form(p: int):
+    nu = p + 0.5
+    s = np.linspace(1e-3, 10.0, 200)
+
+    k_bessel = 2 ** (1 - nu) / scipy.special.gamma(nu) * s**nu * scipy.special.kv(nu, s)
+
+    np.testing.assert_allclose(
+        horner(matern_polynomial(p), s) * np.exp(-s),
+        k_bessel,
+        rtol=1e-12,
+        atol=1e-14,
+    )
+
+
+@pytest.mark.parametrize("p", range(5))
+@pytest.mark.parametrize("order", range(1, 5))
+def test_matern_polynomial_derivatives(p: int, order: int):
+    s = np.linspace(0.1, 5.0, 50)
+    h = 1e-5
+
+    def g(s, order):
+        return horner(matern_polynomial(p, order), s) * np.exp(-s)
+
+    np.testing.assert_allclose(
+        (g(s + h, order - 1) - g(s - h, order - 1)) / (2 * h),
+        g(s, order),
+        atol=1e-8,
+    )
+
+
+def test_matern_polynomial_p3():
+    np.testing.assert_allclose(matern_polynomial(3), (1 / 15, 2 / 5, 1.0, 1.0))
+    np.testing.assert_allclose(
+        matern_polynomial(3, order=3, s_power=1), (-1 / 15, 1 / 5, 1 / 5)
+    )
+    np.testing.assert_allclose(matern_hessian_polynomial(3), (1 / 15, 1 / 15))
+
+
+def test_matern_polynomial_not_smooth_enough():
+    with pytest.raises(ValueError):
+        matern_polynomial(0, order=1, s_power=1)
+
+    with pytest.raises(ValueError):
+        matern_polynomial(1, order=3, s_power=1)
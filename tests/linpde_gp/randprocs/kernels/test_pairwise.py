@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from linpde_gp.randprocs.kernels._pairwise import squared_euclidean_distances
+
+
+@pytest.mark.parametrize(
+    "x0_shape,x1_shape,input_ndim",
+    [
+        ((50, 1, 3), (70, 3), 1),
+        ((5, 1, 3), (1, 4, 3), 1),
+        ((5, 3), (5, 3), 1),
+        ((3,), (6, 3), 1),
+        ((2, 3, 1, 1, 2, 2), (4, 2, 2), 2),
+        ((7, 1), (9,), 0),
+    ],
+)
+def test_matches_broadcast_differences(
+    x0_shape: tuple[int, ...], x1_shape: tuple[int, ...], input_ndim: int
+):
+    rng = np.random.default_rng(2390)
+
+    x0 = rng.standard_normal(x0_shape) + 100.0
+    x1 = rng.standard_normal(x1_shape) + 100.0
+
+    np.testing.assert_allclose(
+        # Small blocks to test the tiling
+        squared_euclidean_distances(x0, x1, input_ndim, block_bytes=256),
+        np.sum((x0 - x1) ** 2, axis=tuple(range(-input_ndim, 0))),
+        rtol=1e-12,
+    )
+
+
+def test_cancellation():
+    xs = 5.0 + 1e-3 * np.random.default_rng(4591).standard_normal((100, 4))
+    xs[50] = xs[10] + 1e-9
+
+    dists_sq = squared_euclidean_distances(xs[:, None], xs[None, :], input_ndim=1)
+
+    np.testing.assert_array_equal(np.diag(dists_sq), 0.0)
+    np.testing.assert_allclose(
+        dists_sq,
+        np.sum((xs[:, None] - xs[None, :]) ** 2, axis=-1),
+        rtol=1e-12,
+    )
@@ -0,0 +1,92 @@
+from jax import numpy as jnp
+import numpy as np
+import probnum as pn
+import scipy.integrate
+
+import pytest
+
+import linpde_gp
+
+
+@pytest.mark.parametrize(
+    "k",
+    [
+        linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=[0.5, 1.5]),
+        linpde_gp.randprocs.kernels.Matern(input_shape=(2,), p=1, lengthscale=0.7),
+        2.0 * linpde_gp.randprocs.kernels.Matern(input_shape=(), p=2),
+    ],
+)
+def test_kernel_approximation(k: pn.randprocs.kernels.Kernel):
+    rng = np.random.default_rng(3240)
+
+    phi = linpde_gp.randprocs.kernels.random_fourier_features(k, 20000, rng)
+
+    X = rng.uniform(-1.0, 1.0, size=(10,) + k.input_shape)
+
+    np.testing.assert_allclose(
+        phi(X) @ phi(X).T, k.matrix(X), atol=5.0 * np.sqrt(k(X[0], X[0]) / 10000)
+    )
+
+
+@pytest.fixture
+def phi() -> linpde_gp.functions.FourierFeatures:
+    return linpde_gp.randprocs.kernels.random_fourier_features(
+        linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=0.5),
+        10,
+        np.random.default_rng(9123),
+    )
+
+
+@pytest.fixture
+def X() -> np.ndarray:
+    return np.random.default_rng(576).uniform(size=(7, 2))
+
+
+@pytest.mark.parametrize(
+    "D",
+    [
+        linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,)),
+        linpde_gp.linfuncops.diffops.SpatialLaplacian(domain_shape=(2,)),
+        linpde_gp.linfuncops.diffops.DirectionalDerivative([0.3, -1.2]),
+        linpde_gp.linfuncops.diffops.HeatOperator(domain_shape=(2,), alpha=0.2),
+    ],
+)
+def test_diffop_matches_autodiff(
+    phi: linpde_gp.functions.FourierFeatures,
+    X: np.ndarray,
+    D: linpde_gp.linfuncops.LinearFunctionOperator,
+):
+    D_phi = D(phi)
+
+    assert isinstance(D_phi, linpde_gp.functions.FourierFeatures)
+
+    for i in range(phi.num_features):
+        D_phi_i = D(
+            linpde_gp.functions.JaxLambdaFunction(
+                lambda x, i=i: phi.jax(x)[i], input_shape=(2,)
+            )
+        )
+
+        np.testing.assert_allclose(D_phi(X)[:, i], D_phi_i(X), rtol=1e-10, atol=1e-10)
+
+
+def test_jax_matches_numpy(phi: linpde_gp.functions.FourierFeatures, X: np.ndarray):
+    np.testing.assert_allclose(phi.jax(jnp.asarray(X)), phi(X), rtol=1e-12)
+
+
+def test_lebesgue_integral(phi: linpde_gp.functions.FourierFeatures):
+    domain = linpde_gp.domains.Box([[-0.5, 1.0], [0.2, 0.9]])
+
+    integrals = linpde_gp.linfunctls.LebesgueIntegral(domain)(phi)
+
+    assert integrals.shape == phi.output_shape
+
+    for i in range(phi.num_features):
+        np.testing.assert_allclose(
+            integrals[i],
+            scipy.integrate.nquad(
+                lambda *x, i=i: phi(np.array(x))[i],
+                ranges=[tuple(interval) for interval in domain],
+            )[0],
+            rtol=1e-8,
+        )
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+import linpde_gp
+
+
+@pytest.fixture(params=[1, 2], ids=lambda dim: f"dim={dim}")
+def ski_kernel(request) -> linpde_gp.randprocs.kernels.SKIKernel:
+    dim = request.param
+
+    return linpde_gp.randprocs.kernels.SKIKernel(
+        1.5**2
+        * linpde_gp.randprocs.kernels.ProductMatern(
+            input_shape=(dim,),
+            lengthscales=0.5,
+        ),
+        grids=[np.linspace(-1.0, 1.0, 40) for _ in range(dim)],
+    )
+
+
+@pytest.fixture
+def X(ski_kernel: linpde_gp.randprocs.kernels.SKIKernel) -> np.ndarray:
+    return np.random.default_rng(2390).uniform(
+        -1.0, 1.0, size=(30,) + ski_kernel.input_shape
+    )
+
+
+def test_grid_gram(ski_kernel: linpde_gp.randprocs.kernels.SKIKernel):
+    assert isinstance(
+        ski_kernel.grid_gram,
+        (
+            linpde_gp.linops.SymmetricToeplitz
+            if len(ski_kernel.grids) == 1
+            else linpde_gp.linops.KroneckerProduct
+        ),
+    )
+
+    np.testing.assert_allclose(
+        ski_kernel.grid_gram.todense(),
+        ski_kernel.kernel(
+            ski_kernel.grid_points[:, None], ski_kernel.grid_points[None, :]
+        ),
+        atol=1e-12,
+    )
+
+
+def test_interpolation_matrix(
+    ski_kernel: linpde_gp.randprocs.kernels.SKIKernel, X: np.ndarray
+):
+    W = ski_kernel.interpolation_matrix(X)
+
+    assert W.nnz == X.shape[0] * 2 ** len(ski_kernel.grids)
+
+    np.testing.assert_allclose(W.sum(axis=1), 1.0)
+
+    # Multilinear interpolation reproduces affine functions
+    np.testing.assert_allclose(
+        W @ np.sum(ski_kernel.grid_points, axis=-1), np.sum(X, axis=-1)
+    )
+
+
+def test_evaluate(ski_kernel: linpde_gp.randprocs.kernels.SKIKernel, X: np.ndarray):
+    W = ski_kernel.interpolation_matrix(X)
+
+    np.testing.assert_allclose(
+        ski_kernel(X[:, None], X[None, :]),
+        W @ ski_kernel.grid_gram.todense() @ W.T.toarray(),
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        ski_kernel(X, None),
+        np.diag(W @ ski_kernel.grid_gram.todense() @ W.T.toarray()),
+        atol=1e-12,
+    )
+
+
+def test_approximation(
+    ski_kernel: linpde_gp.randprocs.kernels.SKIKernel, X: np.ndarray
+):
+    np.testing.assert_allclose(
+        ski_kernel(X[:, None], X[None, :]),
+        ski_kernel.kernel(X[:, None], X[None, :]),
+        atol=5e-2,
+    )
@@ -0,0 +1,37 @@
+import numpy as np
+import probnum as pn
+import scipy.integrate
+
+import pytest
+
+import linpde_gp
+
+
+@pytest.mark.parametrize(
+    "k",
+    [
+        linpde_gp.randprocs.kernels.ExpQuad(input_shape=(), lengthscales=0.6),
+        linpde_gp.randprocs.kernels.Matern(input_shape=(), p=1, lengthscale=0.6),
+        linpde_gp.randprocs.kernels.Matern(input_shape=(1,), p=3, lengthscale=1.2),
+    ],
+)
+@pytest.mark.parametrize("tau", [0.0, 0.4, 1.3])
+def test_inverse_fourier_transform(k: pn.randprocs.kernels.Kernel, tau: float):
+    # k(τ) = (2π)^{-1} ∫ S(ω) cos(ω τ) dω in one dimension
+    integral = scipy.integrate.quad(
+        lambda omega: (
+            linpde_gp.randprocs.kernels.spectral_density(
+                k, np.reshape(omega, k.input_shape)
+            )
+            * np.cos(omega * tau)
+        ),
+        -np.inf,
+        np.inf,
+        limit=200,
+    )[0]
+
+    np.testing.assert_allclose(
+        integral / (2 * np.pi),
+        k(np.zeros(k.input_shape), np.full(k.input_shape, tau)),
+        rtol=1e-6,
+    )
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from linpde_gp.randprocs.kernels._matern_polynomials import horner
+from linpde_gp.randprocs.kernels._wendland_polynomials import wendland_polynomial
+
+
+def _eval(d: int, k: int, r: np.ndarray, **kwargs) -> np.ndarray:
+    power, coeffs = wendland_polynomial(d, k, **kwargs)
+
+    return np.maximum(1.0 - r, 0.0) ** power * horner(coeffs, r)
+
+
+@pytest.mark.parametrize(
+    "d,k,phi",
+    [
+        (1, 0, lambda r: (1 - r)),
+        (3, 0, lambda r: (1 - r) ** 2),
+        (3, 1, lambda r: (1 - r) ** 4 * (4 * r + 1)),
+        (3, 2, lambda r: (1 - r) ** 6 * (35 * r**2 + 18 * r + 3) / 3),
+        (3, 3, lambda r: (1 - r) ** 8 * (32 * r**3 + 25 * r**2 + 8 * r + 1)),
+    ],
+)
+def test_wendland_polynomial_closed_forms(d: int, k: int, phi):
+    r = np.linspace(0.0, 1.0, 50)
+
+    np.testing.assert_allclose(_eval(d, k, r), phi(r), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+@pytest.mark.parametrize("k", [2, 3])
+def test_wendland_polynomial_derivatives(d: int, k: int):
+    r = np.linspace(0.05, 0.95, 50)
+    h = 1e-5
+
+    def g(r, **kwargs):
+        return _eval(d, k, r, **kwargs)
+
+    def deriv(f):
+        return (f(r + h) - f(r - h)) / (2 * h)
+
+    # T \phi
+    np.testing.assert_allclose(deriv(g) / r, g(r, radial_derivatives=1), atol=1e-7)
+
+    # \Delta_d \phi = d T \phi + r (T \phi)'
+    np.testing.assert_allclose(
+        d * g(r, radial_derivatives=1)
+        + r * deriv(lambda r: g(r, radial_derivatives=1)),
+        g(r, laplacians=1),
+        atol=1e-6,
+    )
+
+    # T \Delta_d \phi
+    np.testing.assert_allclose(
+        deriv(lambda r: g(r, laplacians=1)) / r,
+        g(r, laplacians=1, radial_derivatives=1),
+        atol=1e-6,
+    )
+
+
+def test_wendland_polynomial_not_smooth_enough():
+    with pytest.raises(ValueError):
+        wendland_polynomial(2, 1, laplacians=2)
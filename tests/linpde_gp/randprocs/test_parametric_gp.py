@@ -0,0 +1,123 @@
+import numpy as np
+import probnum as pn
+
+import pytest
+
+import linpde_gp
+
+
+@pytest.fixture
+def prior() -> linpde_gp.randprocs.ParametricGaussianProcess:
+    return linpde_gp.randprocs.ParametricGaussianProcess.from_random_fourier_features(
+        linpde_gp.randprocs.kernels.Matern(input_shape=(2,), p=2, lengthscale=0.5),
+        num_features=40,
+        rng=np.random.default_rng(8734),
+    )
+
+
+@pytest.fixture
+def L() -> linpde_gp.linfuncops.LinearFunctionOperator:
+    return linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,))
+
+
+@pytest.fixture
+def X() -> np.ndarray:
+    return np.random.default_rng(2365).uniform(size=(25, 2))
+
+
+@pytest.fixture
+def X_test() -> np.ndarray:
+    return np.random.default_rng(1287).uniform(size=(10, 2))
+
+
+def test_linfunctl_matches_kernel(
+    prior: linpde_gp.randprocs.ParametricGaussianProcess,
+    L: linpde_gp.linfuncops.LinearFunctionOperator,
+    X: np.ndarray,
+):
+    L_prior = L(prior)
+
+    assert isinstance(L_prior, linpde_gp.randprocs.ParametricGaussianProcess)
+
+    L_prior_X = L.to_linfunctl(X)(prior)
+
+    np.testing.assert_allclose(L_prior_X.mean, L_prior.mean(X))
+    np.testing.assert_allclose(
+        L_prior_X.cov, L_prior.cov.matrix(X), rtol=1e-10, atol=1e-10
+    )
+
+
+def test_conditioning_matches_function_space(
+    prior: linpde_gp.randprocs.ParametricGaussianProcess,
+    L: linpde_gp.linfuncops.LinearFunctionOperator,
+    X: np.ndarray,
+    X_test: np.ndarray,
+):
+    Y = np.sin(X[:, 0]) * np.cos(X[:, 1])
+    b = pn.randvars.Normal(np.zeros(X.shape[0]), 0.1**2 * np.eye(X.shape[0]))
+
+    posterior = prior.condition_on_observations(Y, X, L=L, b=b)
+
+    assert isinstance(posterior, linpde_gp.randprocs.ParametricGaussianProcess)
+
+    # Reference: Gaussian conditioning of the joint distribution of the process
+    # values and the observations
+    L_X = L.to_linfunctl(X)
+
+    gram = L_X(prior).cov + b.cov
+    crosscov = L_X(prior.feature_fn) @ prior.feature_fn(X_test).T
+    gain = np.linalg.solve(gram, crosscov).T
+
+    np.testing.assert_allclose(posterior.mean(X_test), gain @ Y, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(
+        posterior.cov.matrix(X_test),
+        prior.cov.matrix(X_test) - gain @ crosscov,
+        rtol=1e-8,
+        atol=1e-10,
+    )
+
+
+@pytest.fixture
+def hilbert_gp() -> linpde_gp.randprocs.ParametricGaussianProcess:
+    return linpde_gp.randprocs.ParametricGaussianProcess.from_laplace_eigenfunctions(
+        linpde_gp.randprocs.kernels.Matern(input_shape=(2,), p=1, lengthscale=0.6),
+        domain=linpde_gp.domains.Box([[0.0, 6.0], [0.0, 6.0]]),
+        num_frequencies=(200, 200),
+    )
+
+
+def test_laplace_eigenfunctions_approximate_kernel(
+    hilbert_gp: linpde_gp.randprocs.ParametricGaussianProcess,
+):
+    k = linpde_gp.randprocs.kernels.Matern(input_shape=(2,), p=1, lengthscale=0.6)
+
+    # Away from the boundary of the domain
+    X = 3.0 + np.random.default_rng(3465).uniform(-0.5, 0.5, size=(10, 2))
+
+    np.testing.assert_allclose(hilbert_gp.cov.matrix(X), k.matrix(X), atol=1e-3)
+
+
+def test_laplace_eigenfunctions_dirichlet_boundary(
+    hilbert_gp: linpde_gp.randprocs.ParametricGaussianProcess,
+):
+    X_boundary = np.array([[0.0, 1.0], [6.0, 2.5], [3.0, 0.0], [4.0, 6.0]])
+
+    boundary_values = linpde_gp.linfunctls.DiracFunctional(
+        input_domain_shape=(2,), input_codomain_shape=(), X=X_boundary
+    )(hilbert_gp)
+
+    np.testing.assert_array_equal(boundary_values.mean, 0.0)
+    np.testing.assert_array_equal(boundary_values.cov, 0.0)
+
+
+def test_laplace_eigenfunctions_laplacian(
+    hilbert_gp: linpde_gp.randprocs.ParametricGaussianProcess,
+    L: linpde_gp.linfuncops.LinearFunctionOperator,
+):
+    L_basis = L(hilbert_gp).feature_fn
+
+    assert isinstance(L_basis, linpde_gp.functions.bases.SineBasis)
+
+    np.testing.assert_array_equal(
+        L_basis.coefficients, hilbert_gp.feature_fn.laplacian_eigenvalues
+    )
@@ -164,6 +164,754 @@ def test_posterior_gp(
     np.testing.assert_allclose(iter_X_test.cov, naive_X_test.cov)
 
 
+def test_posterior_gp_var(
+    posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
+    naive_posterior_gp: pn.randprocs.GaussianProcess,
+    Xs_test: np.ndarray,
+):
+    np.testing.assert_allclose(
+        posterior_gp.var(Xs_test),
+        naive_posterior_gp(Xs_test).var,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        posterior_gp.cov.jax(Xs_test, None),
+        naive_posterior_gp(Xs_test).var,
+        atol=1e-12,
+    )
+
+
+def test_posterior_gp_memory_budget(
+    posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
+    prior: pn.randprocs.GaussianProcess,
+    Xs_batched: tuple[np.ndarray],
+    Ys_batched: tuple[np.ndarray],
+    Y_errs_batched: tuple[pn.randvars.Normal],
+    Xs_test: np.ndarray,
+):
+    chunked_posterior_gp = prior.condition_on_observations(
+        Ys_batched[0], Xs_batched[0], b=Y_errs_batched[0], memory_budget=256
+    )
+
+    for X, Y, Y_err in zip(Xs_batched[1:], Ys_batched[1:], Y_errs_batched[1:]):
+        chunked_posterior_gp = chunked_posterior_gp.condition_on_observations(
+            Y, X, b=Y_err
+        )
+
+    assert chunked_posterior_gp.memory_budget == 256
+
+    chunked_X_test = chunked_posterior_gp(Xs_test)
+    X_test = posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(chunked_X_test.mean, X_test.mean)
+    np.testing.assert_allclose(chunked_X_test.var, X_test.var)
+    np.testing.assert_allclose(chunked_X_test.cov, X_test.cov)
+
+
+def test_posterior_gp_iterative_solver(
+    prior: pn.randprocs.GaussianProcess,
+    Xs: np.ndarray,
+    Ys: np.ndarray,
+    Ys_err: pn.randvars.Normal,
+    naive_posterior_gp: pn.randprocs.GaussianProcess,
+    Xs_test: np.ndarray,
+):
+    solver = linpde_gp.linalg.solvers.LowRankCG(
+        stopping_criteria=(
+            linpde_gp.linalg.solvers.stopping_criteria.MaxIterations(Xs.shape[0]),
+            linpde_gp.linalg.solvers.stopping_criteria.ResidualNorm(
+                atol=1e-12, rtol=1e-12
+            ),
+        )
+    )
+
+    iter_posterior_gp = prior.condition_on_observations(
+        Ys, Xs, b=Ys_err, solver=solver
+    )
+
+    assert iter_posterior_gp.solver is solver
+    assert iter_posterior_gp.gram_inv_factor.shape[0] == Xs.shape[0]
+
+    iter_X_test = iter_posterior_gp(Xs_test)
+    naive_X_test = naive_posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(iter_X_test.mean, naive_X_test.mean, atol=1e-8)
+
+    # The low-rank approximation of the inverse Gram matrix can only overestimate
+    # the posterior variance
+    assert np.all(iter_posterior_gp.var(Xs_test) >= naive_X_test.var - 1e-10)
+
+    np.testing.assert_allclose(
+        iter_posterior_gp.cov.jax(Xs_test, None),
+        iter_posterior_gp.var(Xs_test),
+    )
+
+
+def test_posterior_gp_iterative_solver_without_low_rank_inverse(
+    prior: pn.randprocs.GaussianProcess,
+    Xs: np.ndarray,
+    Ys: np.ndarray,
+    Ys_err: pn.randvars.Normal,
+):
+    N = Xs.shape[0]
+
+    bayescg = linpde_gp.linalg.solvers.BayesCG(
+        prior=linpde_gp.linalg.solvers.beliefs.BayesCGBelief(
+            mean=np.zeros(N), cov_unscaled=pn.linops.Identity(N)
+        ),
+        stopping_criteria=(
+            linpde_gp.linalg.solvers.stopping_criteria.MaxIterations(N),
+        ),
+    )
+
+    with pytest.raises(TypeError):
+        prior.condition_on_observations(Ys, Xs, b=Ys_err, solver=bayescg)
+
+    with pytest.raises(TypeError):
+        prior.condition_on_observations(
+            Ys,
+            Xs,
+            b=Ys_err,
+            solver=linpde_gp.linalg.solvers.ConjugateGradients(),
+        )
+
+
+def test_posterior_gp_iterative_solver_toeplitz(
+    prior: pn.randprocs.GaussianProcess,
+    Xs: np.ndarray,
+    Ys: np.ndarray,
+    Xs_test: np.ndarray,
+):
+    noise = pn.randvars.Normal(np.zeros_like(Ys), 0.1**2 * np.eye(Ys.shape[0]))
+
+    solver = linpde_gp.linalg.solvers.LowRankCG(
+        stopping_criteria=(
+            linpde_gp.linalg.solvers.stopping_criteria.MaxIterations(Xs.shape[0]),
+            linpde_gp.linalg.solvers.stopping_criteria.ResidualNorm(
+                atol=1e-12, rtol=1e-12
+            ),
+        )
+    )
+
+    iter_posterior_gp = prior.condition_on_observations(
+        Ys, Xs, b=noise, solver=solver
+    )
+
+    # The observations lie on a uniform grid and the kernel is stationary
+    assert isinstance(iter_posterior_gp.gram_linop, linpde_gp.linops.SymmetricToeplitz)
+
+    np.testing.assert_allclose(
+        iter_posterior_gp(Xs_test).mean,
+        condition_gp_on_observations(prior, Xs, Ys, noise=noise)(Xs_test).mean,
+        atol=1e-8,
+    )
+
+
+def test_posterior_gp_toeplitz():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(1,)),
+        cov=1.5**2 * linpde_gp.randprocs.kernels.Matern(input_shape=(1,), p=2),
+    )
+
+    X = np.linspace(0.0, 10.0, 1024)[:, None]
+    Y = np.sin(X[:, 0])
+    noise = pn.randvars.Normal(np.zeros_like(Y), 0.1**2 * np.eye(Y.size))
+
+    posterior_gp = prior.condition_on_observations(Y, X, b=noise)
+
+    # The observations lie on a uniform grid and the kernel is stationary, so the
+    # linear systems with the Gram matrix are solved by the Levinson recursion
+    assert isinstance(posterior_gp.gram_linop, linpde_gp.linops.SymmetricToeplitz)
+    assert posterior_gp.gram_inv is not None
+    assert posterior_gp.gram_inv_factor is None
+
+    Xs_test = np.linspace(-1.0, 11.0, 13)[:, None]
+
+    naive_posterior_gp = condition_gp_on_observations(prior, X, Y, noise=noise)
+
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).mean,
+        naive_posterior_gp(Xs_test).mean,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).cov,
+        naive_posterior_gp(Xs_test).cov,
+        atol=1e-10,
+    )
+
+    # The Gram matrix is never densified
+    assert "gram" not in posterior_gp.__dict__
+
+    # Small Gram matrices are factorized densely
+    X_small = X[::8]
+    Y_small = Y[::8]
+
+    small_posterior_gp = prior.condition_on_observations(
+        Y_small,
+        X_small,
+        b=pn.randvars.Normal(np.zeros_like(Y_small), 0.1**2 * np.eye(Y_small.size)),
+    )
+
+    assert small_posterior_gp.gram_inv is None
+    assert not isinstance(
+        small_posterior_gp.gram_linop, linpde_gp.linops.SymmetricToeplitz
+    )
+
+
+def test_posterior_gp_kronecker():
+    domain = linpde_gp.domains.Box([[-1.0, 1.0], [0.0, 2.0]])
+
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=1.5**2
+        * linpde_gp.randprocs.kernels.ProductMatern(
+            input_shape=(2,),
+            lengthscales=[0.4, 0.7],
+        ),
+    )
+
+    X = domain.uniform_grid((6, 5))
+    Y = np.sin(np.pi * X[..., 0]) * np.cos(X[..., 1])
+    N = Y.size
+
+    posterior_gp = prior.condition_on_observations(
+        Y,
+        X,
+        b=pn.randvars.Normal(np.zeros_like(Y), 0.1**2 * np.eye(N)),
+    )
+
+    # The observations lie on a tensor grid and the kernel is a product kernel
+    assert isinstance(posterior_gp.gram_linop, linpde_gp.linops.KroneckerProduct)
+
+    Xs_test = domain.uniform_grid((7, 9), inset=0.05).reshape((-1, 2))
+
+    naive_posterior_gp = condition_gp_on_observations(
+        prior,
+        X.reshape((N, 2)),
+        Y.reshape((N,)),
+        noise=pn.randvars.Normal(np.zeros(N), 0.1**2 * np.eye(N)),
+    )
+
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).mean,
+        naive_posterior_gp(Xs_test).mean,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).cov,
+        naive_posterior_gp(Xs_test).cov,
+        atol=1e-10,
+    )
+
+
+def test_posterior_gp_sparse_l2_projection():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=()),
+        cov=linpde_gp.randprocs.kernels.Matern(input_shape=(), p=2, lengthscale=0.01),
+    )
+
+    basis = linpde_gp.functions.bases.UnivariateLinearInterpolationBasis(
+        np.linspace(0.0, 1.0, 200), zero_boundary=False
+    )
+
+    Y = np.sin(2 * np.pi * basis.x_i) * (basis.x_ip1 - basis.x_im1) / 2
+    noise = pn.randvars.Normal(np.zeros_like(Y), 1e-6 * np.eye(Y.size))
+
+    posterior_gp = prior.condition_on_observations(
+        Y,
+        L=basis.l2_projection(normalized=False, sparse_drop_tol=1e-12),
+        b=noise,
+    )
+
+    # The Gram matrix of the compactly supported hat functions is effectively banded
+    assert isinstance(posterior_gp.gram_linop, linpde_gp.linops.SymmetricBanded)
+    assert posterior_gp.gram_linop.bandwidth < len(basis) // 4
+
+    dense_posterior_gp = prior.condition_on_observations(
+        Y,
+        L=basis.l2_projection(normalized=False),
+        b=noise,
+    )
+
+    xs_test = np.linspace(0.0, 1.0, 37)
+
+    np.testing.assert_allclose(
+        posterior_gp(xs_test).mean,
+        dense_posterior_gp(xs_test).mean,
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        posterior_gp(xs_test).cov,
+        dense_posterior_gp(xs_test).cov,
+        atol=1e-8,
+    )
+
+
+@pytest.mark.parametrize("output_scale", [None, 2.0])
+def test_posterior_gp_wendland_sparse(output_scale: Optional[float]):
+    domain = linpde_gp.domains.Box([[-1.0, 1.0], [0.0, 2.0]])
+
+    cov = linpde_gp.randprocs.kernels.Wendland(
+        input_shape=(2,), k=2, support_radius=0.5
+    )
+
+    if output_scale is not None:
+        # A `JaxScaledKernel`, which must also yield a sparse Gram matrix
+        cov = output_scale**2 * cov
+
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=cov,
+    )
+
+    X = np.random.default_rng(2378).uniform(
+        domain.bounds[:, 0], domain.bounds[:, 1], size=(200, 2)
+    )
+    Y = np.sin(np.pi * X[:, 0]) * np.cos(X[:, 1])
+    N = Y.size
+
+    posterior_gp = prior.condition_on_observations(
+        Y,
+        X,
+        b=pn.randvars.Normal(np.zeros_like(Y), 0.1**2 * np.eye(N)),
+    )
+
+    # The kernel is compactly supported, so most entries of the Gram matrix vanish
+    assert isinstance(posterior_gp.gram_linop, linpde_gp.linops.SymmetricSparse)
+    assert posterior_gp.gram_linop.A.nnz < N**2 // 4
+
+    Xs_test = domain.uniform_grid((7, 9), inset=0.05).reshape((-1, 2))
+
+    naive_posterior_gp = condition_gp_on_observations(
+        prior,
+        X,
+        Y,
+        noise=pn.randvars.Normal(np.zeros(N), 0.1**2 * np.eye(N)),
+    )
+
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).mean,
+        naive_posterior_gp(Xs_test).mean,
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        posterior_gp(Xs_test).cov,
+        naive_posterior_gp(Xs_test).cov,
+        atol=1e-10,
+    )
+
+
+def test_posterior_gp_wendland_sparse_joint_observations_bvp():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=linpde_gp.randprocs.kernels.Wendland(
+            input_shape=(2,), k=3, support_radius=0.8
+        ),
+    )
+
+    laplacian = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,))
+
+    X_interior = linpde_gp.domains.Box([[-0.8, 0.8], [-0.8, 0.8]]).uniform_grid((8, 8))
+    X_boundary = np.stack(
+        (np.linspace(-1.0, 1.0, 15), np.ones(15)),
+        axis=-1,
+    )
+
+    Y_interior = -np.ones(X_interior.shape[:-1])
+    Y_boundary = np.zeros(X_boundary.shape[:-1])
+
+    joint_posterior_gp = (
+        linpde_gp.randprocs.ConditionalGaussianProcess.from_joint_observations(
+            prior,
+            (Y_interior, Y_boundary),
+            (X_interior, X_boundary),
+            Ls=(laplacian, None),
+        )
+    )
+
+    # The joint Gram matrix is sparse and factorized as a whole
+    assert joint_posterior_gp.gram_inv_factor is not None
+
+    posterior_gp = prior.condition_on_observations(
+        Y_interior, X_interior, L=laplacian
+    ).condition_on_observations(Y_boundary, X_boundary)
+
+    np.testing.assert_allclose(joint_posterior_gp.gram, posterior_gp.gram)
+
+    Xs_test = linpde_gp.domains.Box([[-1.0, 1.0], [-1.0, 1.0]]).uniform_grid((5, 5))
+
+    joint_X_test = joint_posterior_gp(Xs_test)
+    X_test = posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(joint_X_test.mean, X_test.mean, atol=1e-8)
+    np.testing.assert_allclose(joint_X_test.cov, X_test.cov, atol=1e-8)
+
+def test_posterior_gp_ski():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(1,)),
+        cov=linpde_gp.randprocs.kernels.SKIKernel(
+            2.0**2 * linpde_gp.randprocs.kernels.ExpQuad((1,), lengthscales=0.25),
+            grids=np.linspace(-1.0, 1.0, 100),
+        ),
+    )
+
+    X = np.random.default_rng(4598).uniform(-1.0, 1.0, size=(40, 1))
+    Y = 2.0 * np.sin(np.pi * X[:, 0])
+    noise = pn.randvars.Normal(np.zeros_like(Y), 0.1**2 * np.eye(Y.shape[0]))
+
+    solver = linpde_gp.linalg.solvers.LowRankCG(
+        stopping_criteria=(
+            linpde_gp.linalg.solvers.stopping_criteria.MaxIterations(X.shape[0]),
+            linpde_gp.linalg.solvers.stopping_criteria.ResidualNorm(
+                atol=1e-12, rtol=1e-12
+            ),
+        )
+    )
+
+    iter_posterior_gp = prior.condition_on_observations(Y, X, b=noise, solver=solver)
+    posterior_gp = prior.condition_on_observations(Y, X, b=noise)
+
+    np.testing.assert_allclose(
+        iter_posterior_gp.gram_linop.todense(), posterior_gp.gram, atol=1e-12
+    )
+
+    Xs_test = np.linspace(-1.0, 1.0, 50)[:, None]
+
+    np.testing.assert_allclose(
+        iter_posterior_gp(Xs_test).mean,
+        posterior_gp(Xs_test).mean,
+        atol=1e-8,
+    )
+
+
+def test_posterior_gp_sample_pathwise(
+    posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
+    Xs_test: np.ndarray,
+):
+    Xs_test = Xs_test[::10]
+
+    samples = posterior_gp.sample_pathwise(
+        np.random.default_rng(2351), Xs_test, size=20000
+    )
+
+    assert samples.shape == (20000, Xs_test.shape[0])
+
+    X_test = posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(samples.mean(axis=0), X_test.mean, atol=0.05)
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), X_test.cov, atol=0.05)
+
+
+def test_posterior_gp_sample_pathwise_prior_paths(
+    posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
+    prior: pn.randprocs.GaussianProcess,
+    input_shape: ShapeType,
+    Xs_test: np.ndarray,
+):
+    Xs_test = Xs_test[::10]
+
+    rng = np.random.default_rng(2351)
+
+    def prior_path() -> linpde_gp.functions.JaxFunction:
+        # Independent random Fourier features for every path, such that the sample
+        # moments are unbiased
+        features = linpde_gp.randprocs.kernels.random_fourier_features(
+            prior.cov, 128, rng
+        )
+        weights = rng.standard_normal(features.num_features)
+
+        return linpde_gp.functions.JaxLambdaFunction(
+            lambda x: features.jax(x) @ weights,
+            input_shape=input_shape,
+            vectorize=False,
+        )
+
+    prior_paths = [prior_path() for _ in range(1000)]
+
+    samples = posterior_gp.sample_pathwise(rng, Xs_test, prior_paths=prior_paths)
+
+    assert samples.shape == (1000, Xs_test.shape[0])
+
+    X_test = posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(samples.mean(axis=0), X_test.mean, atol=0.05)
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), X_test.cov, atol=0.05)
+
+
+@pytest.mark.parametrize("block_index", [0, 1, -1])
+def test_posterior_gp_remove_observations(
+    posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
+    prior: pn.randprocs.GaussianProcess,
+    Xs_batched: tuple[np.ndarray],
+    Ys_batched: tuple[np.ndarray],
+    Y_errs_batched: tuple[pn.randvars.Normal],
+    Xs_test: np.ndarray,
+    block_index: int,
+):
+    reduced_posterior_gp = prior
+    block_indices = list(range(len(Xs_batched)))
+
+    del block_indices[block_index]
+
+    for i in block_indices:
+        reduced_posterior_gp = reduced_posterior_gp.condition_on_observations(
+            Ys_batched[i], Xs_batched[i], b=Y_errs_batched[i]
+        )
+
+    downdated_X_test = posterior_gp.remove_observations(block_index)(Xs_test)
+    X_test = reduced_posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(downdated_X_test.mean, X_test.mean)
+    np.testing.assert_allclose(downdated_X_test.cov, X_test.cov, atol=1e-12)
+
+
+def test_posterior_gp_sliding_window(
+    prior: pn.randprocs.GaussianProcess,
+    Xs_batched: tuple[np.ndarray],
+    Ys_batched: tuple[np.ndarray],
+    Y_errs_batched: tuple[pn.randvars.Normal],
+    Xs_test: np.ndarray,
+):
+    windowed_posterior_gp = prior.condition_on_observations(
+        Ys_batched[0], Xs_batched[0], b=Y_errs_batched[0], max_blocks=2
+    )
+
+    for X, Y, Y_err in zip(Xs_batched[1:], Ys_batched[1:], Y_errs_batched[1:]):
+        windowed_posterior_gp = windowed_posterior_gp.condition_on_observations(
+            Y, X, b=Y_err
+        )
+
+    reduced_posterior_gp = prior
+
+    for X, Y, Y_err in zip(Xs_batched[-2:], Ys_batched[-2:], Y_errs_batched[-2:]):
+        reduced_posterior_gp = reduced_posterior_gp.condition_on_observations(
+            Y, X, b=Y_err
+        )
+
+    windowed_X_test = windowed_posterior_gp(Xs_test)
+    X_test = reduced_posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(windowed_X_test.mean, X_test.mean)
+    np.testing.assert_allclose(windowed_X_test.cov, X_test.cov, atol=1e-12)
+
+
+def test_posterior_gp_sliding_window_single_block(
+    prior: pn.randprocs.GaussianProcess,
+    Xs_batched: tuple[np.ndarray],
+    Ys_batched: tuple[np.ndarray],
+    Y_errs_batched: tuple[pn.randvars.Normal],
+    Xs_test: np.ndarray,
+):
+    windowed_posterior_gp = prior.condition_on_observations(
+        Ys_batched[0],
+        Xs_batched[0],
+        b=Y_errs_batched[0],
+        memory_budget=256,
+        max_blocks=1,
+    )
+
+    for X, Y, Y_err in zip(Xs_batched[1:], Ys_batched[1:], Y_errs_batched[1:]):
+        windowed_posterior_gp = windowed_posterior_gp.condition_on_observations(
+            Y, X, b=Y_err
+        )
+
+        assert isinstance(
+            windowed_posterior_gp, linpde_gp.randprocs.ConditionalGaussianProcess
+        )
+        assert windowed_posterior_gp.max_blocks == 1
+        assert windowed_posterior_gp.memory_budget == 256
+        assert windowed_posterior_gp.gram.shape == (X.shape[0], X.shape[0])
+
+    windowed_X_test = windowed_posterior_gp(Xs_test)
+    X_test = prior.condition_on_observations(
+        Ys_batched[-1], Xs_batched[-1], b=Y_errs_batched[-1]
+    )(Xs_test)
+
+    np.testing.assert_allclose(windowed_X_test.mean, X_test.mean)
+    np.testing.assert_allclose(windowed_X_test.cov, X_test.cov, atol=1e-12)
+
+
+def test_posterior_gp_stacked_observations(
+    prior: pn.randprocs.GaussianProcess,
+    Xs: np.ndarray,
+    Ys: np.ndarray,
+    Ys_err: pn.randvars.Normal,
+    Xs_test: np.ndarray,
+):
+    Ys_stacked = np.stack((Ys, -Ys, 0.5 * Ys + 1.0))
+
+    posterior_gps = (
+        linpde_gp.randprocs.ConditionalGaussianProcess.from_stacked_observations(
+            prior, Ys_stacked, Xs, b=Ys_err
+        )
+    )
+
+    assert len(posterior_gps) == Ys_stacked.shape[0]
+
+    for posterior_gp_k, Ys_k in zip(posterior_gps, Ys_stacked):
+        assert posterior_gp_k.gram_cho is posterior_gps[0].gram_cho
+
+        X_test_k = posterior_gp_k(Xs_test)
+        naive_X_test_k = condition_gp_on_observations(prior, Xs, Ys_k, noise=Ys_err)(
+            Xs_test
+        )
+
+        np.testing.assert_allclose(X_test_k.mean, naive_X_test_k.mean)
+        np.testing.assert_allclose(X_test_k.cov, naive_X_test_k.cov)
+
+
+def test_posterior_gp_joint_observations(
+    prior: pn.randprocs.GaussianProcess,
+    Xs_batched: tuple[np.ndarray],
+    Ys_batched: tuple[np.ndarray],
+    Y_errs_batched: tuple[pn.randvars.Normal],
+    naive_posterior_gp: pn.randprocs.GaussianProcess,
+    Xs_test: np.ndarray,
+):
+    joint_posterior_gp = (
+        linpde_gp.randprocs.ConditionalGaussianProcess.from_joint_observations(
+            prior, Ys_batched, Xs_batched, bs=Y_errs_batched
+        )
+    )
+
+    joint_X_test = joint_posterior_gp(Xs_test)
+    naive_X_test = naive_posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(joint_X_test.mean, naive_X_test.mean)
+    np.testing.assert_allclose(joint_X_test.cov, naive_X_test.cov, atol=1e-12)
+
+
+def test_posterior_gp_joint_observations_bvp():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=linpde_gp.randprocs.kernels.ProductMatern(
+            input_shape=(2,),
+            lengthscales=[0.6, 0.8],
+        ),
+    )
+
+    laplacian = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,))
+
+    X_interior = linpde_gp.domains.Box([[-0.8, 0.8], [-0.8, 0.8]]).uniform_grid(
+        (4, 4)
+    )
+    X_boundary = np.stack(
+        (np.linspace(-1.0, 1.0, 7), np.ones(7)),
+        axis=-1,
+    )
+
+    Y_interior = -np.ones(X_interior.shape[:-1])
+    Y_boundary = np.zeros(X_boundary.shape[:-1])
+
+    joint_posterior_gp = (
+        linpde_gp.randprocs.ConditionalGaussianProcess.from_joint_observations(
+            prior,
+            (Y_interior, Y_boundary),
+            (X_interior, X_boundary),
+            Ls=(laplacian, None),
+        )
+    )
+
+    posterior_gp = prior.condition_on_observations(
+        Y_interior, X_interior, L=laplacian
+    ).condition_on_observations(Y_boundary, X_boundary)
+
+    np.testing.assert_allclose(joint_posterior_gp.gram, posterior_gp.gram)
+
+    Xs_test = linpde_gp.domains.Box([[-1.0, 1.0], [-1.0, 1.0]]).uniform_grid((5, 5))
+
+    joint_X_test = joint_posterior_gp(Xs_test)
+    X_test = posterior_gp(Xs_test)
+
+    np.testing.assert_allclose(joint_X_test.mean, X_test.mean)
+    np.testing.assert_allclose(joint_X_test.cov, X_test.cov, atol=1e-10)
+
+
+def test_posterior_gp_joint_observations_bvp_distance_cache():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=0.6),
+    )
+
+    laplacian = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,))
+
+    X_interior = linpde_gp.domains.Box([[-0.8, 0.8], [-0.8, 0.8]]).uniform_grid(
+        (4, 4)
+    )
+    X_boundary = np.stack(
+        (np.linspace(-1.0, 1.0, 7), np.ones(7)),
+        axis=-1,
+    )
+
+    Y_interior = -np.ones(X_interior.shape[:-1])
+    Y_boundary = np.zeros(X_boundary.shape[:-1])
+
+    cache = linpde_gp.randprocs.kernels.distance_cache
+
+    hits = cache.hits
+
+    joint_posterior_gp = (
+        linpde_gp.randprocs.ConditionalGaussianProcess.from_joint_observations(
+            prior,
+            (Y_interior, Y_boundary),
+            (X_interior, X_boundary),
+            Ls=(laplacian, None),
+        )
+    )
+
+    # The derivative kernels in the interior blocks reuse the cached differences
+    assert cache.hits > hits
+    assert len(cache) == 0
+
+    posterior_gp = prior.condition_on_observations(
+        Y_interior, X_interior, L=laplacian
+    ).condition_on_observations(Y_boundary, X_boundary)
+
+    np.testing.assert_allclose(joint_posterior_gp.gram, posterior_gp.gram)
+
+
+def test_posterior_gp_condition_on_observations_distance_cache():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=0.6),
+    )
+
+    laplacian = linpde_gp.linfuncops.diffops.Laplacian(domain_shape=(2,))
+
+    X_interior = linpde_gp.domains.Box([[-0.8, 0.8], [-0.8, 0.8]]).uniform_grid(
+        (4, 4)
+    )
+    X_boundary = np.stack(
+        (np.linspace(-1.0, 1.0, 7), np.ones(7)),
+        axis=-1,
+    )
+
+    cache = linpde_gp.randprocs.kernels.distance_cache
+
+    hits = cache.hits
+
+    posterior_gp = prior.condition_on_observations(
+        -np.ones(X_interior.shape[:-1]), X_interior, L=laplacian
+    )
+
+    # The Gram matrix reuses the cached differences of its inputs
+    assert cache.hits > hits
+    assert len(cache) == 0
+
+    hits = cache.hits
+
+    posterior_gp = posterior_gp.condition_on_observations(
+        np.zeros(X_boundary.shape[:-1]), X_boundary
+    )
+
+    # The cross-covariances with the interior observations reuse them as well
+    assert cache.hits > hits
+    assert len(cache) == 0
+
+    assert isinstance(posterior_gp, linpde_gp.randprocs.ConditionalGaussianProcess)
+
+
 def test_posterior_gp_linop(
     posterior_gp: linpde_gp.randprocs.ConditionalGaussianProcess,
     L: linpde_gp.linfuncops.LinearFunctionOperator,
@@ -0,0 +1,136 @@
+import jax
+from jax import numpy as jnp
+import numpy as np
+import probnum as pn
+
+import linpde_gp
+from linpde_gp._pytree import JaxPyTreeMixin
+
+jax.config.update("jax_enable_x64", True)
+
+
+def test_kernel_leaves():
+    k = linpde_gp.randprocs.kernels.ExpQuad(
+        input_shape=(2,), lengthscales=np.array([0.5, 2.0])
+    )
+
+    leaves, treedef = jax.tree_util.tree_flatten(k)
+
+    assert any(leaf is k.lengthscales for leaf in leaves)
+
+    k_unflattened = jax.tree_util.tree_unflatten(treedef, leaves)
+
+    assert isinstance(k_unflattened, linpde_gp.randprocs.kernels.ExpQuad)
+    assert k_unflattened.input_shape == k.input_shape
+
+
+def test_compiled_code_reused_across_hyperparameters():
+    xs = jnp.asarray(np.random.default_rng(4389).standard_normal((7, 2)))
+
+    jitted = jax.jit(lambda k, x0, x1: k.jax(x0, x1))
+
+    for lengthscale in (0.5, 1.0, 2.0):
+        k = linpde_gp.randprocs.kernels.Matern(
+            input_shape=(2,), p=3, lengthscale=lengthscale
+        )
+
+        np.testing.assert_allclose(
+            jitted(k, xs[:, None], xs[None, :]),
+            k(xs[:, None], xs[None, :]),
+            rtol=1e-12,
+        )
+
+    assert jitted._cache_size() == 1  # pylint: disable=protected-access
+
+
+def test_gradient_wrt_hyperparameters():
+    k = linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=1.0)
+
+    x0 = jnp.zeros(2)
+    x1 = jnp.ones(2)
+
+    def k_x0_x1(lengthscale):
+        return jax.tree_util.tree_map(lambda leaf: lengthscale * leaf, k).jax(x0, x1)
+
+    h = 1e-6
+
+    np.testing.assert_allclose(
+        jax.grad(k_x0_x1)(1.5),
+        (k_x0_x1(1.5 + h) - k_x0_x1(1.5 - h)) / (2 * h),
+        rtol=1e-6,
+    )
+
+
+def test_dirac_functional_leaves():
+    X = np.random.default_rng(2384).uniform(-1.0, 1.0, size=(5, 2))
+
+    dirac = linpde_gp.linfunctls.DiracFunctional(
+        input_domain_shape=(2,), input_codomain_shape=(), X=X
+    )
+
+    leaves, _ = jax.tree_util.tree_flatten(dirac)
+
+    assert any(leaf is dirac.X for leaf in leaves)
+
+
+def test_compiled_posterior_reused_across_conditioning_steps():
+    prior = pn.randprocs.GaussianProcess(
+        mean=linpde_gp.functions.Zero(input_shape=(2,)),
+        cov=linpde_gp.randprocs.kernels.ExpQuad(input_shape=(2,), lengthscales=0.5),
+    )
+
+    rng = np.random.default_rng(8923)
+
+    xs = jnp.asarray(rng.uniform(-1.0, 1.0, size=(7, 2)))
+
+    jitted_mean = jax.jit(lambda m, x: m.jax(x))
+    jitted_cov = jax.jit(lambda k, x0, x1: k.jax(x0, x1))
+
+    def observations() -> tuple[np.ndarray, np.ndarray]:
+        X = rng.uniform(-1.0, 1.0, size=(10, 2))
+
+        return np.sin(np.pi * X[:, 0]) * np.cos(np.pi * X[:, 1]), X
+
+    # With a window of a single block, all posteriors share the same structure
+    posterior = linpde_gp.randprocs.ConditionalGaussianProcess.from_observations(
+        prior, *observations(), max_blocks=1
+    )
+
+    for step in range(2):
+        if step > 0:
+            posterior = posterior.condition_on_observations(*observations())
+
+        np.testing.assert_allclose(
+            jitted_mean(posterior.mean, xs), posterior.mean(xs), rtol=1e-10
+        )
+        np.testing.assert_allclose(
+            jitted_cov(posterior.cov, xs[:, None], xs[None, :]),
+            posterior.cov(xs[:, None], xs[None, :]),
+            atol=1e-10,
+        )
+
+    assert jitted_mean._cache_size() == 1  # pylint: disable=protected-access
+    assert jitted_cov._cache_size() == 1  # pylint: disable=protected-access
+
+
+class _IndexedSum(JaxPyTreeMixin):
+    def __init__(self, indices: np.ndarray):
+        self.indices = indices
+
+    def __call__(self, x: jnp.ndarray) -> jnp.ndarray:
+        return jnp.sum(x[self.indices])
+
+
+def test_static_arrays_compared_by_contents():
+    x = jnp.arange(5.0)
+
+    jitted = jax.jit(lambda f, x: f(x))
+
+    # Equal, but distinct index arrays reuse the compiled code
+    for _ in range(3):
+        assert jitted(_IndexedSum(np.array([0, 2, 4])), x) == 6.0
+
+    assert jitted._cache_size() == 1  # pylint: disable=protected-access
+
+    assert jitted(_IndexedSum(np.array([1, 3])), x) == 4.0
+    assert jitted._cache_size() == 2  # pylint: disable=protected-access